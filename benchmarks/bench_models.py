@@ -0,0 +1,99 @@
+"""
+Compare building the client's models with Model(**item) and with the compiled constructors of soundchartspy.models.
+
+Model(**item) raises TypeError on items with fields the model does not have, so the constructors are also compared
+with keyword construction from items filtered down to the model's fields, which is what tolerating them takes. When
+every field is present the compiled constructors pass them positionally, so they should be at least as fast as
+Model(**item) while also tolerating new fields.
+
+Run from the repository root with: python -m benchmarks.bench_models [--items 100000]
+"""
+import argparse
+import dataclasses
+import timeit
+
+from soundchartspy.data import AudienceData, Playlist, PlaylistPosition, RadioStation
+from soundchartspy.models import constructor
+
+ITEMS: dict[type, dict] = {
+    AudienceData: {
+        "date": "2023-01-01T00:00:00+00:00",
+        "likeCount": 1200,
+        "followerCount": 35000,
+        "followingCount": 120,
+        "postCount": 310,
+        "viewCount": None,
+    },
+    Playlist: {
+        "uuid": "0b8d1a26-7f0b-11e9-8a4f-549f35161576",
+        "name": "Today's Top Hits",
+        "identifier": "37i9dQZF1DXcBWIGoYBM5M",
+        "platform": "spotify",
+        "countryCode": "GLOBAL",
+        "latestCrawlDate": "2023-01-01T00:00:00+00:00",
+        "latestTrackCount": 50,
+        "latestSubscriberCount": 34000000,
+        "type": "editorial",
+    },
+    PlaylistPosition: {
+        "position": 3,
+        "peakPosition": 1,
+        "entryDate": "2022-12-01T00:00:00+00:00",
+        "positionDate": "2023-01-01T00:00:00+00:00",
+        "peakPositionDate": "2022-12-10T00:00:00+00:00",
+    },
+    RadioStation: {
+        "slug": "bbc-radio-1",
+        "name": "BBC Radio 1",
+        "cityName": "London",
+        "countryCode": "GB",
+        "countryName": "United Kingdom",
+        "timeZone": "Europe/London",
+    },
+}
+
+
+# Fields the API could add, which Model(**item) rejects
+NEW_FIELDS: dict = {"images": [], "owner": {"name": "Owner"}, "createdAt": "2023-01-01T00:00:00+00:00"}
+
+
+def _best(call, repeat: int) -> float:
+    return min(timeit.repeat(call, number=1, repeat=repeat))
+
+
+def bench(model: type, item: dict, number: int, repeat: int = 5) -> dict[str, float]:
+    """The best throughput, in items per second, of each way of building a model from items like item."""
+    items: list[dict] = [dict(item) for _ in range(number)]
+    extended: list[dict] = [{**item, **NEW_FIELDS} for _ in range(number)]
+    known: frozenset = frozenset(field.name for field in dataclasses.fields(model))
+    construct = constructor(model)
+
+    def keywords(data: list[dict]) -> list:
+        return [model(**entry) for entry in data]
+
+    def filtered_keywords(data: list[dict]) -> list:
+        # The usual way to tolerate new fields with keyword construction
+        return [model(**{key: value for key, value in entry.items() if key in known}) for entry in data]
+
+    return {
+        "Model(**item)": number / _best(lambda: keywords(items), repeat),
+        "filtered **item": number / _best(lambda: filtered_keywords(extended), repeat),
+        "compiled": number / _best(lambda: list(map(construct, items)), repeat),
+        "compiled, new fields": number / _best(lambda: list(map(construct, extended)), repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="items built per run")
+    args = parser.parse_args()
+
+    columns: list[str] = ["Model(**item)", "filtered **item", "compiled", "compiled, new fields"]
+    print(f"{'model':<18}" + "".join(f"{column:>22}" for column in columns))
+    for model, item in ITEMS.items():
+        throughput: dict[str, float] = bench(model, item, args.items)
+        print(f"{model.__name__:<18}" + "".join(f"{throughput[column]:>20,.0f}/s" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import datetime
+from array import array
+from typing import Iterable, Optional
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.data import RadioStation
+from soundchartspy.models import constructor
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for broadcast aggregation
+    np = None
+
+# What broadcasts can be counted by
+STATION = "station"
+COUNTRY = "country"
+DAY = "day"
+HOUR = "hour"
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Broadcast aggregation requires numpy, install it with 'pip install soundchartspy[analytics]'"
+        )
+
+
+def _timestamp(value) -> int:
+    # Seconds since the epoch of an ATOM date such as '2019-01-01T00:00:00+00:00', UTC if it has no offset
+    aired_at = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if aired_at.tzinfo is None:
+        aired_at = aired_at.replace(tzinfo=datetime.timezone.utc)
+    return int((aired_at - _EPOCH).total_seconds())
+
+
+class Broadcasts:
+    """
+    The radio broadcasts of a song, from one fetch of the broadcasts endpoint, with both views the client offers
+    (every spin, and spin counts by station) and vectorized aggregates.
+
+    Each station is built once, and each broadcast is kept as a station number, a UTC timestamp and a play count in
+    NumPy arrays. Counting by station, country, day or hour, or cross-tabulating two of them, takes one pass over
+    the arrays however many stations and days there are.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> broadcasts = fetch_broadcasts(soundcharts, "7d534228-5165-11e9-9375-549f35161576", radio_slugs=station_slugs, start_date="2023-01-01T00:00:00Z", end_date="2023-12-31T23:59:59Z")
+        >>> broadcasts.count("country")
+        >>> stations, days, spins = broadcasts.crosstab("station", "day")
+    """
+
+    def __init__(
+        self,
+        stations: list[RadioStation],
+        station_numbers: "np.ndarray",
+        aired_at: "np.ndarray",
+        play_counts: "np.ndarray",
+        items: Optional[list[dict]] = None,
+    ):
+        """
+        Args:
+            stations (list[RadioStation]): The stations, indexed by station number.
+            station_numbers (np.ndarray): The station number of each broadcast.
+            aired_at (np.ndarray): The time of each broadcast, in seconds since the epoch (UTC).
+            play_counts (np.ndarray): The number of plays of each broadcast, 1 unless the API reports a playCount.
+            items (list[dict], optional): The broadcasts as returned by the API, with RadioStation objects.
+        """
+        self.stations = stations
+        self.station_numbers = station_numbers
+        self.aired_at = aired_at
+        self.play_counts = play_counts
+        self._items = items
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict], keep_items: bool = True) -> "Broadcasts":
+        """
+        Build broadcasts from items as returned by SoundCharts.song_broadcasts, in a single pass. Items without a
+        radio cannot be counted by station and are left out.
+
+        Args:
+            items (Iterable[dict]): The broadcasts, e.g. from SoundCharts.paginate("song_broadcasts", ...).
+            keep_items (bool, optional): Keep the items for the spins view. Set to False to only keep the arrays
+                when aggregating long periods. Defaults to True.
+
+        Returns:
+            Broadcasts: The broadcasts.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        _require_numpy()
+        construct = constructor(RadioStation)
+        numbers: dict[str, int] = {}
+        stations: list[RadioStation] = []
+        station_numbers = array("i")
+        aired_at = array("q")
+        play_counts = array("q")
+        kept: Optional[list[dict]] = [] if keep_items else None
+
+        for item in items:
+            radio: Optional[dict] = item.get("radio")
+            if radio is None:
+                continue
+            number: Optional[int] = numbers.get(radio.get("slug"))
+            if number is None:
+                number = numbers[radio.get("slug")] = len(stations)
+                stations.append(construct(radio))
+            station_numbers.append(number)
+            aired_at.append(_timestamp(item.get("airedAt") or item.get("date")))
+            play_counts.append(item.get("playCount") or 1)
+            if kept is not None:
+                kept.append({**item, "radio": stations[number]})
+
+        return cls(
+            stations,
+            np.array(station_numbers, dtype=np.int32),
+            np.array(aired_at, dtype=np.int64),
+            np.array(play_counts, dtype=np.int64),
+            kept,
+        )
+
+    def __len__(self) -> int:
+        return len(self.station_numbers)
+
+    @property
+    def total(self) -> int:
+        """The total number of plays."""
+        return int(self.play_counts.sum())
+
+    def spins(self) -> list[dict[str, RadioStation | str]]:
+        """
+        Get every broadcast, as returned by SoundCharts.song_radio_spins.
+
+        Returns:
+            list[dict]: The broadcasts, with RadioStation objects.
+
+        Raises:
+            ValueError: If the broadcasts were built without keeping the items.
+        """
+        if self._items is None:
+            raise ValueError("the broadcasts were built with keep_items=False")
+        return self._items
+
+    def spin_counts(self) -> list[dict[str, RadioStation | int]]:
+        """
+        Get the number of plays on each station, in the form returned by SoundCharts.song_radio_spin_count.
+
+        Returns:
+            list[dict]: A {"playCount": int, "radio": RadioStation} dictionary for each station, most played first.
+        """
+        counts = np.bincount(self.station_numbers, weights=self.play_counts, minlength=len(self.stations))
+        return [
+            {"playCount": int(counts[number]), "radio": self.stations[number]}
+            for number in np.argsort(-counts, kind="stable")
+        ]
+
+    def _codes(self, by: str) -> tuple["np.ndarray", list]:
+        # The group of each broadcast and the label of each group
+        if by == STATION:
+            return self.station_numbers, [station.slug for station in self.stations]
+        if by == COUNTRY:
+            countries, station_countries = np.unique(
+                [station.countryCode or "" for station in self.stations], return_inverse=True
+            )
+            return station_countries.reshape(-1)[self.station_numbers], [str(country) for country in countries]
+        if by == DAY:
+            days, codes = np.unique(self.aired_at // 86400, return_inverse=True)
+            labels = [datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day)) for day in days]
+            return codes.reshape(-1), labels
+        if by == HOUR:
+            return (self.aired_at // 3600) % 24, list(range(24))
+        raise ValueError(f"Cannot count broadcasts by '{by}', use one of station, country, day or hour")
+
+    def count(self, by: str) -> dict:
+        """
+        Count plays by station, country, day or hour.
+
+        Args:
+            by (str): 'station' (counts keyed by slug), 'country' (by country code), 'day' (by UTC date) or 'hour'
+                (by UTC hour of the day, 0 to 23).
+
+        Returns:
+            dict: The number of plays for each group with any.
+        """
+        codes, labels = self._codes(by)
+        counts = np.bincount(codes, weights=self.play_counts, minlength=len(labels)).astype(np.int64)
+        return {label: int(count) for label, count in zip(labels, counts) if count}
+
+    def crosstab(self, rows: str, columns: str) -> tuple[list, list, "np.ndarray"]:
+        """
+        Count plays by two groupings at once, e.g. by station and day for an airplay report.
+
+        Args:
+            rows (str): The grouping of the rows: 'station', 'country', 'day' or 'hour'.
+            columns (str): The grouping of the columns.
+
+        Returns:
+            tuple[list, list, np.ndarray]: The row labels, the column labels and a rows x columns array of plays.
+        """
+        row_codes, row_labels = self._codes(rows)
+        column_codes, column_labels = self._codes(columns)
+        cells = row_codes.astype(np.int64) * len(column_labels) + column_codes
+        counts = np.bincount(cells, weights=self.play_counts, minlength=len(row_labels) * len(column_labels))
+        return row_labels, column_labels, counts.astype(np.int64).reshape(len(row_labels), len(column_labels))
+
+
+def fetch_broadcasts(
+    client: SoundCharts,
+    uuid: str,
+    radio_slugs: list[str],
+    country_code: str = None,
+    start_date: str = None,
+    end_date: str = None,
+    keep_items: bool = True,
+) -> Broadcasts:
+    """
+    Page through every broadcast of a song once, for both the spins and spin count views and any aggregate.
+
+    Args:
+        client (SoundCharts): The client used to make requests.
+        uuid (str): The UUID of the song.
+        radio_slugs (list[str]): A list of radio slugs.
+        country_code (str, optional): The country code.
+        start_date (str, optional): Period start date (Format ATOM). Example : 2019-01-01T00:00:00Z
+        end_date (str, optional): Period end date (Format ATOM). Example : 2019-01-01T00:00:00Z
+        keep_items (bool, optional): Keep the items for the spins view. Defaults to True.
+
+    Returns:
+        Broadcasts: The broadcasts.
+    """
+    _require_numpy()
+    items = client.paginate(
+        "song_broadcasts",
+        uuid,
+        radio_slugs=radio_slugs,
+        country_code=country_code,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return Broadcasts.from_items(items, keep_items=keep_items)
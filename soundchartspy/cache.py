@@ -0,0 +1,236 @@
+import calendar
+import datetime
+import json
+import math
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from soundchartspy.endpoints import ENTITY, HISTORY, IMMUTABLE, Endpoint
+from soundchartspy.exceptions import SoundChartsError
+
+DAY: float = 24 * 60 * 60
+
+
+class ResponseCache:
+    """
+    A cache of decoded API responses keyed by canonical request URL and stored in SQLite.
+
+    How long a response is kept depends on the cache policy declared for its endpoint in soundchartspy.endpoints:
+
+    * IMMUTABLE responses (e.g. an audience report for a given date) are kept indefinitely.
+    * ENTITY responses (song, artist and album metadata, platform identifiers) are kept for entity_ttl.
+    * HISTORY responses (date ranges) are kept indefinitely once the requested range is closed, that is it ended more
+      than history_settle_days ago, and are treated as VOLATILE otherwise.
+    * VOLATILE responses (current stats, latest listeners, current chart and playlist positions) are kept for volatile_ttl.
+
+    Not-found errors are cached too, for not_found_ttl, so lookups of unknown ISRCs or platform identifiers raise the
+    same SoundChartsError again without a request being made.
+
+    Example:
+        >>> cache = ResponseCache("soundcharts.sqlite", entity_ttl=30 * DAY, volatile_ttl=3600)
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        entity_ttl: float = 7 * DAY,
+        volatile_ttl: float = 3600,
+        history_settle_days: int = 2,
+        not_found_ttl: float = DAY,
+    ):
+        """
+        Args:
+            path (str, optional): The SQLite database file. Defaults to an in-memory database.
+            entity_ttl (float, optional): Seconds to keep entity metadata. Defaults to 7 days.
+            volatile_ttl (float, optional): Seconds to keep current/latest data. Defaults to 1 hour.
+            history_settle_days (int, optional): Days after which a date range is considered closed, since SoundCharts
+                may fill in the most recent days late. Defaults to 2.
+            not_found_ttl (float, optional): Seconds to keep not-found errors. Defaults to 1 day, 0 disables them.
+        """
+        self.entity_ttl = entity_ttl
+        self.volatile_ttl = volatile_ttl
+        self.history_settle_days = history_settle_days
+        self.not_found_ttl = not_found_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.not_found_hits: int = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, expires_at REAL, body TEXT NOT NULL, "
+                "not_found INTEGER NOT NULL DEFAULT 0)"
+            )
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(responses)")]
+            if "not_found" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE responses ADD COLUMN not_found INTEGER NOT NULL DEFAULT 0"
+                )
+
+    def ttl(self, endpoint: Endpoint, params: dict) -> float:
+        """
+        Get how long a response may be cached for, given its endpoint and request parameters.
+
+        Args:
+            endpoint (Endpoint): The endpoint the request was made to.
+            params (dict): The parameters of the request.
+
+        Returns:
+            float: The time to live in seconds, math.inf if the response never expires.
+        """
+        if endpoint.cache == IMMUTABLE:
+            return math.inf
+        if endpoint.cache == ENTITY:
+            return self.entity_ttl
+        if endpoint.cache == HISTORY and self._is_closed_range(params):
+            return math.inf
+        return self.volatile_ttl
+
+    def _is_closed_range(self, params: dict) -> bool:
+        last_day: Optional[datetime.date] = _last_day_of_range(params)
+        if last_day is None:
+            return False
+        today: datetime.date = datetime.datetime.now(datetime.timezone.utc).date()
+        return last_day < today - datetime.timedelta(days=self.history_settle_days)
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Get a cached response if it has not expired.
+
+        Args:
+            key (str): The canonical request URL.
+
+        Returns:
+            dict: The cached response, or None on a miss.
+
+        Raises:
+            SoundChartsError: If a not-found error is cached for the key.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, body, not_found FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[0] is not None and row[0] <= time.time()):
+                self.misses += 1
+                return None
+            if row[2]:
+                self.not_found_hits += 1
+            else:
+                self.hits += 1
+
+        body: dict = json.loads(row[1])
+        if row[2]:
+            raise SoundChartsError(**body)
+        return body
+
+    def contains(self, key: str) -> bool:
+        """
+        Check whether an unexpired response or not-found error is cached, without counting a hit or a miss.
+
+        Args:
+            key (str): The canonical request URL.
+
+        Returns:
+            bool: True if a request for the key would be served from the cache.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def set(self, key: str, response: dict, ttl: float):
+        """
+        Cache a response.
+
+        Args:
+            key (str): The canonical request URL.
+            response (dict): The decoded response.
+            ttl (float): The time to live in seconds, math.inf to never expire. Nothing is stored if it is not positive.
+        """
+        if ttl <= 0:
+            return
+        now: float = time.time()
+        expires_at: Optional[float] = None if math.isinf(ttl) else now + ttl
+        body: str = json.dumps(response, separators=(",", ":"))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, expires_at, body) VALUES (?, ?, ?, ?)",
+                (key, now, expires_at, body),
+            )
+
+    def set_not_found(self, key: str, error: SoundChartsError):
+        """
+        Cache a not-found error for not_found_ttl seconds.
+
+        Args:
+            key (str): The canonical request URL.
+            error (SoundChartsError): The error raised for the request.
+        """
+        if self.not_found_ttl <= 0:
+            return
+        now: float = time.time()
+        body: str = json.dumps(
+            {"http_status": error.http_status, "code": error.code, "msg": error.msg}
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, expires_at, body, not_found) VALUES (?, ?, ?, ?, 1)",
+                (key, now, now + self.not_found_ttl, body),
+            )
+
+    def purge(self) -> int:
+        """
+        Delete expired responses.
+
+        Returns:
+            int: The number of responses deleted.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        """Delete every cached response."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def _last_day_of_range(params: dict) -> Optional[datetime.date]:
+    """
+    Get the last day covered by a request, from its end date or its year and month, or None if it is open ended.
+    """
+    end_date = params.get("end_date")
+    if end_date:
+        return datetime.date.fromisoformat(str(end_date)[:10])
+
+    year, month = params.get("year"), params.get("month")
+    if year and month:
+        year, month = int(year), int(month)
+        return datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+    return None
+
+
+def is_not_found_error(error: SoundChartsError) -> bool:
+    """
+    Check whether an error means the requested entity does not exist.
+
+    Args:
+        error (SoundChartsError): The error raised for a request.
+
+    Returns:
+        bool: True for 404 not-found errors.
+    """
+    return error.http_status == 404 or str(error.code) == "404"
@@ -0,0 +1,217 @@
+import datetime
+from array import array
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from soundchartspy.client import SoundCharts
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for chart histories
+    np = None
+
+_EPOCH: datetime.date = datetime.date(1970, 1, 1)
+
+Date = Union[str, datetime.date]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Chart histories require numpy, install it with 'pip install soundchartspy[analytics]'"
+        )
+
+
+def _day_number(value: Any) -> int:
+    # Days since 1970-01-01, from a date, a datetime or an ISO string such as a rankDate
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    elif not isinstance(value, datetime.date):
+        value = datetime.date.fromisoformat(str(value)[:10])
+    return (value - _EPOCH).days
+
+
+def _chart_slug(entry: dict) -> str:
+    chart = entry.get("chart")
+    if isinstance(chart, dict):
+        return chart.get("slug") or chart.get("name")
+    return str(chart)
+
+
+class ChartSeries:
+    """
+    The positions of a song on one chart over time, kept as two NumPy arrays sorted by date: the day of each entry
+    (as days since 1970-01-01) and the position on that day.
+    """
+
+    def __init__(self, chart: str, days: "np.ndarray", positions: "np.ndarray"):
+        """
+        Args:
+            chart (str): The chart slug.
+            days (np.ndarray): The day of each entry, as days since 1970-01-01.
+            positions (np.ndarray): The position of each entry.
+        """
+        order = np.argsort(days, kind="stable")
+        self.chart = chart
+        self.days: "np.ndarray" = days[order]
+        self.positions: "np.ndarray" = positions[order]
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def dates(self) -> "np.ndarray":
+        """The date of each entry, as a datetime64[D] array."""
+        return self.days.astype("datetime64[D]")
+
+    @property
+    def first_date(self) -> datetime.date:
+        return _EPOCH + datetime.timedelta(days=int(self.days[0]))
+
+    @property
+    def last_date(self) -> datetime.date:
+        return _EPOCH + datetime.timedelta(days=int(self.days[-1]))
+
+    @property
+    def peak(self) -> int:
+        """The best (lowest) position reached."""
+        return int(self.positions.min())
+
+    @property
+    def peak_date(self) -> datetime.date:
+        """The first date the peak position was reached."""
+        return _EPOCH + datetime.timedelta(days=int(self.days[int(self.positions.argmin())]))
+
+    @property
+    def days_on_chart(self) -> int:
+        return int(len(np.unique(self.days)))
+
+    @property
+    def weeks_on_chart(self) -> int:
+        """The number of distinct weeks, starting on Mondays, with at least one entry."""
+        # 1970-01-01 was a Thursday, shift by 3 days so weeks start on Mondays
+        return int(len(np.unique((self.days + 3) // 7)))
+
+    def position_at(self, date: Date) -> Optional[int]:
+        """
+        Get the position on a date.
+
+        Args:
+            date (str | datetime.date): The date (format 'YYYY-MM-DD').
+
+        Returns:
+            int: The position, or None if the song was not on the chart that day.
+        """
+        day: int = _day_number(date)
+        index: int = int(np.searchsorted(self.days, day))
+        if index < len(self.days) and self.days[index] == day:
+            return int(self.positions[index])
+        return None
+
+    def positions_between(self, start_date: Date, end_date: Date) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Get the entries in a date range.
+
+        Args:
+            start_date (str | datetime.date): The first day of the range (format 'YYYY-MM-DD').
+            end_date (str | datetime.date): The last day of the range (format 'YYYY-MM-DD').
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The dates, as datetime64[D], and the positions of the entries.
+        """
+        start: int = int(np.searchsorted(self.days, _day_number(start_date), side="left"))
+        end: int = int(np.searchsorted(self.days, _day_number(end_date), side="right"))
+        return self.days[start:end].astype("datetime64[D]"), self.positions[start:end]
+
+
+class ChartHistory:
+    """
+    The full chart history of a song, one ChartSeries per chart.
+
+    Entries are added to compact arrays as they are read, so the history of years of daily charts takes a few bytes
+    per entry rather than a dictionary each.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> history = fetch_chart_history(soundcharts, "7d534228-5165-11e9-9375-549f35161576", platform="spotify")
+        >>> series = history["global-daily"]
+        >>> series.peak, series.weeks_on_chart, series.position_at("2023-06-01")
+    """
+
+    def __init__(self, series: dict[str, ChartSeries]):
+        """
+        Args:
+            series (dict[str, ChartSeries]): The series keyed by chart slug.
+        """
+        self.series = series
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[dict]) -> "ChartHistory":
+        """
+        Build a history from chart entries as returned by SoundCharts.song_chart_entries.
+
+        Args:
+            entries (Iterable[dict]): The entries, each with a chart, a rankDate and a position.
+
+        Returns:
+            ChartHistory: The history.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        _require_numpy()
+        days: dict[str, array] = {}
+        positions: dict[str, array] = {}
+        for entry in entries:
+            position = entry.get("position")
+            date = entry.get("rankDate") or entry.get("date")
+            if position is None or date is None:
+                continue
+            chart: str = _chart_slug(entry)
+            if chart not in days:
+                days[chart] = array("i")
+                positions[chart] = array("i")
+            days[chart].append(_day_number(date))
+            positions[chart].append(position)
+
+        series: dict[str, ChartSeries] = {}
+        for chart in days:
+            chart_positions = np.frombuffer(positions[chart], dtype=np.int32)
+            if chart_positions.max() < 2**15:
+                chart_positions = chart_positions.astype(np.int16)
+            series[chart] = ChartSeries(chart, np.frombuffer(days[chart], dtype=np.int32), chart_positions)
+        return cls(series)
+
+    @property
+    def charts(self) -> list[str]:
+        return list(self.series)
+
+    def __getitem__(self, chart: str) -> ChartSeries:
+        return self.series[chart]
+
+    def __contains__(self, chart: str) -> bool:
+        return chart in self.series
+
+    def __iter__(self) -> Iterator[ChartSeries]:
+        return iter(self.series.values())
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+
+def fetch_chart_history(client: SoundCharts, uuid: str, platform: str = "spotify") -> ChartHistory:
+    """
+    Page through every current and past chart entry of a song on a platform and build its chart history.
+
+    Args:
+        client (SoundCharts): The client used to make requests.
+        uuid (str): The UUID of the song.
+        platform (str, optional): The platform code. Defaults to 'spotify'.
+
+    Returns:
+        ChartHistory: The song's chart history.
+    """
+    _require_numpy()
+    entries: Iterator[dict] = client.paginate(
+        "song_chart_entries", uuid, platform=platform, current_only=False, sort_by="rankdate"
+    )
+    return ChartHistory.from_entries(entries)
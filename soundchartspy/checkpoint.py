@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Optional
+
+
+def query_digest(**params: Any) -> str:
+    """
+    Get a short digest of the parameters of a crawl, such as the page size and the method's keyword arguments, so
+    units fetched with other parameters are not mistaken for completed ones.
+
+    Args:
+        **params: The parameters. Those that are None are ignored.
+
+    Returns:
+        str: The digest, empty if there are no parameters.
+    """
+    params = {name: value for name, value in params.items() if value is not None}
+    if not params:
+        return ""
+    canonical: str = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class CheckpointJournal:
+    """
+    An append-only journal of completed crawl units stored on local disk.
+
+    A unit is identified by the client method name, the key it was called with (usually a UUID), a digest of the
+    other parameters of the query (see query_digest) and the page offset.
+    Each completed unit is written as one JSON line and flushed immediately, so a crashed job can be restarted with
+    the same journal and will skip every page that already succeeded.
+
+    Example:
+        >>> journal = CheckpointJournal("roster_songs.journal")
+        >>> for item in soundcharts.paginate("artist_songs", uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396", checkpoint=journal):
+        ...     print(item)
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a checkpoint journal, loading any units already recorded at the given path.
+
+        Args:
+            path (str): The path of the journal file. It is created if it does not exist.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._completed: set[tuple[str, str, str, int]] = set()
+        self._exhausted: set[tuple[str, str, str]] = set()
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _load(self):
+        if not os.path.exists(self._path):
+            return
+        with open(self._path, "r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entry: dict = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated final line, that unit is simply not complete
+                    continue
+                self._add(
+                    entry["method"], entry["key"], entry.get("query", ""), entry["offset"], entry.get("last", False)
+                )
+
+    def _add(self, method: str, key: str, query: str, offset: int, last: bool):
+        self._completed.add((method, key, query, offset))
+        if last:
+            self._exhausted.add((method, key, query))
+
+    @staticmethod
+    def _entry(method: str, key: str, query: str, offset: int, last: bool) -> str:
+        entry: dict = {"method": method, "key": key, "offset": offset}
+        if query:
+            entry["query"] = query
+        if last:
+            entry["last"] = True
+        return json.dumps(entry, separators=(",", ":")) + "\n"
+
+    def is_complete(self, method: str, key: str, offset: int = 0, query: str = "") -> bool:
+        """
+        Check whether a unit has already been recorded as complete.
+
+        Args:
+            method (str): The client method name, e.g. 'artist_songs'.
+            key (str): The key the method was called with, usually a UUID.
+            offset (int, optional): The page offset. Defaults to 0.
+            query (str, optional): The digest of the query's other parameters. Defaults to none.
+
+        Returns:
+            bool: True if the unit is complete.
+        """
+        with self._lock:
+            return (method, key, query, offset) in self._completed
+
+    def is_exhausted(self, method: str, key: str, query: str = "") -> bool:
+        """
+        Check whether the last page for a method and key has been recorded, meaning there is nothing left to fetch.
+
+        Args:
+            method (str): The client method name.
+            key (str): The key the method was called with.
+            query (str, optional): The digest of the query's other parameters. Defaults to none.
+
+        Returns:
+            bool: True if every page for the key has been fetched.
+        """
+        with self._lock:
+            return (method, key, query) in self._exhausted
+
+    def mark_complete(
+        self, method: str, key: str, offset: int = 0, last: bool = False, query: str = ""
+    ):
+        """
+        Record a unit as complete and flush it to disk.
+
+        Args:
+            method (str): The client method name.
+            key (str): The key the method was called with.
+            offset (int, optional): The page offset. Defaults to 0.
+            last (bool, optional): Whether this was the final page for the key. Defaults to False.
+            query (str, optional): The digest of the query's other parameters. Defaults to none.
+        """
+        line: str = self._entry(method, key, query, offset, last)
+        with self._lock:
+            with open(self._path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(line)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+            self._add(method, key, query, offset, last)
+
+    def completed_offsets(self, method: str, key: str, query: str = "") -> set[int]:
+        """
+        Get the offsets already completed for a method and key.
+
+        Args:
+            method (str): The client method name.
+            key (str): The key the method was called with.
+            query (str, optional): The digest of the query's other parameters. Defaults to none.
+
+        Returns:
+            set[int]: The completed page offsets.
+        """
+        with self._lock:
+            return {
+                offset
+                for (m, k, q, offset) in self._completed
+                if m == method and k == key and q == query
+            }
+
+    def clear(self, method: Optional[str] = None):
+        """
+        Forget completed units, either all of them or only those for one method, and rewrite the journal file.
+
+        Args:
+            method (str, optional): Only clear units recorded for this method.
+        """
+        with self._lock:
+            if method is None:
+                self._completed.clear()
+                self._exhausted.clear()
+            else:
+                self._completed = {u for u in self._completed if u[0] != method}
+                self._exhausted = {u for u in self._exhausted if u[0] != method}
+            last_offsets: dict = {}
+            for m, k, q, offset in self._completed:
+                if (m, k, q) in self._exhausted:
+                    last_offsets[(m, k, q)] = max(offset, last_offsets.get((m, k, q), offset))
+            with open(self._path, "w", encoding="utf-8") as journal_file:
+                for m, k, q, offset in sorted(self._completed):
+                    journal_file.write(self._entry(m, k, q, offset, last_offsets.get((m, k, q)) == offset))
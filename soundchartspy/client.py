@@ -1,5 +1,13 @@
+import contextlib
 import datetime
+import functools
+import inspect
 import logging
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Optional, Union
 
 import requests
 from requests import Response
@@ -16,52 +24,641 @@ from soundchartspy.data import (
     AudienceData,
     ShortVideo,
 )
+from soundchartspy.cache import ResponseCache, is_not_found_error
+from soundchartspy.checkpoint import CheckpointJournal, query_digest
+from soundchartspy.concurrency import AdaptiveConcurrency
+from soundchartspy.endpoints import ENDPOINTS, ITEMS, OFFSET, Endpoint, get_endpoint
+from soundchartspy.exceptions import SoundChartsError
+from soundchartspy.fanout import PlatformAudience, fan_out
+from soundchartspy.hedging import HedgePolicy
+from soundchartspy.index import ARTIST, ISRC_PLATFORM, SONG, IdentifierIndex
+from soundchartspy.ledger import QuotaLedger
+from soundchartspy.models import constructor
+from soundchartspy.scheduler import RequestScheduler, bulk_priority, current_priority
+from soundchartspy.timeouts import (
+    DEFAULT_TIMEOUT,
+    Deadline,
+    DeadlineExceeded,
+    Timeout,
+    current_deadline,
+    current_timeout,
+    submit,
+    within,
+)
+from soundchartspy.tracing import conversion_timer, mark_conversion_start
 from soundchartspy.utils import (
     check_response_for_errors_and_convert_to_dict,
+    check_response_for_errors_and_return_content,
     convert_song_response_to_object,
     convert_playlist_entry_data_to_tuple_pair,
     convert_json_to_artist_object,
-    check_and_add_start_and_end_date_to_query_params,
+    convert_radio_items,
+    date_windows,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL: str = "https://customer.api.soundcharts.com"
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(method: str) -> inspect.Signature:
+    return inspect.signature(getattr(SoundCharts, method))
+
 
 class SoundCharts:
+    """
+    Client for the SoundCharts API.
 
-    def __init__(self, app_id: str, api_key: str):
+    A single instance can be shared between threads: every method may be called concurrently. Each thread uses its
+    own HTTP session and connection pool, and the shared state (cache, identifier index, dry-run log and metrics) is
+    protected by locks.
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        api_key: str,
+        cache: Optional[ResponseCache] = None,
+        index: Optional[IdentifierIndex] = None,
+        dry_run: bool = False,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        hedging: Optional[HedgePolicy] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        ledger: Optional[QuotaLedger] = None,
+        tracer: Any = None,
+    ):
         """
         Initialize the SoundCharts client.
 
         Args:
             app_id (str): Your SoundCharts app ID.
             api_key (str): Your SoundCharts API key.
+            cache (ResponseCache, optional): A cache for responses, used according to each endpoint's cache policy.
+            index (IdentifierIndex, optional): An index of ISRCs and platform identifiers to UUIDs, filled as songs,
+                artists and their identifiers are fetched.
+            dry_run (bool, optional): Record the URLs that would be requested in dry_run_requests instead of sending
+                them. Methods then return empty results. Defaults to False.
+            base_url (str, optional): The API base URL. Defaults to the SoundCharts customer API.
+            timeout (float | tuple[float, float], optional): The request timeout in seconds, or a (connect, read)
+                pair. Can be overridden for some requests with request_timeout. Defaults to (5, 30).
+            hedging (HedgePolicy, optional): Hedge slow requests with a second identical request, the first
+                response is used. Defaults to no hedging.
+            concurrency (AdaptiveConcurrency, optional): Limit the number of requests in flight across threads,
+                adapting the limit to the API's latency and throttling. Defaults to no limit.
+            scheduler (RequestScheduler, optional): Rate limit requests, letting interactive requests ahead of bulk
+                ones. Can be shared by several clients using the same credentials. Defaults to no rate limit.
+            ledger (QuotaLedger, optional): A rate limit and quota view shared with the clients of other processes
+                on the host. Defaults to none.
+            tracer (Tracer, optional): Trace each method call, HTTP request and decoding stage as nested spans. Takes
+                a soundchartspy.tracing.Tracer or an OpenTelemetry tracer. Defaults to no tracing.
         """
         self._app_id = app_id
         self._api_key = api_key
+        self._cache = cache
+        self._index = index
+        self._base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.dry_run = dry_run
+        self.dry_run_requests: list[str] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # The sessions of live threads, each closed when its thread ends
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._metrics: dict[str, int] = {"requests": 0, "errors": 0}
+        self._hedging = hedging
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._primary_executor: Optional[ThreadPoolExecutor] = None
+        self._concurrency = concurrency
+        self._scheduler = scheduler
+        self._ledger = ledger
+        self.tracer = tracer
 
     def _get_credentials(self):
         credentials = {"x-app-id": self._app_id, "x-api-key": self._api_key}
         return credentials
 
-    def _make_api_get_request(self, append_to_base_url: str) -> dict:
+    def _session(self) -> requests.Session:
+        """
+        Get the calling thread's HTTP session, creating it on first use. Sessions keep connections alive between
+        requests but are not safe to share between threads, so each thread gets its own. It is closed when the thread
+        ends, so the short-lived workers of fan-outs and crawls do not leave sessions and sockets behind.
+        """
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._get_credentials())
+            self._local.session = session
+            weakref.finalize(threading.current_thread(), session.close)
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    @staticmethod
+    def _span(tracer: Any, name: str, attributes: Optional[dict] = None):
+        # A span for a stage of a request, or nothing when tracing is off. Callers read the client's tracer once and
+        # pass it here, as profile can swap it while the call runs
+        if tracer is None:
+            return contextlib.nullcontext()
+        return tracer.start_as_current_span(name, attributes=attributes)
+
+    def _count(self, metric: str, value: int = 1):
+        with self._lock:
+            self._metrics[metric] = self._metrics.get(metric, 0) + value
+
+    def metrics(self) -> dict:
+        """
+        Get a snapshot of the client's counters.
+
+        Returns:
+            dict: 'requests' sent to the API, request 'errors', 'hedges' sent and 'hedge_wins' when a hedge
+            completed first, 'concurrency_limit', 'in_flight' and 'concurrency_backoffs' when the client has an
+            adaptive concurrency limit, 'quota_remaining' when the client has a quota ledger and the API has reported
+            it, and cache 'cache_hits', 'cache_misses' and 'not_found_hits' when the client has a cache.
+        """
+        with self._lock:
+            metrics: dict = dict(self._metrics)
+        if self._concurrency is not None:
+            metrics.update(
+                concurrency_limit=self._concurrency.limit,
+                in_flight=self._concurrency.in_flight,
+                concurrency_backoffs=self._concurrency.backoffs,
+            )
+        if self._ledger is not None and self._ledger.quota_remaining is not None:
+            metrics["quota_remaining"] = self._ledger.quota_remaining
+        if self._cache is not None:
+            metrics.update(
+                cache_hits=self._cache.hits,
+                cache_misses=self._cache.misses,
+                not_found_hits=self._cache.not_found_hits,
+            )
+        return metrics
+
+    def close(self):
+        """Close the HTTP sessions of every thread that used the client."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+            executors = [self._hedge_executor, self._primary_executor]
+            self._hedge_executor = self._primary_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> "SoundCharts":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _make_api_get_request(self, append_to_base_url: str, decode: bool = True) -> Union[dict, bytes]:
         """
         Make a GET request to the SoundCharts API.
 
         Args:
             append_to_base_url (str): The endpoint to append to the base API URL.
+            decode (bool, optional): Decode the response from JSON. Defaults to True.
+
+        Returns:
+            dict | bytes: The JSON response from the API as a dictionary, or the undecoded body if decode is False.
+        """
+        url: str = self._base_url + append_to_base_url
+        timeout: Timeout = current_timeout() or self.timeout
+        deadline: Optional[Deadline] = current_deadline()
+        if deadline is not None:
+            deadline.check()
+
+        name, flow = current_priority()
+        tracer: Any = self.tracer
+        with self._span(tracer, "http.request", {"http.url": url, "soundcharts.priority": name}):
+            if self._scheduler is not None:
+                with self._span(tracer, "http.queue"):
+                    acquired: bool = self._scheduler.acquire(
+                        name, flow, timeout=None if deadline is None else deadline.remaining()
+                    )
+                if not acquired:
+                    raise deadline.exceed()
+            try:
+                return self._send(url, timeout, deadline, decode, tracer)
+            finally:
+                if self._scheduler is not None:
+                    self._scheduler.release(name)
+
+    def _send(
+        self, url: str, timeout: Timeout, deadline: Optional[Deadline], decode: bool = True, tracer: Any = None
+    ) -> Union[dict, bytes]:
+        if self._ledger is not None:
+            with self._span(tracer, "http.quota"):
+                acquired: bool = self._ledger.acquire(timeout=None if deadline is None else deadline.remaining())
+            if not acquired:
+                raise deadline.exceed()
+        if self._concurrency is not None:
+            with self._span(tracer, "http.concurrency"):
+                acquired = self._concurrency.acquire(timeout=None if deadline is None else deadline.remaining())
+            if not acquired:
+                raise deadline.exceed()
+        if deadline is not None:
+            # Cut the timeout only once every wait is over, the waits count against the deadline too
+            try:
+                timeout = deadline.cap(timeout)
+            except DeadlineExceeded:
+                self._release(None)
+                raise
+
+        self._count("requests")
+        tracing: bool = tracer is not None
+        start: float = time.monotonic()
+        status: Optional[int] = None
+        try:
+            # When tracing, the body is streamed so the time to the headers (connection and server time) and the
+            # download are timed apart
+            with self._span(tracer, "http.send") as span:
+                response: Response = self._session().get(url, timeout=timeout, stream=tracing)
+                status = response.status_code
+                if span is not None:
+                    span.set_attribute("http.status_code", status)
+            if tracing:
+                with self._span(tracer, "http.download") as span:
+                    span.set_attribute("http.response_content_length", len(response.content))
+            if self._ledger is not None:
+                self._ledger.record_headers(response.headers)
+            if not decode:
+                response: bytes = check_response_for_errors_and_return_content(response=response)
+            else:
+                with self._span(tracer, "decode"):
+                    response: dict = check_response_for_errors_and_convert_to_dict(
+                        response=response
+                    )
+        except requests.Timeout as e:
+            self._count("errors")
+            self._release(None, overloaded=True)
+            if deadline is not None and deadline.expired:
+                raise deadline.exceed() from e
+            raise
+        except Exception:
+            self._count("errors")
+            overloaded: bool = status is not None and (status == 429 or status >= 500)
+            self._release(time.monotonic() - start if status else None, overloaded)
+            raise
+        self._release(time.monotonic() - start)
+        return response
+
+    def _release(self, latency: Optional[float], overloaded: bool = False):
+        if self._concurrency is not None:
+            self._concurrency.release(latency, overloaded)
+
+    def _get(self, endpoint_name: str, **params) -> dict:
+        """
+        Make a GET request to a registered endpoint, building its canonical URL from the given parameters.
+        If the client has a cache, a cached response is returned when available and new responses are cached.
+        Not-found errors are cached as well and raised again from the cache.
+
+        Args:
+            endpoint_name (str): The name of the endpoint in the registry, which is the name of the client method.
+            **params: The path and query parameters of the endpoint. Parameters that are None are not sent.
 
         Returns:
             dict: The JSON response from the API as a dictionary.
         """
-        base_url: str = "https://customer.api.soundcharts.com"
-        url: str = base_url + append_to_base_url
-        response: Response = requests.get(url, headers=self._get_credentials())
-        response: dict = check_response_for_errors_and_convert_to_dict(
-            response=response
-        )
+        endpoint: Endpoint = get_endpoint(endpoint_name)
+        url: str = endpoint.url(**params)
+        if self.dry_run:
+            with self._lock:
+                self.dry_run_requests.append(url)
+            response: dict = {"items": [], "object": None}
+        elif self._cache is None:
+            response = self._request(endpoint, url)
+        else:
+            response = self._cached_request(endpoint, url, params)
+        # What the calling method does from here on is converting the response
+        mark_conversion_start()
+        return response
+
+    def _cached_request(self, endpoint: Endpoint, url: str, params: dict) -> dict:
+        with self._span(self.tracer, "cache.get") as span:
+            response: Optional[dict] = self._cache.get(url)
+            if span is not None:
+                span.set_attribute("cache.hit", response is not None)
+        if response is None:
+            try:
+                response = self._request(endpoint, url)
+            except SoundChartsError as e:
+                if is_not_found_error(e):
+                    self._cache.set_not_found(url, e)
+                raise
+            self._cache.set(url, response, self._cache.ttl(endpoint, params))
+        return response
+
+    def _request(self, endpoint: Endpoint, url: str) -> dict:
+        if self._hedging is None:
+            return self._make_api_get_request(append_to_base_url=url)
+        return self._hedged_request(endpoint, url)
+
+    def _timed_request(
+        self, endpoint: Endpoint, url: str, hedge: bool = False, started: Optional[threading.Event] = None
+    ) -> dict:
+        if started is not None:
+            started.set()
+        start: float = time.monotonic()
+        with self._span(self.tracer if hedge else None, "hedge"):
+            response: dict = self._make_api_get_request(append_to_base_url=url)
+        self._hedging.observe(endpoint.template, time.monotonic() - start)
         return response
 
+    def _executor(self, hedge: bool = True) -> ThreadPoolExecutor:
+        # Primaries and hedges have pools of their own, so hedges never hold up primaries
+        with self._lock:
+            if hedge and self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self._hedging.max_workers, thread_name_prefix="soundcharts-hedge"
+                )
+            elif not hedge and self._primary_executor is None:
+                self._primary_executor = ThreadPoolExecutor(
+                    max_workers=self._hedging.max_requests, thread_name_prefix="soundcharts-request"
+                )
+            return self._hedge_executor if hedge else self._primary_executor
+
+    def _hedged_request(self, endpoint: Endpoint, url: str) -> dict:
+        """
+        Make a request, and if it has not completed after the endpoint's usual latency and the hedge rate allows,
+        an identical second request. The first successful response is returned.
+
+        The primary request runs on a pool owned by the client, so the caller can return as soon as the hedge wins.
+        Its pool threads are reused from call to call and so are their HTTP sessions. The hedge delay and the
+        latency samples count from when the primary starts running, not from when it was queued. The losing request
+        is cancelled only if it has not started yet: once sent it runs to completion, holding its worker, and its
+        response is discarded.
+        """
+        self._hedging.start_request()
+        delay: Optional[float] = self._hedging.delay(endpoint.template)
+        if delay is None:
+            return self._timed_request(endpoint, url)
+
+        started: threading.Event = threading.Event()
+        primary: Future = submit(self._executor(hedge=False), self._timed_request, endpoint, url, False, started)
+        # Also set if the primary is cancelled before it runs, when the client is closed
+        primary.add_done_callback(lambda _: started.set())
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._hedging.try_hedge():
+            return primary.result()
+
+        self._count("hedges")
+        hedge: Future = submit(self._executor(), self._timed_request, endpoint, url, True)
+        pending: set[Future] = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded: list[Future] = [future for future in done if future.exception() is None]
+            if succeeded or not pending:
+                for loser in pending:
+                    # Only cancels the loser if it has not started, otherwise it runs on and its response is discarded
+                    loser.cancel()
+                winner: Future = succeeded[0] if succeeded else primary
+                if winner is hedge:
+                    self._count("hedge_wins")
+                return winner.result()
+
+    def _index_identifiers(
+        self, kind: str, uuid: str, identifiers: Iterable[tuple[str, str]]
+    ):
+        if self._index is not None:
+            self._index.add(kind, uuid, identifiers)
+
+    def _index_song(self, song: Optional[Song], *identifiers: tuple[str, str]):
+        if song is None:
+            return
+        isrc: Optional[str] = song.isrc.value if song.isrc else None
+        self._index_identifiers(SONG, song.uuid, [(ISRC_PLATFORM, isrc), *identifiers])
+
+    def paginate(
+        self,
+        method: str,
+        uuid: str,
+        limit: int = 100,
+        checkpoint: Optional[CheckpointJournal] = None,
+        deadline: Optional[Deadline] = None,
+        raw: bool = False,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Iterate over every item of a paginated method by requesting successive pages until a short page is returned.
+
+        When a checkpoint journal is given each page is recorded once it has been fetched, and pages already recorded
+        are skipped without being requested again, so an interrupted crawl can be resumed where it stopped.
+
+        When a deadline is given and expires, iteration stops after the last page fetched in time and the deadline
+        is marked as exceeded. Pages are requested with bulk priority unless another priority is set.
+
+        Args:
+            method (str): The name of a paginated client method, e.g. 'artist_songs', 'artist_albums' or 'song_playlist_entries'.
+            uuid (str): The UUID passed to the method.
+            limit (int, optional): The page size. Defaults to 100, which is the maximum for most endpoints.
+            checkpoint (CheckpointJournal, optional): A journal used to record and skip completed pages.
+            deadline (Deadline, optional): When to stop requesting pages.
+            raw (bool, optional): Yield the items as returned by the API, without converting them. Defaults to False.
+            **kwargs: Any other keyword arguments accepted by the method.
+
+        Yields:
+            The items returned by the method, page by page.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> journal = CheckpointJournal("artist_songs.journal")
+            >>> songs = list(soundcharts.paginate("artist_songs", uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396", checkpoint=journal))
+        """
+        endpoint: Endpoint = get_endpoint(method)
+        if endpoint.pagination != OFFSET:
+            raise ValueError(f"{method}() is not a paginated endpoint")
+        client_method = functools.partial(self.raw, method) if raw else getattr(self, method)
+        # Pages of the same UUID fetched with another page size or other arguments are different units
+        query: str = query_digest(limit=limit, **kwargs)
+        if checkpoint is not None and checkpoint.is_exhausted(method, uuid, query):
+            return
+
+        offset: int = 0
+        while True:
+            if checkpoint is not None and checkpoint.is_complete(method, uuid, offset, query):
+                offset += limit
+                continue
+
+            try:
+                with bulk_priority(method):
+                    items = within(deadline, client_method, uuid, offset=offset, limit=limit, **kwargs)
+            except DeadlineExceeded:
+                if deadline is None:
+                    raise
+                return
+            if raw or endpoint.shape != ITEMS:
+                items = items.get("items") or []
+            last: bool = not items or len(items) < limit
+            yield from items
+
+            # Only record the page once the caller has consumed it
+            if checkpoint is not None:
+                checkpoint.mark_complete(method, uuid, offset, last=last, query=query)
+            if last:
+                return
+            offset += limit
+
+    def windowed(
+        self, method: str, uuid: str, start_date: str, end_date: str, **kwargs
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items of a date range method for a range longer than the endpoint allows per request, by
+        splitting it into consecutive windows (90 days for artist_audience). Windows are requested with bulk
+        priority unless another priority is set.
+
+        Args:
+            method (str): The name of a client method taking start_date and end_date, e.g. 'artist_audience'.
+            uuid (str): The UUID passed to the method.
+            start_date (str): The first day of the range (format 'YYYY-MM-DD').
+            end_date (str): The last day of the range (format 'YYYY-MM-DD').
+            **kwargs: Any other keyword arguments accepted by the method.
+
+        Yields:
+            The items returned for each window, in date order.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> audience = list(soundcharts.windowed("artist_audience", "11e81bcc-9c1c-ce38-b96b-a0369fe50396", "2023-01-01", "2023-12-31", platform="instagram"))
+        """
+        endpoint: Endpoint = get_endpoint(method)
+        client_method = getattr(self, method)
+        if endpoint.max_window_days is None:
+            windows: list[tuple[str, str]] = [(start_date, end_date)]
+        else:
+            windows = date_windows(start_date, end_date, endpoint.max_window_days)
+
+        for window_start, window_end in windows:
+            with bulk_priority(method):
+                items = client_method(uuid, start_date=window_start, end_date=window_end, **kwargs)
+            yield from items
+
+    def _endpoint_params(self, method: str, args: tuple, kwargs: dict) -> tuple[Endpoint, dict]:
+        # The endpoint of a client method and its parameters, with the method's defaults, from its arguments
+        endpoint: Endpoint = get_endpoint(method)
+        arguments = _signature(method).bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        params: dict = dict(arguments.arguments)
+        del params["self"]
+        return endpoint, params
+
+    def raw(self, method: str, *args, **kwargs) -> dict:
+        """
+        Call a client method's endpoint and return the response as decoded from JSON, without converting it to data
+        classes. Caching, rate limits and the other client options apply as for the method.
+
+        Args:
+            method (str): The name of a client method, e.g. 'song' or 'song_playlist_entries'.
+            *args: The method's positional arguments.
+            **kwargs: The method's keyword arguments.
+
+        Returns:
+            dict: The response document, e.g. with the entity in 'object' or the list in 'items'.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> document = soundcharts.raw("song_playlist_entries", "7d534228-5165-11e9-9375-549f35161576", platform="spotify")
+            >>> document["items"]
+        """
+        endpoint, params = self._endpoint_params(method, args, kwargs)
+        with self._span(self.tracer, method, {"soundcharts.method": method, "soundcharts.raw": True}):
+            return self._get(endpoint.name, **params)
+
+    def raw_bytes(self, method: str, *args, **kwargs) -> bytes:
+        """
+        Call a client method's endpoint and return the response body as sent by the API, without decoding it, e.g.
+        to archive responses.
+
+        The body is not cached and the request is not hedged. Errors reported by the API are raised as for the
+        method.
+
+        Args:
+            method (str): The name of a client method, e.g. 'song' or 'song_playlist_entries'.
+            *args: The method's positional arguments.
+            **kwargs: The method's keyword arguments.
+
+        Returns:
+            bytes: The JSON response body, empty in dry-run mode.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> with open("song.json", "wb") as archive:
+            ...     archive.write(soundcharts.raw_bytes("song", "7d534228-5165-11e9-9375-549f35161576"))
+        """
+        endpoint, params = self._endpoint_params(method, args, kwargs)
+        url: str = endpoint.url(**params)
+        if self.dry_run:
+            with self._lock:
+                self.dry_run_requests.append(url)
+            return b""
+        with self._span(self.tracer, method, {"soundcharts.method": method, "soundcharts.raw": True}):
+            return self._make_api_get_request(append_to_base_url=url, decode=False)
+
+    def crawl(
+        self,
+        method: str,
+        uuids: Iterable[str],
+        checkpoint: Optional[CheckpointJournal] = None,
+        deadline: Optional[Deadline] = None,
+        raw: bool = False,
+        **kwargs,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Call a client method for many UUIDs, resuming from a checkpoint journal if one is given.
+
+        Paginated methods (those accepting an offset) are fully paginated for each UUID and yield one pair per item,
+        other methods yield one pair per UUID. UUIDs whose units are already recorded in the journal are skipped.
+        When a deadline is given and expires, the crawl stops and the deadline is marked as exceeded. Requests are
+        made with bulk priority unless another priority is set.
+
+        Args:
+            method (str): The name of a client method, e.g. 'song' or 'artist_albums'.
+            uuids (Iterable[str]): The UUIDs to crawl.
+            checkpoint (CheckpointJournal, optional): A journal used to record and skip completed units.
+            deadline (Deadline, optional): When to stop crawling.
+            raw (bool, optional): Yield items, or whole response documents for non-paginated methods, as returned by
+                the API without converting them. Defaults to False.
+            **kwargs: Any other keyword arguments accepted by the method.
+
+        Yields:
+            tuple[str, Any]: The UUID and an item (or the whole result for non-paginated methods).
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> journal = CheckpointJournal("roster.journal")
+            >>> for artist_uuid, album in soundcharts.crawl("artist_albums", roster_uuids, checkpoint=journal):
+            ...     print(artist_uuid, album.name)
+        """
+        client_method = functools.partial(self.raw, method) if raw else getattr(self, method)
+        paginated: bool = get_endpoint(method).pagination == OFFSET
+        query: str = query_digest(**kwargs)
+
+        for uuid in uuids:
+            if paginated:
+                for item in self.paginate(method, uuid, checkpoint=checkpoint, deadline=deadline, raw=raw, **kwargs):
+                    yield uuid, item
+                if deadline is not None and deadline.exceeded:
+                    return
+                continue
+
+            if checkpoint is not None and checkpoint.is_complete(method, uuid, query=query):
+                continue
+            try:
+                with bulk_priority(method):
+                    result = within(deadline, client_method, uuid, **kwargs)
+            except DeadlineExceeded:
+                if deadline is None:
+                    raise
+                return
+            yield uuid, result
+            if checkpoint is not None:
+                checkpoint.mark_complete(method, uuid, last=True, query=query)
+
     def song(self, uuid: str) -> Song:
         """
         Get a song by its SoundCharts UUID.
@@ -76,9 +673,9 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> song = soundcharts.song(uuid="7d534228-5165-11e9-9375-549f35161576")
         """
-        endpoint: str = f"/api/v2.25/song/{uuid}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("song", uuid=uuid)
         song: Song = convert_song_response_to_object(response)
+        self._index_song(song)
         return song
 
     def song_by_isrc(self, isrc: str) -> Song:
@@ -95,9 +692,9 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> song = soundcharts.song_by_isrc(isrc="USUM71712345")
         """
-        endpoint: str = f"/api/v2.25/song/by-isrc/{isrc}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("song_by_isrc", isrc=isrc)
         song: Song = convert_song_response_to_object(response)
+        self._index_song(song)
         return song
 
     def song_by_platform_id(self, platform: str, identifier: str) -> Song:
@@ -115,11 +712,48 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> song = soundcharts.song_by_platform_id(platform="spotify", identifier="2Fxmhks0bxGSBdJ92vM42m")
         """
-        endpoint: str = f"/api/v2.25/song/by-platform/{platform}/{identifier}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_by_platform_id", platform=platform, identifier=identifier
+        )
         song: Song = convert_song_response_to_object(response)
+        self._index_song(song, (platform, identifier))
         return song
 
+    def resolve_song_uuid(
+        self, isrc: str = None, platform: str = None, identifier: str = None
+    ) -> str:
+        """
+        Resolve an ISRC or a platform identifier to a song UUID, from the client's identifier index when possible and
+        otherwise with song_by_isrc or song_by_platform_id.
+
+        Args:
+            isrc (str, optional): The ISRC of the song.
+            platform (str, optional): The platform code (e.g., 'spotify'), used with identifier.
+            identifier (str, optional): The platform-specific song identifier.
+
+        Returns:
+            str: The UUID of the song.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", index=IdentifierIndex("ids.sqlite"))
+            >>> uuid = soundcharts.resolve_song_uuid(platform="spotify", identifier="2Fxmhks0bxGSBdJ92vM42m")
+        """
+        if isrc is None and (platform is None or identifier is None):
+            raise ValueError("Either isrc or platform and identifier must be given")
+
+        if self._index is not None:
+            uuid: Optional[str] = (
+                self._index.lookup(SONG, ISRC_PLATFORM, isrc)
+                if isrc is not None
+                else self._index.lookup(SONG, platform, identifier)
+            )
+            if uuid is not None:
+                return uuid
+
+        if isrc is not None:
+            return self.song_by_isrc(isrc=isrc).uuid
+        return self.song_by_platform_id(platform=platform, identifier=identifier).uuid
+
     def song_ids(
         self, uuid: str, platform: str = None, offset: int = 0, limit: int = 100
     ) -> list[PlatformIdentifier]:
@@ -139,12 +773,16 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> platform_ids = soundcharts.song_ids(uuid="7d534228-5165-11e9-9375-549f35161576", platform="spotify", limit=50)
         """
-        endpoint = f"/api/v2/song/{uuid}/identifiers?offset={offset}&limit={limit}"
-        if platform:
-            endpoint = f"/api/v2/song/{uuid}/identifiers?platform={platform}&offset={offset}&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_ids", uuid=uuid, platform=platform, offset=offset, limit=limit
+        )
         items: list = response.get("items")
-        platform_identifiers = [PlatformIdentifier(**item) for item in items]
+        platform_identifiers = list(map(constructor(PlatformIdentifier), items))
+        self._index_identifiers(
+            SONG,
+            uuid,
+            [(item.platformCode, item.identifier) for item in platform_identifiers],
+        )
         return platform_identifiers
 
     def song_albums(
@@ -174,16 +812,23 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> albums = soundcharts.song_albums(uuid="7d534228-5165-11e9-9375-549f35161576", type="album", limit=50, sort_by="releaseDate", sort_order="desc")
         """
-        endpoint = f"/api/v2/song/{uuid}/albums?type={type}&offset={offset}&limit={limit}&sort_by={sort_by}&sort_order={sort_order}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_albums",
+            uuid=uuid,
+            type=type,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
         items: list[dict] = response.get("items")
 
         for item in items:
-            item["releaseDate"] = datetime.datetime.fromisoformat(
-                item.get("releaseDate")
-            )
+            release_date = item.get("releaseDate")
+            if release_date:
+                item["releaseDate"] = datetime.datetime.fromisoformat(release_date)
 
-        albums = [Album(**item) for item in items]
+        albums = list(map(constructor(Album), items))
         return albums
 
     def song_audience(
@@ -211,14 +856,58 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> audience_data = soundcharts.song_audience(uuid="7d534228-5165-11e9-9375-549f35161576", platform="spotify", start_date="2023-01-01", end_date="2023-03-31", identifier="2Fxmhks0bxGSBdJ92vM42m")
         """
-        endpoint = f"/api/v2/song/{uuid}/audience/{platform}?start_date={start_date}&end_date={end_date}"
-        if identifier:
-            endpoint += f"&identifier={identifier}"
-
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_audience",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
+            identifier=identifier,
+        )
         items = response.get("items")
         return items
 
+    def song_audience_by_platforms(
+        self,
+        uuid: str,
+        platforms: Iterable[str],
+        start_date: str = None,
+        end_date: str = None,
+        max_workers: int = None,
+        deadline: Optional[Deadline] = None,
+    ) -> PlatformAudience:
+        """
+        Retrieve audience data for a song on several platforms at the same time, aligned on common dates.
+
+        A platform that fails (for example because it is not supported for the song) is recorded in the result's
+        errors and does not fail the whole call.
+
+        Args:
+            uuid (str): The UUID of the song.
+            platforms (Iterable[str]): The platform codes.
+            start_date (str, optional): The start date for the audience data (format 'YYYY-MM-DD').
+            end_date (str, optional): The end date for the audience data (format 'YYYY-MM-DD').
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to one per platform.
+            deadline (Deadline, optional): When to stop waiting. Platforms not fetched in time are recorded in the
+                result's errors as DeadlineExceeded.
+
+        Returns:
+            PlatformAudience: The audience data with one column per platform.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> audience = soundcharts.song_audience_by_platforms(uuid="7d534228-5165-11e9-9375-549f35161576", platforms=["spotify", "deezer"])
+        """
+        series, errors = fan_out(
+            lambda platform: self.song_audience(
+                uuid=uuid, platform=platform, start_date=start_date, end_date=end_date
+            ),
+            platforms,
+            max_workers=max_workers,
+            deadline=deadline,
+        )
+        return PlatformAudience.align(uuid, series, errors)
+
     def song_spotify_popularity(
         self, uuid: str, start_date: str = None, end_date: str = None
     ) -> dict:
@@ -237,8 +926,12 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> spotify_popularity = soundcharts.song_spotify_popularity(uuid="7d534228-5165-11e9-9375-549f35161576")
         """
-        endpoint = f"/api/v2/song/{uuid}/spotify/identifier/popularity?start_date={start_date}&end_date={end_date}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_spotify_popularity",
+            uuid=uuid,
+            start_date=start_date,
+            end_date=end_date,
+        )
         items = response.get("items")
         return items
 
@@ -271,12 +964,16 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> chart_entries = soundcharts.song_chart_entries(uuid="7d534228-5165-11e9-9375-549f35161576", platform="spotify", current_only=True, limit=50)
         """
-
-        current_only: int = int(current_only)
-        endpoint: str = (
-            f"/api/v2/song/{uuid}/charts/ranks/{platform}?current_only={current_only}&offset={offset}&limit={limit}&sort_by={sort_by}&sort_order={sort_order}"
+        response: dict = self._get(
+            "song_chart_entries",
+            uuid=uuid,
+            platform=platform,
+            current_only=current_only,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         items: dict = response.get("items")
         return items
 
@@ -309,16 +1006,62 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> playlist_entries = soundcharts.song_playlist_entries(uuid="7d534228-5165-11e9-9375-549f35161576")
         """
-        endpoint: str = (
-            f"/api/v2.20/song/{uuid}/playlist/current/{platform}?type={type}&offset={offset}&limit={limit}&sort_by={sort_by}&sort_order={sort_order}"
+        response: dict = self._get(
+            "song_playlist_entries",
+            uuid=uuid,
+            platform=platform,
+            type=type,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         items: dict = response.get("items")
         playlist_entries: list[tuple[Playlist, PlaylistPosition]] = [
             convert_playlist_entry_data_to_tuple_pair(item) for item in items
         ]
         return playlist_entries
 
+    def song_broadcasts(
+        self,
+        uuid: str,
+        radio_slugs: list[str],
+        country_code: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> list[dict]:
+        """
+        Retrieve radio broadcasts of a song as returned by the API, without converting the radio stations.
+
+        This is the endpoint behind song_radio_spins and song_radio_spin_count. Use it with
+        soundchartspy.broadcasts.fetch_broadcasts to get both views and aggregates from one fetch.
+
+        Args:
+            uuid (str): The UUID of the song.
+            radio_slugs (list[str]): A list of radio slugs.
+            country_code (str): The country code.
+            start_date (str) : Period start date (Format ATOM). Example : 2019-01-01T00:00:00Z
+            end_date (str): Period end date (Format ATOM). Example : 2019-01-01T00:00:00Z
+            offset (int, optional): The starting position of the results. Defaults to 0.
+            limit (int, optional): The number of results to return. Defaults to 100. Maximum is 100.
+
+        Returns:
+            list[dict]: The broadcasts.
+        """
+        response: dict = self._get(
+            "song_broadcasts",
+            uuid=uuid,
+            radio_slugs=radio_slugs,
+            country_code=country_code,
+            start_date=start_date,
+            end_date=end_date,
+            offset=offset,
+            limit=limit,
+        )
+        return response.get("items")
+
     def song_radio_spins(
         self,
         uuid: str,
@@ -348,18 +1091,18 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> radio_spins = soundcharts.song_radio_spins(uuid="7d534228-5165-11e9-9375-549f35161576", radio_slugs=["nrj", "funradio"], country_code="FR", start_date="2019-01-01T00:00:00Z", end_date="2019-01-01T00:00:00Z", offset=0, limit=100)
         """
-        radio_slugs_str = ",".join(radio_slugs)
-        endpoint = f"/api/v2/song/{uuid}/broadcasts?radio_slugs={radio_slugs_str}&country_code={country_code}&start_date={start_date}&end_date={end_date}&offset={offset}&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_radio_spins",
+            uuid=uuid,
+            radio_slugs=radio_slugs,
+            country_code=country_code,
+            start_date=start_date,
+            end_date=end_date,
+            offset=offset,
+            limit=limit,
+        )
         items = response.get("items")
-
-        new_items = []
-        for item in items:
-            radio = item.get("radio")
-            item["radio"] = RadioStation(**radio)
-            new_items.append(item)
-
-        return new_items
+        return convert_radio_items(items)
 
     def song_radio_spin_count(
         self,
@@ -390,18 +1133,18 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> radio_spins = soundcharts.song_radio_spin_count(uuid="7d534228-5165-11e9-9375-549f35161576", radio_slugs=["nrj", "funradio"], country_code="FR", start_date="2019-01-01T00:00:00Z", end_date="2019-01-01T00:00:00Z", offset=0, limit=100)
         """
-        radio_slugs_str = ",".join(radio_slugs)
-        endpoint = f"/api/v2/song/{uuid}/broadcasts?radio_slugs={radio_slugs_str}&country_code={country_code}&start_date={start_date}&end_date={end_date}&offset={offset}&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "song_radio_spin_count",
+            uuid=uuid,
+            radio_slugs=radio_slugs,
+            country_code=country_code,
+            start_date=start_date,
+            end_date=end_date,
+            offset=offset,
+            limit=limit,
+        )
         items = response.get("items")
-
-        new_items = []
-        for item in items:
-            radio = item.get("radio")
-            item["radio"] = RadioStation(**radio)
-            new_items.append(item)
-
-        return new_items
+        return convert_radio_items(items)
 
     def artist(self, uuid: str) -> Artist:
         """
@@ -417,8 +1160,7 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> artist = soundcharts.artist(uuid="7d534228-5165-11e9-9375-549f35161576")
         """
-        endpoint: str = f"/api/v2.9/artist/{uuid}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("artist", uuid=uuid)
         # Get the artist object from the response
         artist: dict = response.get("object")
         artist: Artist = convert_json_to_artist_object(artist)
@@ -436,13 +1178,34 @@ class SoundCharts:
             artist (Artist): The artist object.
 
         """
-        endpoint: str = f"/api/v2.9/artist/by-platform/{platform}/{identifier}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_by_platform_id", platform=platform, identifier=identifier
+        )
         # Get the artist object from the response
         artist: dict = response.get("object")
         artist: Artist = convert_json_to_artist_object(artist)
+        if artist is not None:
+            self._index_identifiers(ARTIST, artist.uuid, [(platform, identifier)])
         return artist
 
+    def resolve_artist_uuid(self, platform: str, identifier: str) -> str:
+        """
+        Resolve a platform identifier to an artist UUID, from the client's identifier index when possible and otherwise
+        with artist_by_platform_id.
+
+        Args:
+            platform (str): The platform code (e.g.'spotify').
+            identifier (str): The platform-specific artist identifier.
+
+        Returns:
+            str: The UUID of the artist.
+        """
+        if self._index is not None:
+            uuid: Optional[str] = self._index.lookup(ARTIST, platform, identifier)
+            if uuid is not None:
+                return uuid
+        return self.artist_by_platform_id(platform=platform, identifier=identifier).uuid
+
     def artist_ids(
         self, uuid: str, platform: str = None, offset: int = 0, limit: int = 100
     ) -> list[PlatformIdentifier]:
@@ -462,10 +1225,16 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> platform_ids = soundcharts.artist_ids(uuid="7d534228-5165-11e9-9375-549f35161576", platform="spotify", limit=50)
         """
-        endpoint = f"/api/v2/artist/{uuid}/identifiers?platform={platform}&offset={offset}&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_ids", uuid=uuid, platform=platform, offset=offset, limit=limit
+        )
         items: list = response.get("items")
-        platform_identifiers = [PlatformIdentifier(**item) for item in items]
+        platform_identifiers = list(map(constructor(PlatformIdentifier), items))
+        self._index_identifiers(
+            ARTIST,
+            uuid,
+            [(item.platformCode, item.identifier) for item in platform_identifiers],
+        )
         return platform_identifiers
 
     def artist_songs(
@@ -493,8 +1262,14 @@ class SoundCharts:
             >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
             >>> songs = soundcharts.artist_songs(offset=0, limit=50)
         """
-        endpoint = f"/api/v2.21/artist/{uuid}/songs?offset={offset}&limit={limit}&sortBy={sort_by}&sortOrder={sort_order}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_songs",
+            uuid=uuid,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
         items: list = response.get("items")
         # Convert the release date to a datetime object
         for song in items:
@@ -502,7 +1277,7 @@ class SoundCharts:
             if release_date:
                 song["releaseDate"] = datetime.datetime.fromisoformat(release_date)
 
-        songs = [ArtistSongEntry(**item) for item in items]
+        songs = list(map(constructor(ArtistSongEntry), items))
         return songs
 
     def artist_albums(
@@ -528,11 +1303,17 @@ class SoundCharts:
             list[Album]: A list of albums associated with the artist.
 
         """
-
-        endpoint = f"/api/v2.34/artist/{uuid}/albums?offset={offset}&limit={limit}&sortBy={sort_by}&sortOrder={sort_order}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_albums",
+            uuid=uuid,
+            type=type,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
         albums: list[dict] = response.get("items")
-        albums: list[Album] = [Album(**item) for item in albums]
+        albums: list[Album] = list(map(constructor(Album), albums))
         return albums
 
     def artist_similar_artists(
@@ -550,10 +1331,11 @@ class SoundCharts:
         Returns:
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/related?offset={offset}&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_similar_artists", uuid=uuid, offset=offset, limit=limit
+        )
         items: list = response.get("items")
-        similar_artists: list[Artist] = [Artist(**item) for item in items]
+        similar_artists: list[Artist] = list(map(constructor(Artist), items))
         return similar_artists
 
     def artist_current_stats(self, uuid: str, period: int = 7) -> dict:
@@ -565,8 +1347,7 @@ class SoundCharts:
         Returns:
             dict: The current stats for the artist. "Social", "Popularity", "Retention", "Streaming" are main categories.
         """
-        endpoint = f"/api/v2/artist/{uuid}/current/stats"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("artist_current_stats", uuid=uuid, period=period)
         return response
 
     def artist_audience(
@@ -601,15 +1382,59 @@ class SoundCharts:
             list[AudienceData]: A list of audience data for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/audience/{platform}"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_audience",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         items = response.get("items")
-        audience_data_ls: list[AudienceData] = [AudienceData(**item) for item in items]
+        audience_data_ls: list[AudienceData] = list(map(constructor(AudienceData), items))
         return audience_data_ls
 
+    def artist_audience_by_platforms(
+        self,
+        uuid: str,
+        platforms: Iterable[str],
+        start_date: str = None,
+        end_date: str = None,
+        max_workers: int = None,
+        deadline: Optional[Deadline] = None,
+    ) -> PlatformAudience:
+        """
+        Retrieve audience data for an artist on several platforms at the same time, aligned on common dates.
+
+        A platform that fails (for example because the artist has no profile on it) is recorded in the result's
+        errors and does not fail the whole call.
+
+        Args:
+            uuid (str): The UUID of the artist.
+            platforms (Iterable[str]): The platform codes, e.g. ["instagram", "spotify", "tiktok", "youtube"].
+            start_date (str, optional): Period start date for the audience data (format 'YYYY-MM-DD'). Period cannot exceed 90 days
+            end_date (str, optional): Period end date for the audience data (format 'YYYY-MM-DD'). Period cannot exceed 90 days
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to one per platform.
+            deadline (Deadline, optional): When to stop waiting. Platforms not fetched in time are recorded in the
+                result's errors as DeadlineExceeded.
+
+        Returns:
+            PlatformAudience: The audience data with one column of AudienceData per platform.
+
+        Example:
+            >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+            >>> audience = soundcharts.artist_audience_by_platforms(uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396", platforms=["instagram", "spotify", "tiktok"])
+            >>> followers = audience.metric("instagram", "followerCount")
+        """
+        series, errors = fan_out(
+            lambda platform: self.artist_audience(
+                uuid=uuid, platform=platform, start_date=start_date, end_date=end_date
+            ),
+            platforms,
+            max_workers=max_workers,
+            deadline=deadline,
+        )
+        return PlatformAudience.align(uuid, series, errors)
+
     def artist_local_audience(
         self,
         uuid: str,
@@ -628,11 +1453,13 @@ class SoundCharts:
         Returns:
 
         """
-        endpoint = f"/api/v2.37/artist/{uuid}/social/{platform}/followers/"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_local_audience",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
 
     def artist_listeners_streams_views(
@@ -651,11 +1478,13 @@ class SoundCharts:
             dict: The number of listeners, streams, and views for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/streaming/{platform}/listening"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_listeners_streams_views",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
 
     def artist_spotify_monthly_listeners_latest(self, uuid: str) -> dict:
@@ -673,8 +1502,7 @@ class SoundCharts:
             dict: The number of monthly listeners for the artist on Spotify.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/streaming/spotify/listeners"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("artist_spotify_monthly_listeners_latest", uuid=uuid)
         return response
 
     def artist_spotify_monthly_listeners_by_month(
@@ -691,8 +1519,12 @@ class SoundCharts:
             dict: The number of monthly listeners for the artist on Spotify by month.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/streaming/spotify/listeners/{year}/{month}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_spotify_monthly_listeners_by_month",
+            uuid=uuid,
+            year=year,
+            month=month,
+        )
         return response
 
     def artist_retention(
@@ -726,11 +1558,13 @@ class SoundCharts:
             dict: The retention data for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/{platform}/retention"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_retention",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
 
     def artist_popularity(
@@ -753,11 +1587,13 @@ class SoundCharts:
             dict: The popularity data for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/popularity/{platform}"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_popularity",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
 
     def artist_audience_report_latest(self, uuid: str, platform: str = "instagram"):
@@ -779,8 +1615,9 @@ class SoundCharts:
             dict: The latest audience report for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/audience/{platform}/report/latest"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_audience_report_latest", uuid=uuid, platform=platform
+        )
         return response
 
     def artist_audience_report_dates(
@@ -814,15 +1651,15 @@ class SoundCharts:
             dict: The available dates for audience reports for the artist on the specified platform.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/audience/{platform}/report/available-dates"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_audience_report_dates",
+            uuid=uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
+            offset=offset,
+            limit=limit,
         )
-        if offset:
-            endpoint += f"&offset={offset}"
-        if limit:
-            endpoint += f"&limit={limit}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
 
     def artist_audience_report_by_date(
@@ -845,8 +1682,9 @@ class SoundCharts:
             dict: The audience report for the artist on the specified platform by date.
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/audience/{platform}/report/{date}"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get(
+            "artist_audience_report_by_date", uuid=uuid, platform=platform, date=date
+        )
         return response
 
     def artist_short_videos(
@@ -864,10 +1702,9 @@ class SoundCharts:
         Returns:
 
         """
-        endpoint = f"/api/v2/artist/{uuid}/shorts/{platform}/videos"
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
+        response: dict = self._get("artist_short_videos", uuid=uuid, platform=platform)
         items = response.get("items")
-        short_videos = [ShortVideo(**item) for item in items]
+        short_videos = list(map(constructor(ShortVideo), items))
         return short_videos
 
     def artist_short_video_audience(
@@ -886,9 +1723,34 @@ class SoundCharts:
         Returns:
 
         """
-        endpoint = f"/api/v2/artist/shorts/{identifier}/audience"
-        endpoint = check_and_add_start_and_end_date_to_query_params(
-            endpoint, start_date, end_date
+        response: dict = self._get(
+            "artist_short_video_audience",
+            identifier=identifier,
+            start_date=start_date,
+            end_date=end_date,
         )
-        response: dict = self._make_api_get_request(append_to_base_url=endpoint)
         return response
+
+
+def _traced(method):
+    """Wrap a client method so that, when the client has a tracer, each call is a span and the conversion of its
+    response a child span."""
+    name: str = method.__name__
+
+    @functools.wraps(method)
+    def traced(self: SoundCharts, *args, **kwargs):
+        tracer: Any = self.tracer
+        if tracer is None:
+            return method(self, *args, **kwargs)
+        with tracer.start_as_current_span(name, attributes={"soundcharts.method": name}):
+            with conversion_timer() as conversion_start:
+                result = method(self, *args, **kwargs)
+            if conversion_start[0] is not None:
+                tracer.start_span("convert", start_time=conversion_start[0]).end()
+            return result
+
+    return traced
+
+
+for _name in ENDPOINTS:
+    setattr(SoundCharts, _name, _traced(getattr(SoundCharts, _name)))
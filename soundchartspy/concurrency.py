@@ -0,0 +1,112 @@
+import threading
+import time
+from typing import Optional
+
+
+class AdaptiveConcurrency:
+    """
+    An adaptive limit on the number of requests in flight, shared by every thread using a client.
+
+    The limit follows additive increase, multiplicative decrease (AIMD): it grows by about one each time a full limit
+    of requests completes with a healthy latency, and is cut by backoff when a request is throttled (429), fails on
+    the server (5xx), times out, or takes more than latency_tolerance times the best latency seen recently. It is cut
+    at most once per round trip, so a burst of failures from requests sent together counts once.
+
+    Bulk, paginated and fan-out operations can then use more workers than the limit: requests beyond it wait for a
+    slot, and the controller finds the concurrency the API accepts at the time.
+
+    Example:
+        >>> concurrency = AdaptiveConcurrency(initial_limit=4, max_limit=64)
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", concurrency=concurrency)
+        >>> harvester = AudienceReportHarvester(soundcharts, AudienceReportStore("reports"), max_workers=64)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_decay: float = 0.01,
+    ):
+        """
+        Args:
+            initial_limit (int, optional): The starting number of requests in flight. Defaults to 4.
+            min_limit (int, optional): The lowest the limit can go. Defaults to 1.
+            max_limit (int, optional): The highest the limit can go. Defaults to 64.
+            backoff (float, optional): The factor the limit is multiplied by when backing off. Defaults to 0.5.
+            latency_tolerance (float, optional): How many times the best recent latency a request can take before
+                the API counts as overloaded. Defaults to 2.
+            latency_decay (float, optional): How fast the best latency drifts up towards the latencies observed,
+                so it follows the API when it gets slower for good. Defaults to 0.01.
+        """
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_decay = latency_decay
+        self._limit: float = float(initial_limit)
+        self._in_flight: int = 0
+        self._best_latency: Optional[float] = None
+        self._last_backoff: float = 0.0
+        self._condition = threading.Condition()
+        self.backoffs: int = 0
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a slot to send a request.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait. Defaults to waiting as long as needed.
+
+        Returns:
+            bool: Whether a slot was acquired, False if the timeout passed first.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout=timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False):
+        """
+        Free a slot and adjust the limit from how the request went.
+
+        Args:
+            latency (float, optional): The request's latency in seconds, or None if it says nothing about the API's
+                health, e.g. a request that failed on the client.
+            overloaded (bool, optional): Whether the request was throttled, failed on the server or timed out.
+        """
+        with self._condition:
+            in_use: int = self._in_flight
+            self._in_flight -= 1
+            now: float = time.monotonic()
+            if latency is not None and not overloaded:
+                if self._best_latency is None or latency < self._best_latency:
+                    self._best_latency = latency
+                else:
+                    self._best_latency += (latency - self._best_latency) * self.latency_decay
+                overloaded = latency > self._best_latency * self.latency_tolerance
+
+            if overloaded:
+                # Requests sent before the last backoff report on the old limit, do not back off again for them
+                if now - self._last_backoff > (self._best_latency or 0.0):
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_backoff = now
+                    self.backoffs += 1
+            elif latency is not None and in_use * 2 >= self._limit:
+                # Only grow a limit that is being used, or an idle client's limit would grow without bound
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
@@ -66,7 +66,7 @@ class Artist:
     gender: Optional[str] = None
     type: Optional[str] = None
     birthDate: Optional[datetime.datetime] = None
-    genres: Optional[list[str]] = None
+    genres: Optional[list["Genre"]] = None
 
 
 @dataclass
@@ -160,7 +160,7 @@ class Song:
         isrc (ISRC): The ISRC code for the song.
         creditName (str): The credited name for the song's release.
         artists (list[Artist]): A list of artists associated with the song.
-        releaseDate (str): The release date of the song in ISO format.
+        releaseDate (datetime.datetime): The release date of the song.
         copyright (str): The copyright information for the song.
         appUrl (str): The URL to the song on the SoundCharts platform.
         imageUrl (str): The URL to the song's cover image.
@@ -172,25 +172,27 @@ class Song:
         audio (Audio): The audio properties of the song.
         explicit (bool): Whether the song contains explicit content.
         languageCode (str): The language code of the song.
+
+    Only uuid and name are required, the API may leave out the other fields.
     """
 
     uuid: str
     name: str
-    isrc: ISRC
-    creditName: str
-    artists: list[Artist]
-    releaseDate: str
-    copyright: str
-    appUrl: str
-    imageUrl: str
-    duration: int
-    genres: list[Genre]
-    composers: list[str]
-    producers: list[str]
-    labels: list[Label]
-    audio: Audio
-    explicit: bool
-    languageCode: str
+    isrc: Optional[ISRC]
+    creditName: Optional[str]
+    artists: Optional[list[Artist]]
+    releaseDate: Optional[datetime.datetime]
+    copyright: Optional[str]
+    appUrl: Optional[str]
+    imageUrl: Optional[str]
+    duration: Optional[int]
+    genres: Optional[list[Genre]]
+    composers: Optional[list[str]]
+    producers: Optional[list[str]]
+    labels: Optional[list[Label]]
+    audio: Optional[Audio]
+    explicit: Optional[bool]
+    languageCode: Optional[str]
 
 
 @dataclass
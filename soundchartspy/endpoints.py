@@ -0,0 +1,361 @@
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Any, Optional
+from urllib.parse import quote, urlencode
+
+from soundchartspy.data import (
+    Song,
+    PlatformIdentifier,
+    Album,
+    Artist,
+    ArtistSongEntry,
+    AudienceData,
+    ShortVideo,
+)
+
+# Where the useful part of a response lives
+OBJECT = "object"  # response["object"], a single entity
+ITEMS = "items"  # response["items"], a list of entities
+DOCUMENT = "document"  # the whole response document is returned as is
+
+# How an endpoint is paginated
+OFFSET = "offset"
+
+# How long responses from an endpoint stay valid, see soundchartspy.cache
+IMMUTABLE = "immutable"  # never changes once published
+ENTITY = "entity"  # entity metadata that changes rarely
+HISTORY = "history"  # a date range, immutable once the range is closed and volatile otherwise
+VOLATILE = "volatile"  # current or latest values that change daily
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    Declarative description of a SoundCharts API endpoint.
+
+    Attributes:
+        name (str): The name of the client method backed by this endpoint.
+        path (str): The path template relative to the API version, e.g. '/song/{uuid}'.
+        version (str): The API version, e.g. 'v2.25'.
+        params (dict[str, str]): Maps the client method's keyword arguments to the query parameter names sent to the API.
+        shape (str): Where the result lives in the response, one of OBJECT, ITEMS or DOCUMENT.
+        pagination (str): The pagination style, OFFSET for offset/limit pagination or None.
+        model (type): The data class the result is converted to, or None if it is not converted to a single data class.
+        cache (str): The cache policy, one of IMMUTABLE, ENTITY, HISTORY or VOLATILE.
+        max_window_days (int): The longest date range a single request may cover, or None if there is no limit.
+    """
+
+    name: str
+    path: str
+    version: str = "v2"
+    params: dict[str, str] = field(default_factory=dict)
+    shape: str = DOCUMENT
+    pagination: Optional[str] = None
+    model: Optional[type] = None
+    cache: str = VOLATILE
+    max_window_days: Optional[int] = None
+
+    @property
+    def path_params(self) -> list[str]:
+        return [name for _, name, _, _ in Formatter().parse(self.path) if name]
+
+    @property
+    def template(self) -> str:
+        """The unformatted path including the API version, used to group requests to the same endpoint."""
+        return f"/api/{self.version}{self.path}"
+
+    def url(self, **kwargs: Any) -> str:
+        """
+        Build the canonical URL for a call to this endpoint, relative to the API base URL.
+
+        Path parameters are percent-encoded, query parameters that are None are dropped, booleans are sent as 0/1,
+        lists are comma separated, and query parameters are always emitted in sorted order, so the same logical query
+        always produces the same URL.
+
+        Args:
+            **kwargs: The client method's arguments, path parameters and query parameters alike.
+
+        Returns:
+            str: The URL, e.g. '/api/v2/song/{uuid}/albums?limit=100&offset=0'.
+
+        Raises:
+            TypeError: If an argument is not a parameter of the endpoint or a path parameter is missing.
+        """
+        path_params: dict = {}
+        for name in self.path_params:
+            value = kwargs.pop(name, None)
+            if value is None:
+                raise TypeError(f"{self.name}() missing path parameter '{name}'")
+            path_params[name] = quote(str(value), safe="")
+
+        query: list[tuple[str, str]] = []
+        for name, value in kwargs.items():
+            if name not in self.params:
+                raise TypeError(f"{self.name}() got an unexpected parameter '{name}'")
+            value = _canonical_query_value(value)
+            if value is not None:
+                query.append((self.params[name], value))
+        query.sort()
+
+        url: str = self.template.format(**path_params)
+        if query:
+            url += "?" + urlencode(query, quote_via=quote, safe=",")
+        return url
+
+
+def _canonical_query_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        values = sorted(str(v) for v in value) if isinstance(value, (set, frozenset)) else [str(v) for v in value]
+        return ",".join(values) if values else None
+    if value == "":
+        return None
+    return str(value)
+
+
+_PAGE = {"offset": "offset", "limit": "limit"}
+_SNAKE_SORT = {"sort_by": "sort_by", "sort_order": "sort_order"}
+_CAMEL_SORT = {"sort_by": "sortBy", "sort_order": "sortOrder"}
+_SNAKE_DATES = {"start_date": "start_date", "end_date": "end_date"}
+_CAMEL_DATES = {"start_date": "startDate", "end_date": "endDate"}
+_BROADCAST_PARAMS = {"radio_slugs": "radio_slugs", "country_code": "country_code", **_SNAKE_DATES, **_PAGE}
+
+_REGISTRY: list[Endpoint] = [
+    # Song endpoints
+    Endpoint("song", "/song/{uuid}", "v2.25", shape=OBJECT, model=Song, cache=ENTITY),
+    Endpoint("song_by_isrc", "/song/by-isrc/{isrc}", "v2.25", shape=OBJECT, model=Song, cache=ENTITY),
+    Endpoint(
+        "song_by_platform_id",
+        "/song/by-platform/{platform}/{identifier}",
+        "v2.25",
+        shape=OBJECT,
+        model=Song,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "song_ids",
+        "/song/{uuid}/identifiers",
+        params={"platform": "platform", **_PAGE},
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=PlatformIdentifier,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "song_albums",
+        "/song/{uuid}/albums",
+        params={"type": "type", **_PAGE, **_SNAKE_SORT},
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=Album,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "song_audience",
+        "/song/{uuid}/audience/{platform}",
+        params={**_SNAKE_DATES, "identifier": "identifier"},
+        shape=ITEMS,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "song_spotify_popularity",
+        "/song/{uuid}/spotify/identifier/popularity",
+        params=_SNAKE_DATES,
+        shape=ITEMS,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "song_chart_entries",
+        "/song/{uuid}/charts/ranks/{platform}",
+        params={"current_only": "current_only", **_PAGE, **_SNAKE_SORT},
+        shape=ITEMS,
+        pagination=OFFSET,
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "song_playlist_entries",
+        "/song/{uuid}/playlist/current/{platform}",
+        "v2.20",
+        params={"type": "type", **_PAGE, **_SNAKE_SORT},
+        shape=ITEMS,
+        pagination=OFFSET,
+        cache=VOLATILE,
+    ),
+    # The three broadcast methods share one endpoint, and so one URL and cache entry for the same parameters
+    Endpoint(
+        "song_broadcasts",
+        "/song/{uuid}/broadcasts",
+        params=_BROADCAST_PARAMS,
+        shape=ITEMS,
+        pagination=OFFSET,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "song_radio_spins",
+        "/song/{uuid}/broadcasts",
+        params=_BROADCAST_PARAMS,
+        shape=ITEMS,
+        pagination=OFFSET,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "song_radio_spin_count",
+        "/song/{uuid}/broadcasts",
+        params=_BROADCAST_PARAMS,
+        shape=ITEMS,
+        pagination=OFFSET,
+        cache=HISTORY,
+    ),
+    # Artist endpoints
+    Endpoint("artist", "/artist/{uuid}", "v2.9", shape=OBJECT, model=Artist, cache=ENTITY),
+    Endpoint(
+        "artist_by_platform_id",
+        "/artist/by-platform/{platform}/{identifier}",
+        "v2.9",
+        shape=OBJECT,
+        model=Artist,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "artist_ids",
+        "/artist/{uuid}/identifiers",
+        params={"platform": "platform", **_PAGE},
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=PlatformIdentifier,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "artist_songs",
+        "/artist/{uuid}/songs",
+        "v2.21",
+        params={**_PAGE, **_CAMEL_SORT},
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=ArtistSongEntry,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "artist_albums",
+        "/artist/{uuid}/albums",
+        "v2.34",
+        params={"type": "type", **_PAGE, **_CAMEL_SORT},
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=Album,
+        cache=ENTITY,
+    ),
+    Endpoint(
+        "artist_similar_artists",
+        "/artist/{uuid}/related",
+        params=_PAGE,
+        shape=ITEMS,
+        pagination=OFFSET,
+        model=Artist,
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "artist_current_stats",
+        "/artist/{uuid}/current/stats",
+        params={"period": "period"},
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "artist_audience",
+        "/artist/{uuid}/audience/{platform}",
+        params=_CAMEL_DATES,
+        shape=ITEMS,
+        model=AudienceData,
+        cache=HISTORY,
+        max_window_days=90,
+    ),
+    Endpoint(
+        "artist_local_audience",
+        "/artist/{uuid}/social/{platform}/followers/",
+        "v2.37",
+        params=_CAMEL_DATES,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_listeners_streams_views",
+        "/artist/{uuid}/streaming/{platform}/listening",
+        params=_CAMEL_DATES,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_spotify_monthly_listeners_latest",
+        "/artist/{uuid}/streaming/spotify/listeners",
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "artist_spotify_monthly_listeners_by_month",
+        "/artist/{uuid}/streaming/spotify/listeners/{year}/{month}",
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_retention",
+        "/artist/{uuid}/{platform}/retention",
+        params=_CAMEL_DATES,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_popularity",
+        "/artist/{uuid}/popularity/{platform}",
+        params=_CAMEL_DATES,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_audience_report_latest",
+        "/artist/{uuid}/audience/{platform}/report/latest",
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "artist_audience_report_dates",
+        "/artist/{uuid}/audience/{platform}/report/available-dates",
+        params={**_CAMEL_DATES, **_PAGE},
+        pagination=OFFSET,
+        cache=HISTORY,
+    ),
+    Endpoint(
+        "artist_audience_report_by_date",
+        "/artist/{uuid}/audience/{platform}/report/{date}",
+        cache=IMMUTABLE,
+    ),
+    Endpoint(
+        "artist_short_videos",
+        "/artist/{uuid}/shorts/{platform}/videos",
+        shape=ITEMS,
+        model=ShortVideo,
+        cache=VOLATILE,
+    ),
+    Endpoint(
+        "artist_short_video_audience",
+        "/artist/shorts/{identifier}/audience",
+        params=_CAMEL_DATES,
+        cache=HISTORY,
+    ),
+]
+
+ENDPOINTS: dict[str, Endpoint] = {endpoint.name: endpoint for endpoint in _REGISTRY}
+
+
+def get_endpoint(name: str) -> Endpoint:
+    """
+    Look up an endpoint by the name of the client method it backs.
+
+    Args:
+        name (str): The client method name, e.g. 'song'.
+
+    Returns:
+        Endpoint: The registered endpoint.
+
+    Raises:
+        KeyError: If no endpoint is registered under that name.
+    """
+    try:
+        return ENDPOINTS[name]
+    except KeyError:
+        raise KeyError(f"No SoundCharts endpoint registered for '{name}'") from None
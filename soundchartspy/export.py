@@ -0,0 +1,246 @@
+import dataclasses
+import datetime
+import functools
+import itertools
+import json
+import types
+import typing
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for exporting
+    pa = None
+    pq = None
+
+# A data class, or a tuple of data classes for methods returning pairs such as (Playlist, PlaylistPosition)
+Model = Union[type, tuple[type, ...]]
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "Exporting requires pyarrow, install it with 'pip install soundchartspy[export]'"
+        )
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+        # Other unions, e.g. RadioStation | str, are exported as strings
+        return str
+    return annotation
+
+
+def _column_name(model: type) -> str:
+    return model.__name__[0].lower() + model.__name__[1:]
+
+
+def _arrow_type(annotation: Any) -> "pa.DataType":
+    annotation = _unwrap_optional(annotation)
+    if dataclasses.is_dataclass(annotation):
+        return pa.struct(_arrow_fields(annotation))
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation) or (str,)
+        return pa.list_(_arrow_type(item))
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation is datetime.datetime:
+        return pa.timestamp("us", tz="UTC")
+    # Strings, and free-form dictionaries which are exported as JSON text
+    return pa.string()
+
+
+def _arrow_fields(model: type) -> list["pa.Field"]:
+    hints: dict = typing.get_type_hints(model)
+    return [pa.field(f.name, _arrow_type(hints[f.name])) for f in dataclasses.fields(model)]
+
+
+def _to_datetime(value: Any) -> Optional[datetime.datetime]:
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if dataclasses.is_dataclass(value):
+        return json.dumps(dataclasses.asdict(value), default=str)
+    return str(value)
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Build a function converting a value of the annotated type to what pyarrow expects for its column type.
+    """
+    annotation = _unwrap_optional(annotation)
+    if dataclasses.is_dataclass(annotation):
+        return _dataclass_converter(annotation)
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation) or (str,)
+        convert_item = _converter(item)
+        return lambda value: None if value is None else [convert_item(v) for v in value]
+    if annotation is datetime.datetime:
+        return _to_datetime
+    if annotation in (bool, int, float):
+        return lambda value: value
+    return _to_string
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_converter(model: type) -> Callable[[Any], Optional[dict]]:
+    hints: dict = typing.get_type_hints(model)
+    converters: list[tuple[str, Callable]] = [
+        (f.name, _converter(hints[f.name])) for f in dataclasses.fields(model)
+    ]
+
+    def convert(value: Any) -> Optional[dict]:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            return {name: convert_field(value.get(name)) for name, convert_field in converters}
+        return {name: convert_field(getattr(value, name)) for name, convert_field in converters}
+
+    return convert
+
+
+@functools.lru_cache(maxsize=None)
+def schema_for(model: Model) -> "pa.Schema":
+    """
+    Get the fixed Arrow schema for a data class, or for a tuple of data classes.
+
+    Fields map to Arrow types from their annotations: nested data classes such as ISRC or Audio become structs,
+    lists such as list[Genre] or list[Label] become lists of structs, datetimes become UTC timestamps and free-form
+    dictionaries become JSON strings. A tuple of data classes gets one struct column per class, e.g.
+    (Playlist, PlaylistPosition) has the columns 'playlist' and 'playlistPosition'.
+
+    Args:
+        model (type | tuple[type, ...]): The data class, e.g. Song, or a tuple of data classes.
+
+    Returns:
+        pa.Schema: The schema.
+    """
+    _require_pyarrow()
+    if isinstance(model, tuple):
+        return pa.schema(
+            [pa.field(_column_name(m), pa.struct(_arrow_fields(m))) for m in model]
+        )
+    return pa.schema(_arrow_fields(model))
+
+
+def _row_converter(model: Model) -> Callable[[Any], dict]:
+    if isinstance(model, tuple):
+        columns = [(_column_name(m), _dataclass_converter(m)) for m in model]
+        return lambda pair: {name: convert(value) for (name, convert), value in zip(columns, pair)}
+    return _dataclass_converter(model)
+
+
+def _model_of(item: Any) -> Model:
+    if isinstance(item, tuple):
+        return tuple(type(value) for value in item)
+    return type(item)
+
+
+def iter_record_batches(
+    items: Iterable, model: Optional[Model] = None, batch_size: int = 10_000
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert a list or iterator of models to Arrow record batches, holding at most one batch of items at a time.
+
+    Args:
+        items (Iterable): The models, e.g. the result of a client method or an iterator from SoundCharts.paginate.
+        model (type | tuple[type, ...], optional): The model type. Defaults to the type of the first item.
+        batch_size (int, optional): The number of rows per batch. Defaults to 10,000.
+
+    Yields:
+        pa.RecordBatch: Record batches with the model's fixed schema.
+    """
+    _require_pyarrow()
+    items = iter(items)
+    if model is None:
+        first = next(items, None)
+        if first is None:
+            return
+        model = _model_of(first)
+        items = itertools.chain([first], items)
+
+    schema: "pa.Schema" = schema_for(model)
+    convert: Callable[[Any], dict] = _row_converter(model)
+    while True:
+        rows: list[dict] = [convert(item) for item in itertools.islice(items, batch_size)]
+        if not rows:
+            return
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def to_table(items: Iterable, model: Optional[Model] = None) -> "pa.Table":
+    """
+    Convert a list or iterator of models to an Arrow table.
+
+    Args:
+        items (Iterable): The models.
+        model (type | tuple[type, ...], optional): The model type. Required if items may be empty.
+
+    Returns:
+        pa.Table: The table.
+    """
+    batches: list = list(iter_record_batches(items, model))
+    if not batches:
+        if model is None:
+            raise ValueError("model is required to export an empty list")
+        return schema_for(model).empty_table()
+    return pa.Table.from_batches(batches)
+
+
+def write_parquet(
+    items: Iterable,
+    path: str,
+    model: Optional[Model] = None,
+    batch_size: int = 10_000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write a list or iterator of models to a Parquet file in chunks, without holding every model in memory.
+
+    Args:
+        items (Iterable): The models.
+        path (str): The path of the Parquet file.
+        model (type | tuple[type, ...], optional): The model type. Defaults to the type of the first item, and is
+            required to write an empty file.
+        batch_size (int, optional): The number of rows per row group. Defaults to 10,000.
+        compression (str, optional): The Parquet compression codec. Defaults to 'zstd'.
+
+    Returns:
+        int: The number of rows written.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> write_parquet(soundcharts.paginate("artist_albums", uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396"), "albums.parquet")
+    """
+    _require_pyarrow()
+    batches: Iterator = iter_record_batches(items, model, batch_size)
+    first = next(batches, None)
+    if first is None:
+        if model is None:
+            raise ValueError("model is required to export an empty list")
+        pq.write_table(schema_for(model).empty_table(), path, compression=compression)
+        return 0
+
+    rows: int = 0
+    with pq.ParquetWriter(path, first.schema, compression=compression) as writer:
+        for batch in itertools.chain([first], batches):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
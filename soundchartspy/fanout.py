@@ -0,0 +1,132 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar
+
+from soundchartspy.timeouts import Deadline, submit
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def fan_out(
+    call: Callable[[K], V],
+    keys: Iterable[K],
+    max_workers: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> tuple[dict[K, V], dict[K, Exception]]:
+    """
+    Call a function for every key concurrently, isolating failures so one failing key does not affect the others.
+
+    When a deadline is given and expires, calls that have not finished are cancelled and recorded as
+    DeadlineExceeded errors, and the deadline is marked as exceeded.
+
+    Args:
+        call (Callable): The function to call with each key.
+        keys (Iterable): The keys. Duplicates are only called once.
+        max_workers (int, optional): The maximum number of concurrent calls. Defaults to one per key.
+        deadline (Deadline, optional): When to stop waiting for calls.
+
+    Returns:
+        tuple[dict, dict]: The results and the exceptions raised, both keyed by key.
+    """
+    keys = list(dict.fromkeys(keys))
+    results: dict = {}
+    errors: dict = {}
+    if not keys:
+        return results, errors
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(keys))
+    try:
+        futures = {key: submit(executor, call, key, deadline=deadline) for key in keys}
+        done, _ = wait(futures.values(), timeout=None if deadline is None else deadline.remaining())
+        for key, future in futures.items():
+            if future not in done:
+                future.cancel()
+                errors[key] = deadline.exceed()
+                continue
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+    finally:
+        # Calls still running past the deadline have their requests' timeouts cut to it, do not wait for them
+        executor.shutdown(wait=deadline is None, cancel_futures=True)
+    return results, errors
+
+
+def _day(value: Any) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+@dataclass
+class PlatformAudience:
+    """
+    Audience data for one song or artist across several platforms, aligned on a common list of dates.
+
+    Attributes:
+        uuid (str): The UUID of the song or artist.
+        dates (list[datetime.date]): Every date with data on at least one platform, in ascending order.
+        columns (dict[str, list]): For each platform, its data point for each date in dates, or None where the
+            platform has no data for that date. Data points are AudienceData for artists and dictionaries for songs.
+        errors (dict[str, Exception]): The error raised for each platform that could not be fetched.
+    """
+
+    uuid: str
+    dates: list[datetime.date] = field(default_factory=list)
+    columns: dict[str, list] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @classmethod
+    def align(
+        cls, uuid: str, series: dict[str, list], errors: dict[str, Exception]
+    ) -> "PlatformAudience":
+        """
+        Build a PlatformAudience from each platform's list of data points.
+
+        Args:
+            uuid (str): The UUID of the song or artist.
+            series (dict[str, list]): Data points keyed by platform. Each has a date, as an attribute or a 'date' key.
+            errors (dict[str, Exception]): Errors keyed by platform.
+
+        Returns:
+            PlatformAudience: The aligned audience.
+        """
+        by_date: dict[str, dict[datetime.date, Any]] = {}
+        for platform, points in series.items():
+            by_date[platform] = {
+                _day(point["date"] if isinstance(point, dict) else point.date): point
+                for point in points or []
+            }
+
+        dates: list[datetime.date] = sorted(set().union(*by_date.values()))
+        columns: dict[str, list] = {
+            platform: [points.get(date) for date in dates]
+            for platform, points in by_date.items()
+        }
+        return cls(uuid=uuid, dates=dates, columns=columns, errors=errors)
+
+    def metric(self, platform: str, name: str) -> list[Optional[Any]]:
+        """
+        Get one metric for a platform, aligned with dates.
+
+        Args:
+            platform (str): The platform code.
+            name (str): The metric name, e.g. 'followerCount'.
+
+        Returns:
+            list: The metric value for each date, or None where there is no data.
+        """
+        values: list = []
+        for point in self.columns[platform]:
+            if point is None:
+                values.append(None)
+            elif isinstance(point, dict):
+                values.append(point.get(name))
+            else:
+                values.append(getattr(point, name, None))
+        return values
@@ -0,0 +1,194 @@
+import logging
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, Optional
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.data import Artist
+from soundchartspy.scheduler import bulk_priority
+from soundchartspy.timeouts import Deadline, submit
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for to_csr
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class SimilarArtistCrawler:
+    """
+    Breadth-first crawler of the similar artists ("Fans Also Like") graph.
+
+    Artists are expanded concurrently with a bounded number of requests in flight. Every artist is visited at most
+    once, and edges are streamed out as they are found. Nodes are numbered as they are discovered and edges are kept
+    as two compact integer arrays, so memory stays proportional to the graph rather than to the artist objects.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> crawler = SimilarArtistCrawler(soundcharts, max_depth=2, max_nodes=10_000)
+        >>> for source, target in crawler.crawl(["11e81bcc-9c1c-ce38-b96b-a0369fe50396"]):
+        ...     print(source, target)
+        >>> indptr, indices = crawler.to_csr()
+    """
+
+    def __init__(
+        self,
+        client: SoundCharts,
+        max_depth: int = 2,
+        max_nodes: int = 100_000,
+        max_workers: int = 8,
+    ):
+        """
+        Args:
+            client (SoundCharts): The client used to make requests.
+            max_depth (int, optional): The number of hops to expand from the seeds. Defaults to 2.
+            max_nodes (int, optional): The maximum number of artists in the graph. Defaults to 100,000.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        """
+        self._client = client
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self._max_workers = max_workers
+        self._ids: dict[str, int] = {}
+        self._uuids: list[str] = []
+        self._sources = array("I")
+        self._targets = array("I")
+        self.errors: dict[str, Exception] = {}
+
+    @property
+    def nodes(self) -> list[str]:
+        """The UUIDs of every artist discovered, indexed by node number."""
+        return self._uuids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._sources)
+
+    def node_id(self, uuid: str) -> int:
+        """
+        Get the node number of an artist.
+
+        Args:
+            uuid (str): The UUID of the artist.
+
+        Returns:
+            int: The node number, an index into nodes and the CSR arrays.
+        """
+        return self._ids[uuid]
+
+    def _add_node(self, uuid: str) -> int:
+        node: int = len(self._uuids)
+        self._ids[uuid] = node
+        self._uuids.append(uuid)
+        return node
+
+    def _similar_artists(self, uuid: str) -> list[Artist]:
+        return list(self._client.paginate("artist_similar_artists", uuid))
+
+    def _expand(
+        self, executor: ThreadPoolExecutor, frontier: list[str], deadline: Optional[Deadline] = None
+    ) -> Iterator[tuple[str, list[Artist]]]:
+        # Keep a bounded window of requests in flight rather than submitting the whole frontier at once
+        window: int = self._max_workers * 2
+        pending: dict[Future, str] = {}
+        uuids: Iterator[str] = iter(frontier)
+
+        while True:
+            for uuid in uuids:
+                # Workers run in a copy of the caller's context, with bulk priority unless another one is set
+                with bulk_priority("artist_similar_artists"):
+                    future: Future = submit(executor, self._similar_artists, uuid, deadline=deadline)
+                pending[future] = uuid
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+
+            done, _ = wait(
+                pending,
+                timeout=None if deadline is None else deadline.remaining(),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                # The deadline passed, the artists still pending are not expanded
+                for future, uuid in pending.items():
+                    future.cancel()
+                    self.errors[uuid] = deadline.exceed()
+                return
+            for future in done:
+                uuid = pending.pop(future)
+                try:
+                    yield uuid, future.result()
+                except Exception as e:
+                    logger.warning(f"Could not get similar artists for {uuid}: {e}")
+                    self.errors[uuid] = e
+
+    def crawl(self, seeds: Iterable[str], deadline: Optional[Deadline] = None) -> Iterator[tuple[str, str]]:
+        """
+        Crawl the similar artists graph breadth first from the seed artists. Requests are made with bulk priority
+        unless another priority is set.
+
+        When a deadline is given and expires, the crawl stops with the edges found so far, the artists whose
+        expansion did not finish are recorded in errors and the deadline is marked as exceeded.
+
+        Args:
+            seeds (Iterable[str]): The UUIDs of the artists to start from.
+            deadline (Deadline, optional): When to stop crawling.
+
+        Yields:
+            tuple[str, str]: A (source, target) edge for each similar artist found.
+        """
+        frontier: list[str] = []
+        for uuid in seeds:
+            if uuid not in self._ids:
+                self._add_node(uuid)
+                frontier.append(uuid)
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            depth: int = 0
+            while frontier and depth < self._max_depth:
+                if deadline is not None and deadline.exceeded:
+                    return
+                next_frontier: list[str] = []
+                for uuid, similar_artists in self._expand(executor, frontier, deadline):
+                    source: int = self._ids[uuid]
+                    for artist in similar_artists:
+                        target = self._ids.get(artist.uuid)
+                        if target is None:
+                            if len(self._uuids) >= self._max_nodes:
+                                continue
+                            target = self._add_node(artist.uuid)
+                            next_frontier.append(artist.uuid)
+                        self._sources.append(source)
+                        self._targets.append(target)
+                        yield uuid, artist.uuid
+                frontier = next_frontier
+                depth += 1
+        finally:
+            # Requests still running past the deadline have their timeouts cut to it, do not wait for them
+            executor.shutdown(wait=deadline is None, cancel_futures=True)
+
+    def to_csr(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Get the adjacency of the crawled graph in compressed sparse row form.
+
+        The targets of node i are indices[indptr[i]:indptr[i + 1]], node numbers map to UUIDs through nodes.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The indptr and indices arrays.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "to_csr requires numpy, install it with 'pip install soundchartspy[analytics]'"
+            )
+        sources = np.frombuffer(self._sources, dtype=np.uint32) if self._sources else np.empty(0, np.uint32)
+        targets = np.frombuffer(self._targets, dtype=np.uint32) if self._targets else np.empty(0, np.uint32)
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(len(self._uuids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(self._uuids)), out=indptr[1:])
+        return indptr, targets[order]
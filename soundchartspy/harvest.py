@@ -0,0 +1,248 @@
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.scheduler import bulk_priority
+from soundchartspy.timeouts import Deadline, submit
+
+logger = logging.getLogger(__name__)
+
+AUDIENCE_REPORT_PLATFORMS: tuple[str, ...] = ("instagram", "youtube", "tiktok")
+
+
+class AudienceReportStore:
+    """
+    A permanent on-disk store of artist audience reports, one JSON file per artist, platform and date.
+
+    Monthly demographic reports do not change once published, so stored reports never expire.
+    Files are laid out as '{directory}/{platform}/{uuid}/{YYYY-MM-DD}.json'.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory (str): The root directory of the store. It is created if it does not exist.
+        """
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, uuid: str, platform: str, date: str) -> str:
+        return os.path.join(self._directory, platform, uuid, f"{date}.json")
+
+    def has(self, uuid: str, platform: str, date: str) -> bool:
+        return os.path.exists(self._path(uuid, platform, date))
+
+    def dates(self, uuid: str, platform: str) -> set[str]:
+        """
+        Get the dates of every report stored for an artist on a platform.
+
+        Args:
+            uuid (str): The UUID of the artist.
+            platform (str): The platform code.
+
+        Returns:
+            set[str]: The stored report dates (format 'YYYY-MM-DD').
+        """
+        directory: str = os.path.join(self._directory, platform, uuid)
+        if not os.path.isdir(directory):
+            return set()
+        return {name[:-5] for name in os.listdir(directory) if name.endswith(".json")}
+
+    def get(self, uuid: str, platform: str, date: str) -> Optional[dict]:
+        path: str = self._path(uuid, platform, date)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as report_file:
+            return json.load(report_file)
+
+    def put(self, uuid: str, platform: str, date: str, report: dict):
+        """
+        Store a report. The file is written atomically so a crash never leaves a partial report behind.
+
+        Args:
+            uuid (str): The UUID of the artist.
+            platform (str): The platform code.
+            date (str): The report date (format 'YYYY-MM-DD').
+            report (dict): The report as returned by SoundCharts.artist_audience_report_by_date.
+        """
+        path: str = self._path(uuid, platform, date)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as report_file:
+                json.dump(report, report_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+@dataclass
+class HarvestSummary:
+    """
+    The outcome of an audience report harvest.
+
+    Attributes:
+        fetched (list[tuple[str, str, str]]): The (uuid, platform, date) reports fetched and stored by this run.
+        skipped (int): The number of available reports that were already stored and not requested again.
+        errors (dict[tuple, Exception]): Errors keyed by (uuid, platform) for date listings or (uuid, platform, date) for reports.
+        deadline_exceeded (bool): Whether the harvest was stopped by its deadline, leaving reports to fetch.
+    """
+
+    fetched: list[tuple[str, str, str]] = field(default_factory=list)
+    skipped: int = 0
+    errors: dict[tuple, Exception] = field(default_factory=dict)
+    deadline_exceeded: bool = False
+
+
+def _remaining(deadline: Optional[Deadline]) -> Optional[float]:
+    return None if deadline is None else deadline.remaining()
+
+
+def _report_date(item) -> str:
+    # Available dates are returned either as plain date strings or as objects with a date field
+    date = item.get("date") if isinstance(item, dict) else item
+    return str(date)[:10]
+
+
+class AudienceReportHarvester:
+    """
+    Harvests artist audience reports, requesting only the dates SoundCharts has reports for and that are not already
+    stored locally.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> harvester = AudienceReportHarvester(soundcharts, AudienceReportStore("reports"), max_workers=8)
+        >>> summary = harvester.harvest(["11e81bcc-9c1c-ce38-b96b-a0369fe50396"], platforms=["instagram", "tiktok"])
+    """
+
+    def __init__(
+        self, client: SoundCharts, store: AudienceReportStore, max_workers: int = 8
+    ):
+        """
+        Args:
+            client (SoundCharts): The client used to make requests.
+            store (AudienceReportStore): Where reports are stored.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        """
+        self._client = client
+        self._store = store
+        self._max_workers = max_workers
+
+    def available_dates(
+        self,
+        uuid: str,
+        platform: str,
+        start_date: str = None,
+        end_date: str = None,
+    ) -> list[str]:
+        """
+        Page through every available audience report date for an artist on a platform.
+
+        Args:
+            uuid (str): The UUID of the artist.
+            platform (str): The platform code.
+            start_date (str, optional): The start date (format 'YYYY-MM-DD').
+            end_date (str, optional): The end date (format 'YYYY-MM-DD').
+
+        Returns:
+            list[str]: The available report dates (format 'YYYY-MM-DD').
+        """
+        items = self._client.paginate(
+            "artist_audience_report_dates",
+            uuid,
+            platform=platform,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return [_report_date(item) for item in items]
+
+    def _fetch(self, uuid: str, platform: str, date: str) -> dict:
+        with bulk_priority("artist_audience_report_by_date"):
+            report: dict = self._client.artist_audience_report_by_date(
+                uuid=uuid, platform=platform, date=date
+            )
+        self._store.put(uuid, platform, date, report)
+        return report
+
+    def harvest(
+        self,
+        uuids: Iterable[str],
+        platforms: Iterable[str] = AUDIENCE_REPORT_PLATFORMS,
+        start_date: str = None,
+        end_date: str = None,
+        deadline: Optional[Deadline] = None,
+    ) -> HarvestSummary:
+        """
+        Fetch and store every available audience report that is not already stored, for each artist and platform.
+
+        Date listings and report fetches run concurrently. A failure for one artist, platform or date, whether a
+        request error or a report that cannot be stored, is recorded in the summary's errors and does not stop the
+        rest of the harvest. Failed reports are not stored, so a later harvest requests them again. When a deadline
+        is given and expires, outstanding requests are cancelled and the reports stored so far are returned in a
+        summary marked deadline_exceeded; a later harvest picks up the rest.
+
+        Args:
+            uuids (Iterable[str]): The UUIDs of the artists.
+            platforms (Iterable[str], optional): The platform codes. Defaults to instagram, youtube and tiktok.
+            start_date (str, optional): Only harvest reports from this date (format 'YYYY-MM-DD').
+            end_date (str, optional): Only harvest reports up to this date (format 'YYYY-MM-DD').
+            deadline (Deadline, optional): When to stop the harvest.
+
+        Returns:
+            HarvestSummary: The reports fetched, the number skipped and any errors.
+        """
+        summary = HarvestSummary()
+        platforms = list(platforms)
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            listings: dict[Future, tuple[str, str]] = {
+                submit(
+                    executor, self.available_dates, uuid, platform, start_date, end_date, deadline=deadline
+                ): (uuid, platform)
+                for uuid in uuids
+                for platform in platforms
+            }
+            reports: dict[Future, tuple[str, str, str]] = {}
+
+            for future in as_completed(listings, timeout=_remaining(deadline)):
+                uuid, platform = listings[future]
+                try:
+                    dates: list[str] = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not list audience report dates for {uuid} on {platform}: {e}")
+                    summary.errors[(uuid, platform)] = e
+                    continue
+
+                stored: set[str] = self._store.dates(uuid, platform)
+                for date in dict.fromkeys(dates):
+                    if date in stored:
+                        summary.skipped += 1
+                        continue
+                    future = submit(executor, self._fetch, uuid, platform, date, deadline=deadline)
+                    reports[future] = (uuid, platform, date)
+
+            for future in as_completed(reports, timeout=_remaining(deadline)):
+                key: tuple[str, str, str] = reports[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    # Anything from a request failure to a malformed report only fails this report
+                    logger.warning(f"Could not fetch audience report {key}: {e}")
+                    summary.errors[key] = e
+                    continue
+                summary.fetched.append(key)
+        except FuturesTimeoutError:
+            deadline.exceed()
+        finally:
+            executor.shutdown(wait=deadline is None, cancel_futures=True)
+
+        summary.deadline_exceeded = deadline is not None and deadline.exceeded
+        return summary
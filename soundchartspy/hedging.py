@@ -0,0 +1,102 @@
+import collections
+import math
+import threading
+from typing import Optional
+
+
+class HedgePolicy:
+    """
+    When to hedge a request: send a second, identical request if the first has not completed after the latency
+    observed for most requests to the same endpoint.
+
+    Every SoundCharts endpoint is an idempotent GET, so whichever request completes first can be used. The other
+    request is only cancelled if it has not been sent yet, otherwise its response is discarded. Hedges cost quota, so
+    their number is capped at a fraction of all requests.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", hedging=HedgePolicy(max_rate=0.05))
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        max_rate: float = 0.05,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500,
+        max_workers: int = 16,
+        max_requests: int = 64,
+    ):
+        """
+        Args:
+            quantile (float, optional): The latency quantile after which a request is hedged. Defaults to the p95.
+            max_rate (float, optional): The maximum number of hedges as a fraction of requests. Defaults to 5%.
+            min_delay (float, optional): The minimum number of seconds to wait before hedging. Defaults to 0.05.
+            min_samples (int, optional): The number of latencies observed for an endpoint before its requests are
+                hedged. Defaults to 20.
+            window (int, optional): The number of most recent latencies kept per endpoint. Defaults to 500.
+            max_workers (int, optional): The maximum number of hedges in flight. Defaults to 16.
+            max_requests (int, optional): The maximum number of primary requests in flight, further requests wait
+                for one to complete. The threads running them are reused, with their connections. Defaults to 64.
+        """
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.quantile = quantile
+        self.max_rate = max_rate
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.max_requests = max_requests
+        self._window = window
+        self._latencies: dict[str, collections.deque] = {}
+        self._lock = threading.Lock()
+        self.requests: int = 0
+        self.hedges: int = 0
+
+    def observe(self, endpoint: str, seconds: float):
+        """
+        Record the latency of a successful request.
+
+        Args:
+            endpoint (str): The endpoint's path template, e.g. '/api/v2.25/song/{uuid}'.
+            seconds (float): The latency in seconds.
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = collections.deque(maxlen=self._window)
+            latencies.append(seconds)
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Get how long to wait for a request to an endpoint before hedging it.
+
+        Args:
+            endpoint (str): The endpoint's path template, e.g. '/api/v2.25/song/{uuid}'.
+
+        Returns:
+            float: The delay in seconds, or None if too few latencies have been observed to hedge.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(endpoint, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        index: int = min(len(latencies) - 1, math.ceil(self.quantile * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+
+    def start_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_hedge(self) -> bool:
+        """
+        Reserve a hedge if it keeps hedges within max_rate of requests.
+
+        Returns:
+            bool: Whether the request may be hedged.
+        """
+        with self._lock:
+            if self.hedges + 1 > self.max_rate * self.requests:
+                return False
+            self.hedges += 1
+            return True
@@ -0,0 +1,117 @@
+import sqlite3
+import threading
+from typing import Iterable, Optional
+
+SONG = "song"
+ARTIST = "artist"
+
+# ISRCs are stored as identifiers on this pseudo platform
+ISRC_PLATFORM = "isrc"
+
+
+class IdentifierIndex:
+    """
+    A persistent index from ISRCs and platform identifiers to SoundCharts UUIDs, stored in SQLite.
+
+    When passed to the client the index is filled as a side effect of song, song_by_isrc, song_by_platform_id,
+    song_ids, artist_by_platform_id and artist_ids, and SoundCharts.resolve_song_uuid and
+    SoundCharts.resolve_artist_uuid answer from it without a request. Resolved mappings are also held in memory so
+    repeated lookups are dictionary lookups.
+
+    Example:
+        >>> index = IdentifierIndex("identifiers.sqlite")
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", index=index)
+        >>> uuid = soundcharts.resolve_song_uuid(isrc="USAT22003425")
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path (str, optional): The SQLite database file. Defaults to an in-memory database.
+        """
+        self._lock = threading.Lock()
+        self._memo: dict[tuple[str, str, str], str] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS identifiers (kind TEXT NOT NULL, platform TEXT NOT NULL, "
+                "identifier TEXT NOT NULL, uuid TEXT NOT NULL, PRIMARY KEY (kind, platform, identifier))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS identifiers_by_uuid ON identifiers (kind, uuid)"
+            )
+
+    def add(self, kind: str, uuid: str, identifiers: Iterable[tuple[str, str]]):
+        """
+        Record the platform identifiers of a song or artist.
+
+        Args:
+            kind (str): SONG or ARTIST.
+            uuid (str): The SoundCharts UUID.
+            identifiers (Iterable[tuple[str, str]]): (platform, identifier) pairs, use ISRC_PLATFORM for ISRCs.
+        """
+        rows: list[tuple[str, str, str, str]] = [
+            (kind, platform, str(identifier), uuid)
+            for platform, identifier in identifiers
+            if platform and identifier
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO identifiers (kind, platform, identifier, uuid) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            for kind, platform, identifier, uuid in rows:
+                self._memo[(kind, platform, identifier)] = uuid
+
+    def lookup(self, kind: str, platform: str, identifier: str) -> Optional[str]:
+        """
+        Resolve a platform identifier to a SoundCharts UUID.
+
+        Args:
+            kind (str): SONG or ARTIST.
+            platform (str): The platform code, or ISRC_PLATFORM for an ISRC.
+            identifier (str): The platform identifier or ISRC.
+
+        Returns:
+            str: The UUID, or None if the identifier is not in the index.
+        """
+        key: tuple[str, str, str] = (kind, platform, identifier)
+        with self._lock:
+            uuid: Optional[str] = self._memo.get(key)
+            if uuid is not None:
+                return uuid
+            row = self._connection.execute(
+                "SELECT uuid FROM identifiers WHERE kind = ? AND platform = ? AND identifier = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._memo[key] = row[0]
+            return row[0]
+
+    def identifiers(self, kind: str, uuid: str) -> dict[str, list[str]]:
+        """
+        Get every identifier recorded for a song or artist.
+
+        Args:
+            kind (str): SONG or ARTIST.
+            uuid (str): The SoundCharts UUID.
+
+        Returns:
+            dict[str, list[str]]: Identifiers keyed by platform code.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT platform, identifier FROM identifiers WHERE kind = ? AND uuid = ? ORDER BY platform, identifier",
+                (kind, uuid),
+            ).fetchall()
+        identifiers: dict[str, list[str]] = {}
+        for platform, identifier in rows:
+            identifiers.setdefault(platform, []).append(identifier)
+        return identifiers
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM identifiers").fetchone()[0]
@@ -0,0 +1,165 @@
+import contextlib
+import os
+import struct
+import threading
+import time
+from typing import Iterator, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # fcntl is only available on Unix
+    fcntl = None
+
+QUOTA_HEADER: str = "x-quota-remaining"
+
+# tokens, refilled at (Unix time), quota remaining (-1 if unknown), quota updated at (Unix time)
+_RECORD = struct.Struct("<ddqd")
+
+
+class QuotaLedger:
+    """
+    A rate limit and quota view shared by every client on a host, kept in a small file.
+
+    Every process opening the same file shares one token bucket, refilled at rate tokens per second, and the
+    quota remaining last reported by the API in its 'x-quota-remaining' header. Updates are made under an exclusive
+    file lock, so they are atomic across processes, and under a thread lock, as the file lock does not exclude the
+    threads sharing the ledger.
+
+    Example:
+        >>> ledger = QuotaLedger("/var/run/soundcharts.ledger", rate=10)
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", ledger=ledger)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        burst: Optional[int] = None,
+        quota_settle_seconds: float = 60.0,
+    ):
+        """
+        Args:
+            path (str): The path of the ledger file, the same for every process. It is created if it does not exist.
+            rate (float): The maximum number of requests per second, for all processes together.
+            burst (int, optional): The maximum number of requests sent at once after a quiet period. Defaults to
+                one second's worth of requests.
+            quota_settle_seconds (float, optional): For how long a reported quota is kept over higher ones reported
+                by responses that arrive out of order. Defaults to 60.
+
+        Raises:
+            ImportError: If file locking is not available on this platform.
+        """
+        if fcntl is None:
+            raise ImportError("QuotaLedger requires fcntl, which is only available on Unix")
+        self.path = path
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.quota_settle_seconds = quota_settle_seconds
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        # flock locks the open file, which every thread of the process shares
+        self._lock = threading.Lock()
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "QuotaLedger":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[list]:
+        # Yields the record as a list, which is written back if it was changed
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                data: bytes = os.pread(self._fd, _RECORD.size, 0)
+                if len(data) == _RECORD.size:
+                    record: list = list(_RECORD.unpack(data))
+                else:
+                    record = [float(self.burst), time.time(), -1, 0.0]
+                original: list = list(record)
+                yield record
+                if record != original:
+                    os.pwrite(self._fd, _RECORD.pack(*record), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds until the next one is due.
+        """
+        with self._locked() as record:
+            now: float = time.time()
+            tokens: float = min(float(self.burst), record[0] + max(0.0, now - record[1]) * self.rate)
+            record[1] = now
+            if tokens >= 1:
+                record[0] = tokens - 1
+                return 0.0
+            record[0] = tokens
+            return (1 - tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a token to send a request.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait. Defaults to waiting as long as needed.
+
+        Returns:
+            bool: Whether a token was taken, False if the timeout passed first.
+        """
+        expires_at: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait: float = self.try_acquire()
+            if not wait:
+                return True
+            if expires_at is not None:
+                remaining: float = expires_at - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def record_quota(self, remaining: int):
+        """
+        Record the quota remaining reported by the API.
+
+        Quota only goes down between resets, so a higher value than the one recorded is ignored unless the recorded
+        one is older than quota_settle_seconds; it then comes from a reset rather than from a response that arrived
+        late.
+
+        Args:
+            remaining (int): The number of requests left.
+        """
+        with self._locked() as record:
+            now: float = time.time()
+            if record[2] < 0 or remaining <= record[2] or now - record[3] > self.quota_settle_seconds:
+                record[2] = remaining
+                record[3] = now
+
+    def record_headers(self, headers: Mapping[str, str]):
+        """
+        Record the quota remaining from a response's headers, if they report it.
+
+        Args:
+            headers (Mapping[str, str]): The response headers.
+        """
+        value: Optional[str] = headers.get(QUOTA_HEADER)
+        if value is not None and value.strip().lstrip("-").isdigit():
+            self.record_quota(int(value))
+
+    @property
+    def quota_remaining(self) -> Optional[int]:
+        """The quota remaining last reported by the API to any process, or None if it is not known yet."""
+        with self._locked() as record:
+            return None if record[2] < 0 else int(record[2])
@@ -0,0 +1,201 @@
+import dataclasses
+import types
+import typing
+from typing import Any, Callable, Optional, TypeVar
+
+from soundchartspy.data import (
+    Album,
+    Artist,
+    ArtistSongEntry,
+    Audio,
+    AudienceData,
+    Genre,
+    ISRC,
+    Label,
+    Playlist,
+    PlatformIdentifier,
+    PlaylistPosition,
+    RadioStation,
+    ShortVideo,
+    Song,
+)
+
+T = TypeVar("T")
+
+# The attribute unknown fields are kept in by constructors that collect them
+UNKNOWN_FIELDS: str = "_unknown_fields"
+
+MODELS: tuple[type, ...] = (
+    AudienceData,
+    ISRC,
+    Artist,
+    Genre,
+    Label,
+    Audio,
+    PlatformIdentifier,
+    Song,
+    ArtistSongEntry,
+    Album,
+    Playlist,
+    PlaylistPosition,
+    RadioStation,
+    ShortVideo,
+)
+
+_constructors: dict[tuple[type, bool, bool], Callable[[dict], Any]] = {}
+
+
+def _is_optional(annotation: Any) -> bool:
+    # Whether a field's annotation allows None, e.g. Optional[str] or 'Optional[str]'
+    if isinstance(annotation, str):
+        return annotation.startswith(("Optional[", "typing.Optional[")) or annotation.endswith("| None")
+    if typing.get_origin(annotation) in (typing.Union, getattr(types, "UnionType", typing.Union)):
+        return type(None) in typing.get_args(annotation)
+    return annotation is None or annotation is type(None) or annotation is Any
+
+
+def required_fields(cls: type) -> frozenset[str]:
+    """
+    Get the fields of a data class that have no default and are not annotated Optional.
+
+    Args:
+        cls (type): The data class.
+
+    Returns:
+        frozenset[str]: The names of the required fields.
+    """
+    return frozenset(
+        model_field.name
+        for model_field in dataclasses.fields(cls)
+        if model_field.init
+        and model_field.default is dataclasses.MISSING
+        and model_field.default_factory is dataclasses.MISSING
+        and not _is_optional(model_field.type)
+    )
+
+
+def compile_constructor(cls: type[T], collect_unknown: bool = False, strict: bool = True) -> Callable[[dict], T]:
+    """
+    Generate a function building a data class from a dictionary, such as an item returned by the API.
+
+    The function reads each field straight from the dictionary, so unlike cls(**data) it does not raise TypeError
+    when the API adds a field. Unknown fields are ignored, or kept in the instance's _unknown_fields dictionary if
+    collect_unknown is set. Missing fields take their default, or None if they are annotated Optional. Missing
+    required fields (see required_fields) raise TypeError as cls(**data) would, unless strict is False, then they
+    are None as well.
+
+    When every field is present, the usual case, the fields are passed to the class positionally, which is faster
+    than cls(**data). Dictionaries with missing fields take a slower path.
+
+    Args:
+        cls (type): The data class.
+        collect_unknown (bool, optional): Keep unknown fields, see unknown_fields. Defaults to False.
+        strict (bool, optional): Raise TypeError when a required field is missing. Defaults to True.
+
+    Returns:
+        Callable[[dict], T]: The constructor.
+
+    Raises:
+        TypeError: If cls is not a data class.
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a data class")
+
+    namespace: dict[str, Any] = {"_cls": cls, "_set": object.__setattr__, "_required": required_fields(cls)}
+    present: list[str] = []
+    arguments: list[str] = []
+    for number, model_field in enumerate(dataclasses.fields(cls)):
+        if not model_field.init:
+            continue
+        name: str = model_field.name
+        if model_field.default is not dataclasses.MISSING:
+            namespace[f"_default_{number}"] = model_field.default
+            value: str = f"get({name!r}, _default_{number})"
+        elif model_field.default_factory is not dataclasses.MISSING:
+            namespace[f"_factory_{number}"] = model_field.default_factory
+            value = f"data[{name!r}] if {name!r} in data else _factory_{number}()"
+        else:
+            value = f"get({name!r})"
+        # Positional arguments are the cheapest way through the generated __init__
+        keyword: str = f"{name}=" if getattr(model_field, "kw_only", False) else ""
+        present.append(f"{keyword}data[{name!r}]")
+        arguments.append(f"{keyword}{value}")
+    namespace["_known"] = frozenset(model_field.name for model_field in dataclasses.fields(cls))
+    collect: str = (
+        # Through object.__setattr__ so frozen data classes collect them too
+        f"_set(instance, {UNKNOWN_FIELDS!r}, {{k: v for k, v in data.items() if k not in _known}})"
+    )
+
+    lines: list[str] = [
+        "def construct(data):",
+        "    try:",
+        f"        instance = _cls({', '.join(present)})",
+        # A field is missing, the slow path fills it in
+        "    except KeyError:",
+    ]
+    if strict and namespace["_required"]:
+        lines += [
+            "        if not data.keys() >= _required:",
+            "            missing = ', '.join(sorted(_required - data.keys()))",
+            f"            raise TypeError(f'{cls.__name__} is missing required fields: {{missing}}') from None",
+        ]
+    lines += [
+        "        get = data.get",
+        f"        instance = _cls({', '.join(arguments)})",
+    ]
+    if collect_unknown:
+        lines += [
+            "        if not _known.issuperset(data):",
+            f"            {collect}",
+            "        return instance",
+            # Every field is present, so there are unknown fields if there are more
+            f"    if len(data) > {len(present)} and not _known.issuperset(data):",
+            f"        {collect}",
+        ]
+    lines.append("    return instance")
+
+    exec("\n".join(lines), namespace)
+    construct: Callable[[dict], T] = namespace["construct"]
+    construct.__name__ = construct.__qualname__ = f"construct_{cls.__name__}"
+    construct.__doc__ = f"Build a {cls.__name__} from a dictionary, ignoring unknown fields."
+    return construct
+
+
+def constructor(cls: type[T], collect_unknown: bool = False, strict: bool = True) -> Callable[[dict], T]:
+    """
+    Get the constructor of a data class, compiling it on first use. The constructors of the client's models are
+    compiled at import.
+
+    Args:
+        cls (type): The data class.
+        collect_unknown (bool, optional): Keep unknown fields, see unknown_fields. Defaults to False.
+        strict (bool, optional): Raise TypeError when a required field is missing. Defaults to True.
+
+    Returns:
+        Callable[[dict], T]: The constructor.
+
+    Example:
+        >>> albums = list(map(constructor(Album), response["items"]))
+    """
+    key: tuple[type, bool, bool] = (cls, collect_unknown, strict)
+    construct: Optional[Callable[[dict], T]] = _constructors.get(key)
+    if construct is None:
+        construct = _constructors[key] = compile_constructor(cls, collect_unknown, strict)
+    return construct
+
+
+def unknown_fields(instance: Any) -> dict[str, Any]:
+    """
+    Get the fields of the dictionary an instance was built from that its class does not have.
+
+    Args:
+        instance: An instance built by a constructor collecting unknown fields.
+
+    Returns:
+        dict[str, Any]: The unknown fields, empty if there were none or they were not collected.
+    """
+    return getattr(instance, UNKNOWN_FIELDS, None) or {}
+
+
+for _model in MODELS:
+    constructor(_model)
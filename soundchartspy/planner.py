@@ -0,0 +1,178 @@
+import inspect
+import math
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Union
+
+from soundchartspy.cache import ResponseCache
+from soundchartspy.client import SoundCharts
+from soundchartspy.endpoints import OFFSET, Endpoint, get_endpoint
+from soundchartspy.utils import date_windows
+
+MAX_PAGE_SIZE: int = 100
+
+
+@dataclass
+class Job:
+    """
+    Describes a bulk job: one client method called for many keys.
+
+    Attributes:
+        method (str): The client method, e.g. 'artist_audience'.
+        keys (int | Sequence[str]): The keys (usually UUIDs) the method is called with, or just how many there are.
+        params (dict): The other parameters of each call, e.g. {"platform": "instagram", "start_date": "2023-01-01",
+            "end_date": "2023-12-31"}. Date ranges longer than the endpoint allows are split into windows.
+        expected_items (int): For paginated methods, the number of items expected per key. Defaults to one page.
+    """
+
+    method: str
+    keys: Union[int, Sequence[str]]
+    params: dict = field(default_factory=dict)
+    expected_items: Optional[int] = None
+
+
+@dataclass
+class JobEstimate:
+    """
+    The estimated cost of a job.
+
+    Attributes:
+        job (Job): The job.
+        windows (int): The number of date windows per key.
+        pages (int): The number of pages per key and window.
+        calls (int): The total number of requests the job makes.
+        cached (int): How many of those requests are expected to be served from the cache.
+    """
+
+    job: Job
+    windows: int
+    pages: int
+    calls: int
+    cached: int
+
+    @property
+    def api_calls(self) -> int:
+        """The number of requests expected to reach the API and use quota."""
+        return self.calls - self.cached
+
+
+@dataclass
+class RequestPlan:
+    """
+    The estimated cost of a set of jobs.
+
+    Attributes:
+        estimates (list[JobEstimate]): The estimate for each job.
+    """
+
+    estimates: list[JobEstimate] = field(default_factory=list)
+
+    @property
+    def calls(self) -> int:
+        return sum(estimate.calls for estimate in self.estimates)
+
+    @property
+    def cached(self) -> int:
+        return sum(estimate.cached for estimate in self.estimates)
+
+    @property
+    def api_calls(self) -> int:
+        return sum(estimate.api_calls for estimate in self.estimates)
+
+
+def _windows(endpoint: Endpoint, params: dict) -> list[tuple[Optional[str], Optional[str]]]:
+    start_date, end_date = params.get("start_date"), params.get("end_date")
+    if endpoint.max_window_days is None or not start_date or not end_date:
+        return [(start_date, end_date)]
+    return date_windows(start_date, end_date, endpoint.max_window_days)
+
+
+def _with_defaults(method: str, params: dict) -> dict:
+    # The client sends its methods' default arguments too, they are needed to build the same URLs
+    signature: inspect.Signature = inspect.signature(getattr(SoundCharts, method))
+    defaults: dict = {
+        name: parameter.default
+        for name, parameter in signature.parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    return {**defaults, **params}
+
+
+def estimate_job(
+    job: Job, cache: Optional[ResponseCache] = None, cache_hit_rate: float = 0.0
+) -> JobEstimate:
+    """
+    Estimate the number of requests a job makes.
+
+    The estimate accounts for date ranges being split into windows the endpoint accepts, and for pagination with at
+    most 100 items per page. When the keys are given and a cache is passed, every request URL is checked against the
+    cache, otherwise cache_hit_rate is used.
+
+    Args:
+        job (Job): The job.
+        cache (ResponseCache, optional): The cache the job's client will use.
+        cache_hit_rate (float, optional): The fraction of requests expected to be cache hits when they cannot be
+            checked against a cache. Defaults to 0.
+
+    Returns:
+        JobEstimate: The estimate.
+    """
+    endpoint: Endpoint = get_endpoint(job.method)
+    params: dict = _with_defaults(job.method, job.params)
+    windows: list[tuple[Optional[str], Optional[str]]] = _windows(endpoint, params)
+
+    page_size: int = 1
+    pages: int = 1
+    if endpoint.pagination == OFFSET:
+        page_size = min(params.pop("limit", MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        if job.expected_items:
+            # A full last page needs one more request to find out there is nothing after it
+            pages = job.expected_items // page_size + 1
+        params.pop("offset", None)
+
+    key_count: int = job.keys if isinstance(job.keys, int) else len(job.keys)
+    calls: int = key_count * len(windows) * pages
+
+    if cache is None or isinstance(job.keys, int):
+        cached: int = math.floor(calls * cache_hit_rate)
+        return JobEstimate(job, len(windows), pages, calls, cached)
+
+    key_param: str = endpoint.path_params[0]
+    cached = 0
+    for key in job.keys:
+        for start_date, end_date in windows:
+            for page in range(pages):
+                url_params: dict = {**params, key_param: key}
+                if start_date or end_date:
+                    url_params.update(start_date=start_date, end_date=end_date)
+                if endpoint.pagination == OFFSET:
+                    url_params.update(offset=page * page_size, limit=page_size)
+                cached += cache.contains(endpoint.url(**url_params))
+    return JobEstimate(job, len(windows), pages, calls, cached)
+
+
+def plan_requests(
+    jobs: Sequence[Job],
+    cache: Optional[ResponseCache] = None,
+    cache_hit_rate: float = 0.0,
+) -> RequestPlan:
+    """
+    Estimate the number of requests, and the quota, a set of jobs will use before running them.
+
+    Args:
+        jobs (Sequence[Job]): The jobs.
+        cache (ResponseCache, optional): The cache the jobs' client will use.
+        cache_hit_rate (float, optional): The expected cache hit rate for jobs whose requests cannot be checked
+            against a cache. Defaults to 0.
+
+    Returns:
+        RequestPlan: The estimates.
+
+    Example:
+        >>> plan = plan_requests([
+        ...     Job("artist_audience", keys=5000, params={"platform": "instagram", "start_date": "2023-01-01", "end_date": "2023-12-31"}),
+        ...     Job("artist_albums", keys=5000, expected_items=150),
+        ... ])
+        >>> plan.api_calls
+        35000
+    """
+    return RequestPlan([estimate_job(job, cache, cache_hit_rate) for job in jobs])
@@ -0,0 +1,234 @@
+import gzip
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.data import Playlist, PlaylistPosition
+from soundchartspy.fanout import fan_out
+
+
+@dataclass(frozen=True)
+class PlaylistChange:
+    """
+    A change to a song's entry in a playlist between two snapshots.
+
+    Attributes:
+        song_uuid (str): The UUID of the song.
+        playlist_uuid (str): The UUID of the playlist.
+        position (int, optional): The position in the newer snapshot, None if the song was removed.
+        previous_position (int, optional): The position in the older snapshot, None if the song was added.
+    """
+
+    song_uuid: str
+    playlist_uuid: str
+    position: Optional[int] = None
+    previous_position: Optional[int] = None
+
+    @property
+    def delta(self) -> Optional[int]:
+        """How many places the song moved up (negative if it moved down), None unless both positions are known."""
+        if self.position is None or self.previous_position is None:
+            return None
+        return self.previous_position - self.position
+
+
+@dataclass
+class PlaylistDiff:
+    """
+    The playlist entries added, removed and moved between two snapshots.
+
+    Attributes:
+        added (list[PlaylistChange]): Entries only in the newer snapshot.
+        removed (list[PlaylistChange]): Entries only in the older snapshot.
+        moved (list[PlaylistChange]): Entries in both snapshots at different positions.
+        errors (dict[str, Exception]): The error raised for each song whose entries could not be fetched. Those
+            songs are left out of the diff.
+    """
+
+    added: list[PlaylistChange] = field(default_factory=list)
+    removed: list[PlaylistChange] = field(default_factory=list)
+    moved: list[PlaylistChange] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+class PlaylistSnapshot:
+    """
+    The playlist positions of a set of songs at one point in time, keyed by (song uuid, playlist uuid).
+
+    Only what a diff needs is kept, and snapshots are saved as sorted, gzip compressed tab-separated lines, so a
+    snapshot of a large catalog stays small on disk.
+    """
+
+    def __init__(self):
+        self.positions: dict[tuple[str, str], Optional[int]] = {}
+        self.songs: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def add(self, song_uuid: str, entries: Iterable[tuple[Playlist, PlaylistPosition]]):
+        """
+        Add the playlist entries of a song, replacing any it already had.
+
+        Args:
+            song_uuid (str): The UUID of the song.
+            entries (Iterable[tuple[Playlist, PlaylistPosition]]): Its entries, as returned by
+                SoundCharts.song_playlist_entries or SoundCharts.paginate.
+        """
+        if song_uuid in self.songs:
+            self.positions = {key: value for key, value in self.positions.items() if key[0] != song_uuid}
+        self.songs.add(song_uuid)
+        for playlist, playlist_position in entries:
+            self.positions[(song_uuid, playlist.uuid)] = playlist_position.position
+
+    def merge(self, other: "PlaylistSnapshot") -> "PlaylistSnapshot":
+        """
+        Get a snapshot with this snapshot's songs updated by those of a newer one.
+
+        Args:
+            other (PlaylistSnapshot): The newer snapshot.
+
+        Returns:
+            PlaylistSnapshot: The merged snapshot.
+        """
+        merged = PlaylistSnapshot()
+        merged.songs = self.songs | other.songs
+        merged.positions = {key: value for key, value in self.positions.items() if key[0] not in other.songs}
+        merged.positions.update(other.positions)
+        return merged
+
+    def diff(self, newer: "PlaylistSnapshot") -> PlaylistDiff:
+        """
+        Compare this snapshot with a newer one, for the songs of the newer one.
+
+        Entries are matched through their (song uuid, playlist uuid) keys, so the diff takes time linear in the size
+        of the snapshots.
+
+        Args:
+            newer (PlaylistSnapshot): The newer snapshot.
+
+        Returns:
+            PlaylistDiff: The entries added, removed and moved.
+        """
+        diff = PlaylistDiff()
+        for key, position in newer.positions.items():
+            if key not in self.positions:
+                diff.added.append(PlaylistChange(*key, position=position))
+            elif self.positions[key] != position:
+                diff.moved.append(PlaylistChange(*key, position=position, previous_position=self.positions[key]))
+        for key, previous_position in self.positions.items():
+            if key[0] in newer.songs and key not in newer.positions:
+                diff.removed.append(PlaylistChange(*key, previous_position=previous_position))
+        return diff
+
+    def save(self, path: str):
+        """
+        Save the snapshot. The file is written atomically so a crash never leaves a partial snapshot behind.
+
+        Args:
+            path (str): The path of the snapshot file, e.g. 'playlists.tsv.gz'.
+        """
+        directory: str = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as raw_file, gzip.open(
+            raw_file, "wt", encoding="utf-8"
+        ) as snapshot_file:
+            for key in sorted(self.positions):
+                position: Optional[int] = self.positions[key]
+                snapshot_file.write(f"{key[0]}\t{key[1]}\t{'' if position is None else position}\n")
+            # Songs without any entry, so their removals are still diffed
+            for song_uuid in sorted(self.songs - {song for song, _ in self.positions}):
+                snapshot_file.write(f"{song_uuid}\t\t\n")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PlaylistSnapshot":
+        """
+        Load a saved snapshot.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            PlaylistSnapshot: The snapshot, empty if the file does not exist.
+        """
+        snapshot = cls()
+        if not os.path.exists(path):
+            return snapshot
+        with gzip.open(path, "rt", encoding="utf-8") as snapshot_file:
+            for line in snapshot_file:
+                song_uuid, playlist_uuid, position = line.rstrip("\n").split("\t")
+                snapshot.songs.add(song_uuid)
+                if playlist_uuid:
+                    snapshot.positions[(song_uuid, playlist_uuid)] = int(position) if position else None
+        return snapshot
+
+
+class PlaylistTracker:
+    """
+    Tracks the playlist entries of songs between crawls, keeping the last snapshot on disk so a diff only needs the
+    current entries.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> tracker = PlaylistTracker(soundcharts, "playlists.tsv.gz")
+        >>> diff = tracker.update(catalog_uuids, platform="spotify")
+        >>> for change in diff.moved:
+        ...     print(change.song_uuid, change.playlist_uuid, change.delta)
+    """
+
+    def __init__(self, client: SoundCharts, path: str, max_workers: int = 8):
+        """
+        Args:
+            client (SoundCharts): The client used to make requests.
+            path (str): The path of the snapshot file.
+            max_workers (int, optional): The maximum number of songs fetched concurrently. Defaults to 8.
+        """
+        self._client = client
+        self._path = path
+        self._max_workers = max_workers
+
+    def snapshot(self, song_uuids: Iterable[str], **kwargs) -> tuple[PlaylistSnapshot, dict[str, Exception]]:
+        """
+        Fetch every playlist entry of the songs.
+
+        Args:
+            song_uuids (Iterable[str]): The UUIDs of the songs.
+            **kwargs: Any other keyword arguments accepted by SoundCharts.song_playlist_entries, e.g. platform.
+
+        Returns:
+            tuple[PlaylistSnapshot, dict[str, Exception]]: The snapshot of the songs fetched, and the error raised for
+            each song that could not be.
+        """
+        entries, errors = fan_out(
+            lambda uuid: list(self._client.paginate("song_playlist_entries", uuid, **kwargs)),
+            song_uuids,
+            max_workers=self._max_workers,
+        )
+        snapshot = PlaylistSnapshot()
+        for song_uuid, song_entries in entries.items():
+            snapshot.add(song_uuid, song_entries)
+        return snapshot, errors
+
+    def update(self, song_uuids: Iterable[str], **kwargs) -> PlaylistDiff:
+        """
+        Fetch the songs' current playlist entries, diff them with the saved snapshot and save them as the new one.
+
+        Songs that could not be fetched keep their saved entries and are left out of the diff.
+
+        Args:
+            song_uuids (Iterable[str]): The UUIDs of the songs.
+            **kwargs: Any other keyword arguments accepted by SoundCharts.song_playlist_entries, e.g. platform.
+
+        Returns:
+            PlaylistDiff: The entries added, removed and moved since the saved snapshot.
+        """
+        previous: PlaylistSnapshot = PlaylistSnapshot.load(self._path)
+        current, errors = self.snapshot(song_uuids, **kwargs)
+        diff: PlaylistDiff = previous.diff(current)
+        diff.errors = errors
+        previous.merge(current).save(self._path)
+        return diff
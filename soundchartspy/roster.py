@@ -0,0 +1,274 @@
+from typing import Iterable, Optional, Sequence, Union
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.fanout import fan_out
+from soundchartspy.series import MASK, DailyGrid, Date, resample_daily
+from soundchartspy.timeouts import Deadline
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for roster matrices
+    np = None
+
+# Rolling window aggregates
+MEAN = "mean"
+SUM = "sum"
+MIN = "min"
+MAX = "max"
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Roster matrices require numpy, install it with 'pip install soundchartspy[analytics]'"
+        )
+
+
+def _shift(values: "np.ndarray", periods: int) -> "np.ndarray":
+    # The values periods days earlier, NaN for the first days
+    shifted = np.full(values.shape, np.nan)
+    if periods < values.shape[1]:
+        shifted[:, periods:] = values[:, : values.shape[1] - periods]
+    return shifted
+
+
+class RosterMatrix:
+    """
+    One metric of a roster of artists on one platform, as an artists x days NumPy array.
+
+    Missing values are NaN and flagged in mask, so every operation runs over the whole roster at once. Operations
+    return arrays of the same shape, aligned with keys and dates, with NaN where they cannot be computed.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> followers = fetch_roster_matrix(soundcharts, roster, "instagram", ["followerCount"], "2023-01-01", "2023-06-30")["followerCount"]
+        >>> followers.top_k(10, by=followers.growth(7))
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        dates: "np.ndarray",
+        values: "np.ndarray",
+        errors: Optional[dict[str, Exception]] = None,
+    ):
+        """
+        Args:
+            keys (list[str]): The UUID of the artist of each row.
+            dates (np.ndarray): The date of each column, as a datetime64[D] array.
+            values (np.ndarray): An artists x days float array, NaN where a value is missing.
+            errors (dict[str, Exception], optional): The error raised for each artist that could not be fetched. Their
+                rows are all NaN.
+        """
+        self.keys = keys
+        self.dates = dates
+        self.values = values
+        self.errors: dict[str, Exception] = errors or {}
+        self._rows: dict[str, int] = {key: row for row, key in enumerate(keys)}
+
+    @classmethod
+    def from_grid(
+        cls, grid: DailyGrid, metric: str, errors: Optional[dict[str, Exception]] = None
+    ) -> "RosterMatrix":
+        """
+        Build a matrix from one metric of a daily grid.
+
+        Args:
+            grid (DailyGrid): The grid, e.g. from resample_daily.
+            metric (str): The metric name, e.g. 'followerCount'.
+            errors (dict[str, Exception], optional): The error raised for each artist that could not be fetched.
+
+        Returns:
+            RosterMatrix: The matrix.
+        """
+        return cls(grid.keys, grid.dates, grid[metric], errors)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def mask(self) -> "np.ndarray":
+        """An artists x days boolean array, True where a value is missing."""
+        return np.isnan(self.values)
+
+    def masked(self) -> "np.ma.MaskedArray":
+        """The values as a masked array, for NumPy functions that honour masks."""
+        return np.ma.masked_invalid(self.values)
+
+    def row(self, key: str) -> "np.ndarray":
+        """
+        Get the values of one artist, aligned with dates.
+
+        Args:
+            key (str): The UUID of the artist.
+
+        Returns:
+            np.ndarray: The values, NaN where missing.
+        """
+        return self.values[self._rows[key]]
+
+    def delta(self, periods: int = 1) -> "np.ndarray":
+        """
+        Get the change of every artist's value over a number of days, e.g. 7 for week-over-week.
+
+        Args:
+            periods (int, optional): The number of days. Defaults to 1.
+
+        Returns:
+            np.ndarray: The value minus the value periods days earlier.
+        """
+        return self.values - _shift(self.values, periods)
+
+    def growth(self, periods: int = 1) -> "np.ndarray":
+        """
+        Get the percentage growth of every artist's value over a number of days.
+
+        Args:
+            periods (int, optional): The number of days. Defaults to 1.
+
+        Returns:
+            np.ndarray: The growth in percent, NaN where the earlier value is missing or zero.
+        """
+        previous = _shift(self.values, periods)
+        previous[previous == 0] = np.nan
+        return (self.values - previous) / previous * 100
+
+    def rolling(self, window: int, how: str = MEAN) -> "np.ndarray":
+        """
+        Aggregate every artist's values over a trailing window of days, ignoring missing values.
+
+        Args:
+            window (int): The number of days in the window, ending on each day.
+            how (str, optional): 'mean', 'sum', 'min' or 'max'. Defaults to 'mean'.
+
+        Returns:
+            np.ndarray: The aggregate, NaN for the first window - 1 days and for windows without any value.
+
+        Raises:
+            ValueError: If the window is not positive or the aggregate is unknown.
+        """
+        if window < 1:
+            raise ValueError("The window must be at least 1 day")
+        n_days: int = self.values.shape[1]
+        result = np.full(self.values.shape, np.nan)
+        if window > n_days:
+            return result
+
+        present = ~np.isnan(self.values)
+        counts = np.lib.stride_tricks.sliding_window_view(present, window, axis=1).sum(axis=2)
+        if how in (MEAN, SUM):
+            # Window sums as differences of cumulative sums
+            cumulative = np.zeros((self.values.shape[0], n_days + 1))
+            np.cumsum(np.where(present, self.values, 0.0), axis=1, out=cumulative[:, 1:])
+            aggregate = cumulative[:, window:] - cumulative[:, :-window]
+            if how == MEAN:
+                aggregate = aggregate / np.maximum(counts, 1)
+        elif how in (MIN, MAX):
+            windows = np.lib.stride_tricks.sliding_window_view(self.values, window, axis=1)
+            # fmin and fmax skip NaN without warning about all-NaN windows
+            aggregate = (np.fmin if how == MIN else np.fmax).reduce(windows, axis=2)
+        else:
+            raise ValueError(f"Unknown rolling aggregate '{how}', use one of mean, sum, min or max")
+        aggregate[counts == 0] = np.nan
+        result[:, window - 1:] = aggregate
+        return result
+
+    def top_k(
+        self,
+        k: int,
+        by: Optional["np.ndarray"] = None,
+        day: Union[int, Date] = -1,
+        largest: bool = True,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank the artists on one day.
+
+        Args:
+            k (int): The number of artists to return.
+            by (np.ndarray, optional): An artists x days array to rank by, e.g. growth(7). Defaults to the values.
+            day (int | str | datetime.date, optional): The column index or the date to rank on. Defaults to the last
+                day.
+            largest (bool, optional): Rank the largest values first. Defaults to True.
+
+        Returns:
+            list[tuple[str, float]]: Up to k (artist UUID, value) pairs, best first. Artists without a value that day
+            are left out.
+
+        Raises:
+            ValueError: If the day is outside the matrix's dates.
+        """
+        scores = self.values if by is None else by
+        n_days: int = scores.shape[1]
+        if isinstance(day, (int, np.integer)):
+            index: int = int(day) + n_days if day < 0 else int(day)
+        else:
+            index = int((np.datetime64(str(day)[:10], "D") - self.dates[0]).astype(np.int64)) if n_days else 0
+        # NumPy would wrap a date before the first day around to the last days
+        if not 0 <= index < n_days:
+            raise ValueError(f"Day {day} is outside the {n_days} days of the matrix")
+        column = scores[:, index]
+        rows = np.flatnonzero(~np.isnan(column))
+        if not len(rows) or k < 1:
+            return []
+        keyed = -column[rows] if largest else column[rows]
+        if k < len(rows):
+            # Partition first so only the k best are sorted
+            best = np.argpartition(keyed, k - 1)[:k]
+            rows = rows[best[np.argsort(keyed[best], kind="stable")]]
+        else:
+            rows = rows[np.argsort(keyed, kind="stable")]
+        return [(self.keys[row], float(column[row])) for row in rows]
+
+
+def fetch_roster_matrix(
+    client: SoundCharts,
+    uuids: Iterable[str],
+    platform: str,
+    metrics: Sequence[str],
+    start_date: str,
+    end_date: str,
+    fill: str = MASK,
+    max_workers: int = 8,
+    deadline: Optional[Deadline] = None,
+) -> dict[str, RosterMatrix]:
+    """
+    Fetch the audience of every artist of a roster concurrently and build a matrix per metric.
+
+    Every artist gets a row and every day of the range a column, so the matrices of different metrics and platforms
+    line up. Artists that could not be fetched keep their rows, all NaN, and their errors are kept in errors.
+
+    Args:
+        client (SoundCharts): The client used to make requests.
+        uuids (Iterable[str]): The UUIDs of the artists.
+        platform (str): The platform code, e.g. 'instagram'.
+        metrics (Sequence[str]): The AudienceData metrics, e.g. ['followerCount', 'likeCount'].
+        start_date (str): The first day (format 'YYYY-MM-DD').
+        end_date (str): The last day (format 'YYYY-MM-DD').
+        fill (str, optional): How to fill days without data: 'mask', 'interpolate' or 'ffill'. Defaults to 'mask'.
+        max_workers (int, optional): The maximum number of artists fetched concurrently. Defaults to 8.
+        deadline (Deadline, optional): When to stop waiting for artists, those not fetched by then are recorded as
+            errors.
+
+    Returns:
+        dict[str, RosterMatrix]: The matrices keyed by metric.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    _require_numpy()
+    uuids = list(dict.fromkeys(uuids))
+    audience, errors = fan_out(
+        lambda uuid: list(client.windowed("artist_audience", uuid, start_date, end_date, platform=platform)),
+        uuids,
+        max_workers=max_workers,
+        deadline=deadline,
+    )
+    grid: DailyGrid = resample_daily(
+        {uuid: audience.get(uuid, []) for uuid in uuids},
+        metrics,
+        fill=fill,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return {metric: RosterMatrix.from_grid(grid, metric, errors) for metric in metrics}
@@ -0,0 +1,192 @@
+import collections
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Iterator, Optional
+
+INTERACTIVE: str = "interactive"
+BULK: str = "bulk"
+
+DEFAULT_FLOW: str = "default"
+
+_priority: contextvars.ContextVar[Optional[tuple[str, str]]] = contextvars.ContextVar("priority", default=None)
+
+
+@contextlib.contextmanager
+def priority(name: str, flow: str = DEFAULT_FLOW) -> Iterator[None]:
+    """
+    Set the priority class of the requests made inside the block, including those made by fan-out workers started
+    inside it. Requests made outside any block are interactive, except for those made by bulk operations.
+
+    Args:
+        name (str): The priority class, e.g. 'interactive' or 'bulk'.
+        flow (str, optional): The flow the requests belong to, e.g. the name of a job. Flows of the same class take
+            turns sending requests.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", scheduler=RequestScheduler(rate=10))
+        >>> with priority("bulk", flow="nightly-backfill"):
+        ...     audience = list(soundcharts.windowed("artist_audience", "11e81bcc-9c1c-ce38-b96b-a0369fe50396", "2023-01-01", "2023-12-31"))
+    """
+    token: contextvars.Token = _priority.set((name, flow))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextlib.contextmanager
+def bulk_priority(flow: str) -> Iterator[None]:
+    """Make the requests inside the block bulk requests of the given flow, unless a priority is already set."""
+    if _priority.get() is not None:
+        yield
+        return
+    with priority(BULK, flow):
+        yield
+
+
+def current_priority() -> tuple[str, str]:
+    """The (class, flow) of requests made in the current context."""
+    return _priority.get() or (INTERACTIVE, DEFAULT_FLOW)
+
+
+class _Waiter:
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted: bool = False
+
+
+class RequestScheduler:
+    """
+    Schedules requests from several priority classes under one rate limit.
+
+    A token bucket refilled at rate tokens per second (holding at most burst) is shared by every request. When a
+    token is available, it goes to the highest priority class with requests waiting and below its concurrency cap.
+    Within a class, flows take turns, so one large job cannot hold up a smaller one. Interactive lookups therefore
+    jump ahead of queued bulk requests, while bulk requests still use whatever rate interactive traffic leaves.
+
+    Example:
+        >>> scheduler = RequestScheduler(rate=10, classes={"interactive": None, "bulk": 8})
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", scheduler=scheduler)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        classes: Optional[dict[str, Optional[int]]] = None,
+    ):
+        """
+        Args:
+            rate (float): The maximum number of requests per second.
+            burst (int, optional): The maximum number of requests sent at once after a quiet period. Defaults to
+                one second's worth of requests.
+            classes (dict[str, int | None], optional): The priority classes from highest to lowest priority, each
+                with its maximum number of requests in flight, or None for no cap. Defaults to interactive
+                requests without a cap, then bulk requests with at most 8 in flight.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.classes: dict[str, Optional[int]] = classes if classes is not None else {INTERACTIVE: None, BULK: 8}
+        self._tokens: float = float(self.burst)
+        self._refilled_at: float = time.monotonic()
+        self._queues: dict[str, collections.OrderedDict[str, collections.deque]] = {
+            name: collections.OrderedDict() for name in self.classes
+        }
+        self._in_flight: dict[str, int] = {name: 0 for name in self.classes}
+        self._condition = threading.Condition()
+
+    def queued(self, name: Optional[str] = None) -> int:
+        """
+        Get the number of requests waiting.
+
+        Args:
+            name (str, optional): Only count requests of this class.
+
+        Returns:
+            int: The number of requests waiting.
+        """
+        with self._condition:
+            names = [name] if name is not None else list(self._queues)
+            return sum(len(queue) for n in names for queue in self._queues[n].values())
+
+    def in_flight(self, name: str) -> int:
+        return self._in_flight[name]
+
+    def _refill(self, now: float):
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _dispatch(self):
+        # Grant tokens to waiting requests by class priority, then round robin between the flows of a class
+        self._refill(time.monotonic())
+        for name, cap in self.classes.items():
+            flows = self._queues[name]
+            while flows and self._tokens >= 1 and (cap is None or self._in_flight[name] < cap):
+                flow, waiters = next(iter(flows.items()))
+                waiter: _Waiter = waiters.popleft()
+                del flows[flow]
+                if waiters:
+                    flows[flow] = waiters
+                waiter.granted = True
+                self._tokens -= 1
+                self._in_flight[name] += 1
+                self._condition.notify_all()
+            if self._tokens < 1:
+                return
+
+    def acquire(self, name: str = INTERACTIVE, flow: str = DEFAULT_FLOW, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the scheduler to let a request through.
+
+        Args:
+            name (str, optional): The priority class of the request. Defaults to interactive.
+            flow (str, optional): The flow of the request within its class.
+            timeout (float, optional): The maximum number of seconds to wait. Defaults to waiting as long as needed.
+
+        Returns:
+            bool: Whether the request may be sent, False if the timeout passed first.
+
+        Raises:
+            KeyError: If the class is unknown.
+        """
+        if name not in self.classes:
+            raise KeyError(f"Unknown priority class '{name}'")
+        expires_at: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        waiter = _Waiter()
+        with self._condition:
+            self._queues[name].setdefault(flow, collections.deque()).append(waiter)
+            while True:
+                self._dispatch()
+                if waiter.granted:
+                    return True
+                # Wake up when the next token is due, or earlier when a request completes
+                wait: Optional[float] = (1 - self._tokens) / self.rate if self._tokens < 1 else None
+                if expires_at is not None:
+                    remaining: float = expires_at - time.monotonic()
+                    if remaining <= 0:
+                        self._remove(name, flow, waiter)
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._condition.wait(timeout=wait)
+
+    def _remove(self, name: str, flow: str, waiter: _Waiter):
+        waiters = self._queues[name].get(flow)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._queues[name][flow]
+
+    def release(self, name: str = INTERACTIVE):
+        """
+        Mark a request of a class as completed.
+
+        Args:
+            name (str, optional): The priority class of the request. Defaults to interactive.
+        """
+        with self._condition:
+            self._in_flight[name] -= 1
+            self._dispatch()
+            self._condition.notify_all()
@@ -0,0 +1,216 @@
+import datetime
+from typing import Any, Mapping, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for resampling
+    np = None
+
+# How the days without a data point are filled
+INTERPOLATE = "interpolate"  # linearly between the data points on either side, like the SoundCharts UI
+FORWARD_FILL = "ffill"  # with the last data point before them
+MASK = "mask"  # not filled, left as NaN
+
+Date = Union[str, datetime.date]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Resampling requires numpy, install it with 'pip install soundchartspy[analytics]'"
+        )
+
+
+def _value(point: Any, name: str) -> Any:
+    return point.get(name) if isinstance(point, dict) else getattr(point, name, None)
+
+
+def _day(value: Any) -> "np.datetime64":
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return np.datetime64(str(value)[:10], "D")
+
+
+class DailyGrid:
+    """
+    Metrics of many series (e.g. one per artist) on a dense daily grid.
+
+    Each metric is a keys x days float array, with NaN where there is no value. observed tells which values come
+    from a data point rather than from filling.
+
+    Attributes:
+        keys (list[str]): The key of each row, e.g. artist UUIDs.
+        dates (np.ndarray): The date of each column, as a datetime64[D] array.
+        values (dict[str, np.ndarray]): A keys x days array per metric.
+        observed (dict[str, np.ndarray]): A keys x days boolean array per metric, True where there was a data point.
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        dates: "np.ndarray",
+        values: dict[str, "np.ndarray"],
+        observed: dict[str, "np.ndarray"],
+    ):
+        self.keys = keys
+        self.dates = dates
+        self.values = values
+        self.observed = observed
+        self._rows: dict[str, int] = {key: row for row, key in enumerate(keys)}
+
+    def __getitem__(self, metric: str) -> "np.ndarray":
+        return self.values[metric]
+
+    def row(self, key: str) -> int:
+        """
+        Get the row of a key.
+
+        Args:
+            key (str): The key, e.g. an artist UUID.
+
+        Returns:
+            int: The row index in the metric arrays.
+        """
+        return self._rows[key]
+
+    def series(self, key: str, metric: str) -> "np.ndarray":
+        """
+        Get the daily values of one metric for one key, aligned with dates.
+
+        Args:
+            key (str): The key, e.g. an artist UUID.
+            metric (str): The metric name, e.g. 'followerCount'.
+
+        Returns:
+            np.ndarray: The values, NaN where there is no value.
+        """
+        return self.values[metric][self._rows[key]]
+
+
+def _forward_fill(values: "np.ndarray", observed: "np.ndarray") -> "np.ndarray":
+    days = np.arange(values.shape[1])
+    # For each day, the index of the last observed day at or before it (-1 if none)
+    last = np.maximum.accumulate(np.where(observed, days, -1), axis=1)
+    filled = np.take_along_axis(values, np.maximum(last, 0), axis=1)
+    filled[last < 0] = np.nan
+    return filled
+
+
+def _interpolate(values: "np.ndarray", observed: "np.ndarray") -> "np.ndarray":
+    n_days: int = values.shape[1]
+    days = np.arange(n_days)
+    previous = np.maximum.accumulate(np.where(observed, days, -1), axis=1)
+    following = np.minimum.accumulate(np.where(observed, days, n_days)[:, ::-1], axis=1)[:, ::-1]
+
+    inside = (previous >= 0) & (following < n_days)
+    previous_values = np.take_along_axis(values, np.clip(previous, 0, n_days - 1), axis=1)
+    following_values = np.take_along_axis(values, np.clip(following, 0, n_days - 1), axis=1)
+    span = np.where(following > previous, following - previous, 1)
+    weight = (days - previous) / span
+
+    filled = previous_values + (following_values - previous_values) * weight
+    # No extrapolation before the first or after the last data point
+    filled[~inside] = np.nan
+    filled[observed] = values[observed]
+    return filled
+
+
+def resample_daily(
+    series: Mapping[str, Sequence[Any]],
+    metrics: Sequence[str],
+    fill: Union[str, Mapping[str, str]] = INTERPOLATE,
+    start_date: Optional[Date] = None,
+    end_date: Optional[Date] = None,
+) -> DailyGrid:
+    """
+    Put the data points of many series on one dense daily grid and fill the missing days, all in one batch.
+
+    The API may skip days in audience data, and the SoundCharts UI estimates them from the points on either side.
+    Every data point of every series is placed on the grid at once, and missing days are filled with array
+    operations over all series together, so thousands of artists take about as long as a few.
+
+    Args:
+        series (Mapping[str, Sequence]): The data points of each series, keyed e.g. by artist UUID. Points have a
+            date and metrics, as attributes (AudienceData) or keys (the dictionaries of popularity and listener
+            data).
+        metrics (Sequence[str]): The metrics to resample, e.g. ['followerCount', 'likeCount'].
+        fill (str | Mapping[str, str], optional): How to fill missing days: 'interpolate', 'ffill' or 'mask', for
+            every metric or per metric. Defaults to 'interpolate'.
+        start_date (str | datetime.date, optional): The first day of the grid. Defaults to the earliest data point.
+            Data points before it are left out of the grid but still fill its first days.
+        end_date (str | datetime.date, optional): The last day of the grid. Defaults to the latest data point.
+            Data points after it are left out of the grid but still interpolate its last days.
+
+    Returns:
+        DailyGrid: The resampled metrics.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If a fill method is unknown.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> audience = {uuid: soundcharts.artist_audience(uuid, platform="instagram") for uuid in roster}
+        >>> grid = resample_daily(audience, ["followerCount", "likeCount"], fill={"followerCount": "interpolate", "likeCount": "mask"})
+        >>> grid.series(roster[0], "followerCount")
+    """
+    _require_numpy()
+    fills: dict[str, str] = {metric: fill for metric in metrics} if isinstance(fill, str) else dict(fill)
+    for metric in metrics:
+        if fills.get(metric, INTERPOLATE) not in (INTERPOLATE, FORWARD_FILL, MASK):
+            raise ValueError(f"Unknown fill method '{fills[metric]}' for {metric}")
+
+    keys: list[str] = list(series)
+    # Flatten every point of every series, the only per point Python loop
+    rows: list[int] = []
+    dates: list[str] = []
+    columns: dict[str, list] = {metric: [] for metric in metrics}
+    for row, key in enumerate(keys):
+        for point in series[key] or []:
+            date = _value(point, "date")
+            if date is None:
+                continue
+            rows.append(row)
+            dates.append(str(date)[:10])
+            for metric in metrics:
+                columns[metric].append(_value(point, metric))
+
+    days = np.array(dates, dtype="datetime64[D]")
+    first = _day(start_date) if start_date is not None else (days.min() if len(days) else None)
+    last = _day(end_date) if end_date is not None else (days.max() if len(days) else None)
+    if first is None or last is None or last < first:
+        grid_dates = np.array([], dtype="datetime64[D]")
+    else:
+        grid_dates = np.arange(first, last + 1, dtype="datetime64[D]")
+
+    n_days: int = len(grid_dates)
+    # Points outside the requested days still fill the days next to them, so the grid is filled over every day
+    # from the earliest to the latest point and cut to the requested days after
+    fill_first = min(first, days.min()) if n_days and len(days) else first
+    fill_last = max(last, days.max()) if n_days and len(days) else last
+    n_fill_days: int = int((fill_last - fill_first).astype(np.int64)) + 1 if n_days else 0
+    offset: int = int((first - fill_first).astype(np.int64)) if n_days else 0
+    row_index = np.array(rows, dtype=np.int64)
+    day_index = (days - fill_first).astype(np.int64) if n_days else np.array([], dtype=np.int64)
+    on_grid = (day_index >= 0) & (day_index < n_fill_days)
+    row_index, day_index = row_index[on_grid], day_index[on_grid]
+
+    values: dict[str, "np.ndarray"] = {}
+    observed: dict[str, "np.ndarray"] = {}
+    for metric in metrics:
+        points = np.array(
+            [np.nan if v is None else v for v in columns[metric]], dtype=np.float64
+        ).reshape(-1)[on_grid]
+        grid = np.full((len(keys), n_fill_days), np.nan)
+        grid[row_index, day_index] = points
+        seen = ~np.isnan(grid)
+
+        method: str = fills.get(metric, INTERPOLATE)
+        if n_days and method == INTERPOLATE:
+            grid = _interpolate(grid, seen)
+        elif n_days and method == FORWARD_FILL:
+            grid = _forward_fill(grid, seen)
+        values[metric] = grid[:, offset:offset + n_days]
+        observed[metric] = seen[:, offset:offset + n_days]
+
+    return DailyGrid(keys, grid_dates, values, observed)
@@ -0,0 +1,192 @@
+import dataclasses
+import datetime
+import gzip
+import io
+import json
+import os
+import queue
+import threading
+from typing import Any, BinaryIO, Iterable, Optional
+
+_CLOSE = object()
+
+
+def _to_json(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow, json.dumps recurses into nested models and calls this again for them
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_ndjson_line(item: Any) -> bytes:
+    """
+    Serialize a model, a tuple of models such as (Playlist, PlaylistPosition), or a dictionary to one NDJSON line.
+
+    Args:
+        item (Any): The item to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON followed by a newline.
+    """
+    return (json.dumps(item, default=_to_json, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class NDJSONSink:
+    """
+    A streaming sink that writes models to newline-delimited JSON files as they arrive.
+
+    Items are handed to a background writer thread through a bounded queue. When the writer falls behind, write
+    blocks until there is room, which slows the fetcher down instead of letting memory grow, so memory use stays flat
+    however large the job is. Output is buffered, can be gzip compressed and can be rotated into numbered files.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> with NDJSONSink("songs.ndjson", compress=True, max_bytes=256 * 1024 * 1024) as sink:
+        ...     sink.write_all(song for _, song in soundcharts.crawl("song", catalog_uuids))
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compress: bool = False,
+        max_bytes: Optional[int] = None,
+        buffer_size: int = 1024 * 1024,
+        max_pending: int = 1000,
+    ):
+        """
+        Args:
+            path (str): The output path, e.g. 'songs.ndjson'. With compression '.gz' is appended if missing. With
+                rotation files are numbered, e.g. 'songs-00000.ndjson', 'songs-00001.ndjson'.
+            compress (bool, optional): Whether to gzip the output. Defaults to False.
+            max_bytes (int, optional): Rotate to a new file once a file holds this many uncompressed bytes.
+                Defaults to no rotation.
+            buffer_size (int, optional): The write buffer size in bytes. Defaults to 1 MiB.
+            max_pending (int, optional): The maximum number of items waiting to be written before write blocks.
+                Defaults to 1000.
+        """
+        if compress and not path.endswith(".gz"):
+            path += ".gz"
+        self._path = path
+        self._compress = compress
+        self._max_bytes = max_bytes
+        self._buffer_size = buffer_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._file: Optional[BinaryIO] = None
+        self._file_bytes: int = 0
+        self._error: Optional[BaseException] = None
+        self._closed: bool = False
+        self.files: list[str] = []
+        self.items_written: int = 0
+        self.bytes_written: int = 0
+        self._open_next_file()
+        self._writer = threading.Thread(target=self._run, name="ndjson-sink", daemon=True)
+        self._writer.start()
+
+    def _next_path(self) -> str:
+        if self._max_bytes is None:
+            return self._path
+        stem, extension = self._path, ""
+        for suffix in (".gz", ".ndjson", ".jsonl", ".json"):
+            if stem.endswith(suffix):
+                stem, extension = stem[: -len(suffix)], suffix + extension
+        return f"{stem}-{len(self.files):05d}{extension}"
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            # GzipFile does not close a file object it was given
+            self._raw_file.close()
+            self._file = None
+
+    def _open_next_file(self):
+        self._close_file()
+        path: str = self._next_path()
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._raw_file: BinaryIO = open(path, "wb")
+        stream: BinaryIO = self._raw_file
+        if self._compress:
+            stream = gzip.GzipFile(fileobj=self._raw_file, mode="wb")
+        self._file = io.BufferedWriter(stream, buffer_size=self._buffer_size)
+        self._file_bytes = 0
+        self.files.append(path)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                return
+            if self._error is not None:
+                # Keep draining so producers are never blocked by a failed writer
+                continue
+            try:
+                line: bytes = to_ndjson_line(item)
+                if self._max_bytes is not None and self._file_bytes and self._file_bytes + len(line) > self._max_bytes:
+                    self._open_next_file()
+                self._file.write(line)
+                self._file_bytes += len(line)
+                self.bytes_written += len(line)
+                self.items_written += 1
+            except BaseException as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("NDJSON sink writer failed") from self._error
+
+    def write(self, item: Any):
+        """
+        Queue an item to be written, blocking while the writer is max_pending items behind.
+
+        Args:
+            item (Any): A model, a tuple of models or a dictionary.
+
+        Raises:
+            RuntimeError: If the sink is closed or the writer thread failed.
+        """
+        if self._closed:
+            raise RuntimeError("NDJSON sink is closed")
+        self._raise_error()
+        self._queue.put(item)
+
+    def write_all(self, items: Iterable[Any]) -> int:
+        """
+        Write every item of an iterable, such as an iterator from SoundCharts.paginate or SoundCharts.crawl.
+
+        Args:
+            items (Iterable): The items.
+
+        Returns:
+            int: The number of items queued.
+        """
+        count: int = 0
+        for item in items:
+            self.write(item)
+            count += 1
+        return count
+
+    def close(self):
+        """
+        Write any pending items, flush and close the current file.
+
+        Raises:
+            RuntimeError: If the writer thread failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._writer.join()
+        self._close_file()
+        self._raise_error()
+
+    def __enter__(self) -> "NDJSONSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
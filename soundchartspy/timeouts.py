@@ -0,0 +1,166 @@
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+V = TypeVar("V")
+
+# A timeout in seconds for both connecting and reading, or a (connect, read) pair, as accepted by requests
+Timeout = Union[float, tuple[float, float]]
+
+DEFAULT_TIMEOUT: tuple[float, float] = (5.0, 30.0)
+
+_timeout: contextvars.ContextVar[Optional[Timeout]] = contextvars.ContextVar("timeout", default=None)
+_deadline: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised for work that could not be done before its deadline."""
+
+
+class Deadline:
+    """
+    A point in time by which a bulk, paginated or fan-out operation must finish.
+
+    Operations given a deadline stop when it expires: requests not yet sent are cancelled, requests in flight have
+    their timeouts cut to the time remaining, and the results gathered so far are returned. The operation then sets
+    exceeded, which marks its results as partial.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> deadline = Deadline(30)
+        >>> albums = list(soundcharts.paginate("artist_albums", uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396", deadline=deadline))
+        >>> if deadline.exceeded:
+        ...     print(f"Only got {len(albums)} albums in 30 seconds")
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds (float): The number of seconds from now until the deadline.
+        """
+        self.seconds = seconds
+        self._expires_at: float = time.monotonic() + seconds
+        self.exceeded: bool = False
+
+    def remaining(self) -> float:
+        """The number of seconds left before the deadline, 0 once it has passed."""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self._expires_at
+
+    def exceed(self) -> DeadlineExceeded:
+        """
+        Mark the deadline as exceeded.
+
+        Returns:
+            DeadlineExceeded: An exception for the caller to raise or record.
+        """
+        self.exceeded = True
+        return DeadlineExceeded(f"deadline of {self.seconds}s exceeded")
+
+    def check(self):
+        """
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        if self.expired:
+            raise self.exceed()
+
+    def cap(self, timeout: Optional[Timeout]) -> Timeout:
+        """
+        Cut a request timeout so the request cannot outlast the deadline.
+
+        Args:
+            timeout (float | tuple[float, float], optional): The timeout, or a (connect, read) pair.
+
+        Returns:
+            float | tuple[float, float]: The timeout, no longer than the time remaining.
+
+        Raises:
+            DeadlineExceeded: If no time remains, as a request cannot be sent with a timeout of 0.
+        """
+        remaining: float = self.remaining()
+        if remaining <= 0:
+            raise self.exceed()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return min(connect, remaining), min(read, remaining)
+        return min(timeout, remaining)
+
+
+@contextlib.contextmanager
+def request_timeout(timeout: Timeout) -> Iterator[None]:
+    """
+    Override the clients' request timeout for the requests made inside the block, including those made by fan-out
+    workers started inside it.
+
+    Args:
+        timeout (float | tuple[float, float]): The timeout in seconds, or a (connect, read) pair.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> with request_timeout((3.05, 120)):
+        ...     audience = soundcharts.artist_audience(uuid="11e81bcc-9c1c-ce38-b96b-a0369fe50396", platform="instagram")
+    """
+    token: contextvars.Token = _timeout.set(timeout)
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def current_timeout() -> Optional[Timeout]:
+    """The timeout set by request_timeout for the current context, if any."""
+    return _timeout.get()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline of the operation running in the current context, if any."""
+    return _deadline.get()
+
+
+def within(deadline: Optional[Deadline], call: Callable[..., V], *args: Any, **kwargs: Any) -> V:
+    """
+    Call a function with a deadline applying to every request it makes.
+
+    Args:
+        deadline (Deadline, optional): The deadline. If None, the function is called as is.
+        call (Callable): The function.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The function's result.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed, or passes during a request.
+    """
+    if deadline is None:
+        return call(*args, **kwargs)
+    deadline.check()
+    token: contextvars.Token = _deadline.set(deadline)
+    try:
+        return call(*args, **kwargs)
+    finally:
+        _deadline.reset(token)
+
+
+def submit(executor, call: Callable[..., V], *args: Any, deadline: Optional[Deadline] = None):
+    """
+    Submit a call to an executor, carrying over the caller's request timeout and the deadline to the worker thread.
+
+    Args:
+        executor (Executor): The executor.
+        call (Callable): The function.
+        *args: Positional arguments for the function.
+        deadline (Deadline, optional): The deadline applying to the requests the function makes.
+
+    Returns:
+        Future: The future of the call.
+    """
+    return executor.submit(contextvars.copy_context().run, within, deadline, call, *args)
@@ -0,0 +1,304 @@
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Iterator, Optional, Sequence
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+# Set by a traced client method to a one item list, in which the time its response was received is recorded
+_conversion_start: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar("conversion_start", default=None)
+
+OK = "ok"
+ERROR = "error"
+
+
+def _new_id(bits: int) -> int:
+    return int.from_bytes(os.urandom(bits // 8), "big")
+
+
+class Span:
+    """
+    A timed operation, e.g. a client method call, an HTTP request or the decoding of a response.
+
+    Spans follow the OpenTelemetry data model: they belong to a trace, have a parent unless they are the root of
+    their trace, and carry attributes. Times are in nanoseconds since the epoch.
+
+    Attributes:
+        name (str): The operation, e.g. 'song' or 'http.send'.
+        trace_id (int): The trace the span belongs to, shared with its parent.
+        span_id (int): The span's identifier.
+        parent_id (int, optional): The identifier of the parent span, None for a root span.
+        start_time (int): When the operation started.
+        end_time (int, optional): When it ended, None while it runs.
+        attributes (dict[str, Any]): Attributes such as 'http.url' or 'http.status_code'.
+        status (str): 'ok', or 'error' if the operation raised an exception.
+        thread_id (int): The thread the span was started in.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_time", "end_time", "attributes", "status", "thread_id",
+        "_tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: Optional["Tracer"],
+        name: str,
+        parent: Optional["Span"],
+        attributes: Optional[dict[str, Any]] = None,
+        start_time: Optional[int] = None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id: int = parent.trace_id if parent is not None else _new_id(128)
+        self.span_id: int = _new_id(64)
+        self.parent_id: Optional[int] = parent.span_id if parent is not None else None
+        self.start_time: int = start_time if start_time is not None else time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.status: str = OK
+        self.thread_id: int = threading.get_ident()
+
+    def __repr__(self) -> str:
+        return f"Span(name={self.name!r}, duration={self.duration!r}, status={self.status!r})"
+
+    @property
+    def duration(self) -> Optional[float]:
+        """How long the operation took in seconds, None while it runs."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException):
+        self.status = ERROR
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def end(self, end_time: Optional[int] = None):
+        """
+        End the span and hand it to its tracer's exporter. Ending a span again has no effect.
+
+        Args:
+            end_time (int, optional): When the operation ended, in nanoseconds since the epoch. Defaults to now.
+        """
+        if self.end_time is not None:
+            return
+        self.end_time = end_time if end_time is not None else time.time_ns()
+        if self._tracer is not None:
+            self._tracer._finish(self)
+
+
+class Tracer:
+    """
+    Records spans for the operations of a client.
+
+    A tracer implements the part of the OpenTelemetry tracer API the client uses, start_as_current_span and
+    start_span, so an OpenTelemetry tracer (opentelemetry.trace.get_tracer(...)) can be given to the client instead.
+    Finished spans are passed to an exporter with an export(spans) method, such as an OpenTelemetry-style span
+    exporter, and kept in spans if record is set.
+
+    The current span is kept in a context variable, so spans started in fan-out and hedging workers are children of
+    the span that started them.
+
+    Example:
+        >>> tracer = Tracer(record=True)
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key", tracer=tracer)
+        >>> song = soundcharts.song("7d534228-5165-11e9-9375-549f35161576")
+        >>> [(span.name, span.duration) for span in tracer.spans]
+    """
+
+    def __init__(self, exporter: Any = None, record: bool = False):
+        """
+        Args:
+            exporter (optional): An object with an export(spans) method, called with each finished span.
+            record (bool, optional): Keep finished spans in spans. Defaults to False.
+        """
+        self.exporter = exporter
+        self.record = record
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def _finish(self, span: Span):
+        if self.record:
+            with self._lock:
+                self.spans.append(span)
+        if self.exporter is not None:
+            self.exporter.export([span])
+
+    def start_span(
+        self, name: str, attributes: Optional[dict[str, Any]] = None, start_time: Optional[int] = None
+    ) -> Span:
+        """
+        Start a span, a child of the current span, without making it the current span. End it with Span.end.
+
+        Args:
+            name (str): The operation.
+            attributes (dict[str, Any], optional): The span's attributes.
+            start_time (int, optional): When the operation started, in nanoseconds since the epoch. Defaults to now.
+
+        Returns:
+            Span: The span.
+        """
+        return Span(self, name, _current_span.get(), attributes, start_time)
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[dict[str, Any]] = None) -> Iterator[Span]:
+        """
+        Start a span and make it the current span inside the block. It ends with the block, with an error status if
+        the block raises an exception.
+
+        Args:
+            name (str): The operation.
+            attributes (dict[str, Any], optional): The span's attributes.
+
+        Yields:
+            Span: The span.
+        """
+        span: Span = self.start_span(name, attributes)
+        token: contextvars.Token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+def current_span() -> Optional[Span]:
+    """The span of the operation running in the current context, None if there is none."""
+    return _current_span.get()
+
+
+class Profile:
+    """
+    The spans recorded by profile, with their timings summed by operation and by call stack.
+
+    Example:
+        >>> with profile(soundcharts, "soundcharts.folded") as recorded:
+        ...     soundcharts.song_playlist_entries("7d534228-5165-11e9-9375-549f35161576")
+        >>> recorded.summary()
+    """
+
+    def __init__(self, spans: Sequence[Span]):
+        self.spans: list[Span] = list(spans)
+
+    def _self_times(self) -> dict[int, int]:
+        # Each span's duration without its children's, in nanoseconds
+        self_times: dict[int, int] = {
+            span.span_id: span.end_time - span.start_time for span in self.spans if span.end_time is not None
+        }
+        for span in self.spans:
+            if span.parent_id in self_times and span.end_time is not None:
+                self_times[span.parent_id] -= span.end_time - span.start_time
+        # Children running concurrently can add up to more than their parent
+        return {span_id: max(0, value) for span_id, value in self_times.items()}
+
+    def folded(self) -> dict[str, int]:
+        """
+        Get the time spent in each call stack, in the folded format read by flamegraph tools.
+
+        Returns:
+            dict[str, int]: Microseconds of self time keyed by stack, e.g. 'song;http.request;http.send'.
+        """
+        spans: dict[int, Span] = {span.span_id: span for span in self.spans}
+        self_times: dict[int, int] = self._self_times()
+        stacks: dict[str, int] = {}
+        for span in self.spans:
+            if span.span_id not in self_times:
+                continue
+            names: list[str] = [span.name]
+            parent: Optional[Span] = spans.get(span.parent_id)
+            while parent is not None:
+                names.append(parent.name)
+                parent = spans.get(parent.parent_id)
+            stack: str = ";".join(reversed(names))
+            stacks[stack] = stacks.get(stack, 0) + self_times[span.span_id] // 1000
+        return stacks
+
+    def write_folded(self, path: str):
+        """
+        Write the folded stacks to a file, one 'stack microseconds' line each, e.g. for flamegraph.pl or speedscope.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as folded_file:
+            for stack, microseconds in sorted(self.folded().items()):
+                folded_file.write(f"{stack} {microseconds}\n")
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Get the timings of each operation.
+
+        Returns:
+            dict[str, dict[str, float]]: For each span name, the 'count' of spans, their 'total' duration and 'self'
+            time without their children, in seconds, slowest first.
+        """
+        self_times: dict[int, int] = self._self_times()
+        summary: dict[str, dict[str, float]] = {}
+        for span in self.spans:
+            if span.span_id not in self_times:
+                continue
+            entry = summary.setdefault(span.name, {"count": 0, "total": 0.0, "self": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["self"] += self_times[span.span_id] / 1e9
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+
+@contextlib.contextmanager
+def profile(client, path: Optional[str] = None) -> Iterator[Profile]:
+    """
+    Trace every call made by a client inside the block, and summarize where the time went.
+
+    The client's tracer is replaced inside the block, for every thread using the client, and restored after it.
+
+    Args:
+        client (SoundCharts): The client to profile.
+        path (str, optional): A file to write the folded stacks to when the block ends, for a flamegraph.
+
+    Yields:
+        Profile: The profile, filled when the block ends.
+
+    Example:
+        >>> soundcharts = SoundCharts(app_id="your_app_id", api_key="your_api_key")
+        >>> with profile(soundcharts, "soundcharts.folded") as recorded:
+        ...     soundcharts.song("7d534228-5165-11e9-9375-549f35161576")
+        >>> recorded.summary()["http.send"]
+    """
+    tracer = Tracer(record=True)
+    recorded = Profile([])
+    previous = client.tracer
+    client.tracer = tracer
+    try:
+        yield recorded
+    finally:
+        client.tracer = previous
+        recorded.spans = list(tracer.spans)
+        if path is not None:
+            recorded.write_folded(path)
+
+
+def mark_conversion_start():
+    """Record that the response of the traced method running in the current context was received."""
+    start: Optional[list] = _conversion_start.get()
+    if start is not None:
+        start[0] = time.time_ns()
+
+
+@contextlib.contextmanager
+def conversion_timer() -> Iterator[list]:
+    """Track when the response of a traced method call is received, the rest of the call converts it."""
+    start: list = [None]
+    token: contextvars.Token = _conversion_start.set(start)
+    try:
+        yield start
+    finally:
+        _conversion_start.reset(token)
@@ -11,8 +11,10 @@ from soundchartspy.data import (
     Song,
     Playlist,
     PlaylistPosition,
+    RadioStation,
 )
 from soundchartspy.exceptions import SoundChartsError
+from soundchartspy.models import constructor
 
 
 def convert_song_response_to_object(response: dict) -> Song:
@@ -24,16 +26,25 @@ def convert_song_response_to_object(response: dict) -> Song:
         Song: The Song object created
     """
     song: dict = response.get("object")
-
-    # Create the objects from the response data
-    song["isrc"] = ISRC(**song.get("isrc"))
-    song["artists"] = [Artist(**artist) for artist in song.get("artists")]
-    song["genres"] = [Genre(**genre) for genre in song.get("genres")]
-    song["labels"] = [Label(**label) for label in song.get("labels")]
-    song["audio"] = Audio(**song.get("audio"))
-    song["releaseDate"] = datetime.datetime.fromisoformat(song.get("releaseDate"))
-
-    return Song(**song)
+    if song is None:
+        return None
+
+    # Create the objects from the response data, leaving out the fields the API did not send
+    isrc = song.get("isrc")
+    if isrc is not None:
+        song["isrc"] = constructor(ISRC)(isrc)
+    for field, model in (("artists", Artist), ("genres", Genre), ("labels", Label)):
+        values = song.get(field)
+        if values is not None:
+            song[field] = list(map(constructor(model), values))
+    audio = song.get("audio")
+    if audio is not None:
+        song["audio"] = constructor(Audio)(audio)
+    release_date = song.get("releaseDate")
+    if release_date:
+        song["releaseDate"] = datetime.datetime.fromisoformat(release_date)
+
+    return constructor(Song)(song)
 
 
 def get_soundcharts_error_code_message(response: dict):
@@ -61,6 +72,21 @@ def check_response_for_errors_and_convert_to_dict(response: Response) -> dict:
     raise SoundChartsError(http_status=response_status, code=code, msg=message)
 
 
+def check_response_for_errors_and_return_content(response: Response) -> bytes:
+    """
+    Checks the response object from SoundCharts for an error and returns its undecoded body if there is none.
+    Only error responses are decoded, to raise a python exception containing the same info.
+    :param response:
+    :return content: The response body
+    :raises SoundChartsError: If an error is found in the response
+    """
+    if response.status_code < 400:
+        return response.content
+    check_response_for_errors_and_convert_to_dict(response=response)
+    response.raise_for_status()
+    return response.content
+
+
 def convert_playlist_entry_data_to_tuple_pair(
     item: dict,
 ) -> tuple[Playlist, PlaylistPosition]:
@@ -73,45 +99,72 @@ def convert_playlist_entry_data_to_tuple_pair(
         tuple[Playlist, PlaylistPosition]: A tuple of Playlist and PlaylistPosition objects.
 
     """
-    # Get the playlist and playlist position data required to construct the objects
+    # The position fields are read straight from the entry, the constructor ignores the others
     playlist = item.get("playlist")
-    playlist_position = get_playlist_position_data(item)
-
-    # Create the objects
-    playlist = Playlist(**playlist)
-    playlist_position = PlaylistPosition(**playlist_position)
+    if playlist is not None:
+        playlist = constructor(Playlist)(playlist)
+    playlist_position = constructor(PlaylistPosition)(item)
 
     return playlist, playlist_position
 
 
-def get_playlist_position_data(item):
-    return {
-        "position": item.get("position"),
-        "peakPosition": item.get("peakPosition"),
-        "entryDate": item.get("entryDate"),
-        "positionDate": item.get("positionDate"),
-        "peakPositionDate": item.get("peakPositionDate"),
-    }
+def convert_radio_items(items: list[dict]) -> list[dict]:
+    """
+    Replaces the radio of each broadcast item with a RadioStation object, building each station only once however
+    many items refer to it.
+    Args:
+        items: The broadcast items.
+
+    Returns:
+        list[dict]: The same items, with RadioStation objects.
+    """
+    construct = constructor(RadioStation)
+    stations: dict[str, RadioStation] = {}
+    for item in items:
+        radio: dict = item.get("radio")
+        if radio is None:
+            continue
+        station = stations.get(radio.get("slug"))
+        if station is None:
+            station = stations[radio.get("slug")] = construct(radio)
+        item["radio"] = station
+    return items
 
 
 def convert_json_to_artist_object(artist: dict) -> Artist:
+    if artist is None:
+        return None
     # Convert the genres to Genre objects
-    genres: list[Genre] = [Genre(**genre) for genre in artist.get("genres")]
-    artist["genres"] = genres
+    genres = artist.get("genres")
+    if genres is not None:
+        artist["genres"] = list(map(constructor(Genre), genres))
     # Convert the birth date to a datetime object
-    artist["birthDate"] = datetime.datetime.fromisoformat(artist["birthDate"])
+    birth_date = artist.get("birthDate")
+    if birth_date:
+        artist["birthDate"] = datetime.datetime.fromisoformat(birth_date)
     # Create the Artist object
-    artist: Artist = Artist(**artist)
+    artist: Artist = constructor(Artist)(artist)
     return artist
 
 
-def check_and_add_start_and_end_date_to_query_params(
-    endpoint: str, start_date: str, end_date: str
-):
-    endpoint += "?"
-    if start_date:
-        endpoint += f"startDate={start_date}"
-    if end_date:
-        endpoint += f"&endDate={end_date}"
+def date_windows(
+    start_date: str, end_date: str, max_days: int
+) -> list[tuple[str, str]]:
+    """
+    Split a date range into consecutive windows of at most max_days days, for endpoints limiting the period per request.
+    Args:
+        start_date: The first day of the range (format 'YYYY-MM-DD').
+        end_date: The last day of the range (format 'YYYY-MM-DD').
+        max_days: The longest window allowed.
 
-    return endpoint
+    Returns:
+        list[tuple[str, str]]: The (start_date, end_date) of each window, in order.
+    """
+    start: datetime.date = datetime.date.fromisoformat(start_date[:10])
+    end: datetime.date = datetime.date.fromisoformat(end_date[:10])
+    windows: list[tuple[str, str]] = []
+    while start <= end:
+        window_end: datetime.date = min(start + datetime.timedelta(days=max_days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + datetime.timedelta(days=1)
+    return windows
@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+
+def song_document(uuid: str) -> dict:
+    return {
+        "object": {
+            "uuid": uuid,
+            "name": f"Song {uuid}",
+            "isrc": {"value": f"ISRC{uuid}", "countryCode": "US", "countryName": "United States"},
+            "creditName": "Artist",
+            "artists": [{"uuid": "artist", "slug": "artist", "name": "Artist", "appUrl": "", "imageUrl": ""}],
+            "releaseDate": "2020-01-01T00:00:00+00:00",
+            "copyright": "",
+            "appUrl": "",
+            "imageUrl": "",
+            "duration": 180,
+            "genres": [{"root": "pop", "sub": []}],
+            "composers": [],
+            "producers": [],
+            "labels": [{"name": "Label", "type": "major"}],
+            "audio": {
+                "danceability": 0.5, "energy": 0.5, "instrumentalness": 0.0, "key": 1, "liveness": 0.1,
+                "loudness": -5.0, "mode": 1, "speechiness": 0.1, "tempo": 120.0, "timeSignature": 4,
+                "valence": 0.5,
+            },
+            "explicit": False,
+            "languageCode": "en",
+        }
+    }
+
+
+def default_handler(path: str) -> tuple[int, dict]:
+    if "/song/" in path:
+        uuid = path.split("/song/")[1].split("/")[0].split("?")[0]
+        return 200, song_document(uuid)
+    return 404, {"errors": [{"code": 404, "message": "Not found"}]}
+
+
+class StubSoundChartsServer:
+    """
+    A local HTTP server standing in for the SoundCharts API in tests.
+
+    Args:
+        handler: Maps a request path to a status code, a JSON document and optionally response headers. Defaults to
+            serving songs.
+        delay: Seconds to wait before answering each request, or a function of the path returning them.
+    """
+
+    def __init__(self, handler: Callable[[str], tuple[int, dict]] = default_handler, delay=0.0):
+        self.handler = handler
+        self.delay = delay
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written apart, Nagle's algorithm would hold the body until the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests.append(self.path)
+                delay = stub.delay(self.path) if callable(stub.delay) else stub.delay
+                if delay:
+                    time.sleep(delay)
+                status, document, *headers = stub.handler(self.path)
+                body = json.dumps(document).encode()
+                try:
+                    self.send_response(status)
+                    for name, value in (headers[0] if headers else {}).items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubSoundChartsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,97 @@
+import datetime
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from soundchartspy.broadcasts import Broadcasts, fetch_broadcasts
+
+
+def radio(slug: str, country_code: str) -> dict:
+    return {
+        "slug": slug, "name": slug.upper(), "cityName": "", "countryCode": country_code, "countryName": "",
+        "timeZone": "UTC",
+    }
+
+
+def broadcast(slug: str, country_code: str, aired_at: str) -> dict:
+    return {"airedAt": aired_at, "radio": radio(slug, country_code)}
+
+
+ITEMS = [
+    broadcast("nrj", "FR", "2023-01-01T08:15:00+00:00"),
+    broadcast("nrj", "FR", "2023-01-01T09:00:00+00:00"),
+    broadcast("bbc-2", "GB", "2023-01-01T08:45:00+00:00"),
+    broadcast("bbc-2", "GB", "2023-01-02T10:00:00Z"),
+    broadcast("funradio", "FR", "2023-01-02T09:30:00+01:00"),
+]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBroadcasts(unittest.TestCase):
+
+    def test_views(self):
+        broadcasts = Broadcasts.from_items([dict(item) for item in ITEMS])
+
+        spins = broadcasts.spins()
+        assert len(spins) == 5
+        assert spins[0]["radio"] is spins[1]["radio"]
+        assert spins[0]["radio"].name == "NRJ"
+
+        counts = broadcasts.spin_counts()
+        assert [(count["radio"].slug, count["playCount"]) for count in counts] == [
+            ("nrj", 2), ("bbc-2", 2), ("funradio", 1)
+        ]
+
+    def test_items_without_radio_are_left_out(self):
+        broadcasts = Broadcasts.from_items([*ITEMS, {"airedAt": "2023-01-03T08:00:00+00:00", "radio": None}])
+        assert broadcasts.total == 5
+        assert len(broadcasts.spins()) == 5
+
+    def test_aggregates(self):
+        broadcasts = Broadcasts.from_items(ITEMS, keep_items=False)
+
+        assert broadcasts.total == 5
+        assert broadcasts.count("station") == {"nrj": 2, "bbc-2": 2, "funradio": 1}
+        assert broadcasts.count("country") == {"FR": 3, "GB": 2}
+        assert broadcasts.count("day") == {datetime.date(2023, 1, 1): 3, datetime.date(2023, 1, 2): 2}
+        assert broadcasts.count("hour") == {8: 3, 9: 1, 10: 1}
+
+        stations, days, spins = broadcasts.crosstab("station", "day")
+        assert stations == ["nrj", "bbc-2", "funradio"]
+        assert days == [datetime.date(2023, 1, 1), datetime.date(2023, 1, 2)]
+        assert spins.tolist() == [[2, 0], [1, 1], [0, 1]]
+
+        with self.assertRaises(ValueError):
+            broadcasts.spins()
+        with self.assertRaises(ValueError):
+            broadcasts.count("city")
+
+    def test_empty(self):
+        broadcasts = Broadcasts.from_items([])
+        assert broadcasts.count("country") == {}
+        assert broadcasts.spin_counts() == []
+
+    def test_one_fetch_for_both_views(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        requested = []
+
+        def fake_request(append_to_base_url: str) -> dict:
+            requested.append(append_to_base_url)
+            return {"items": [dict(item) for item in ITEMS]}
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            broadcasts = fetch_broadcasts(sc, "song", radio_slugs=["nrj", "bbc-2", "funradio"])
+            spins = sc.song_radio_spins("song", radio_slugs=["nrj", "bbc-2", "funradio"])
+
+        assert len(requested) == 2
+        # The same URL as the spins and spin count methods, so a cache serves all three from one response
+        assert requested[0] == requested[1]
+        assert len(broadcasts.spins()) == len(spins)
+        assert spins[0]["radio"] is spins[1]["radio"]
@@ -0,0 +1,71 @@
+import datetime
+import math
+import unittest
+from unittest import mock
+
+from soundchartspy.cache import ResponseCache
+from soundchartspy.client import SoundCharts
+from soundchartspy.endpoints import get_endpoint
+from soundchartspy.exceptions import SoundChartsError
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(entity_ttl=600, volatile_ttl=60)
+
+    def test_policies(self):
+        today = datetime.date.today()
+        last_year = str(today.year - 1)
+        ttl = self.cache.ttl
+        assert ttl(get_endpoint("song"), {"uuid": "a"}) == 600
+        assert ttl(get_endpoint("artist_current_stats"), {"uuid": "a"}) == 60
+        assert ttl(get_endpoint("artist_spotify_monthly_listeners_latest"), {"uuid": "a"}) == 60
+        assert ttl(get_endpoint("artist_audience_report_by_date"), {"uuid": "a"}) == math.inf
+        assert ttl(
+            get_endpoint("artist_spotify_monthly_listeners_by_month"), {"year": last_year, "month": "10"}
+        ) == math.inf
+        assert ttl(get_endpoint("artist_audience"), {"end_date": f"{last_year}-01-31"}) == math.inf
+        assert ttl(get_endpoint("artist_audience"), {"end_date": today.isoformat()}) == 60
+        assert ttl(get_endpoint("artist_audience"), {"start_date": f"{last_year}-01-01"}) == 60
+
+    def test_expired_responses_are_misses(self):
+        self.cache.set("/a", {"items": [1]}, ttl=60)
+        self.cache.set("/b", {"items": [2]}, ttl=math.inf)
+        assert self.cache.get("/a") == {"items": [1]}
+        with mock.patch("soundchartspy.cache.time.time", return_value=datetime.datetime.now().timestamp() + 61):
+            assert self.cache.get("/a") is None
+            assert self.cache.get("/b") == {"items": [2]}
+            assert self.cache.purge() == 1
+        assert len(self.cache) == 1
+
+    def test_client_serves_repeated_queries_from_cache(self):
+        sc = SoundCharts(app_id="id", api_key="key", cache=self.cache)
+        response = {"items": [{"date": "2020-01-01", "likeCount": 1, "followerCount": 2,
+                               "followingCount": 3, "postCount": 4, "viewCount": 5}]}
+        with mock.patch.object(sc, "_make_api_get_request", return_value=response) as request:
+            first = sc.artist_audience("a", start_date="2020-01-01", end_date="2020-01-31")
+            second = sc.artist_audience("a", start_date="2020-01-01", end_date="2020-01-31")
+        assert request.call_count == 1
+        assert first == second
+        assert self.cache.hits == 1
+
+    def test_not_found_lookups_are_cached(self):
+        sc = SoundCharts(app_id="id", api_key="key", cache=self.cache)
+        not_found = SoundChartsError(http_status=404, code="404", msg="Song not found")
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=not_found) as request:
+            for _ in range(3):
+                with self.assertRaises(SoundChartsError) as raised:
+                    sc.song_by_isrc(isrc="UNKNOWN0001")
+                assert raised.exception.http_status == 404
+        assert request.call_count == 1
+        assert self.cache.not_found_hits == 2
+
+    def test_other_errors_are_not_cached(self):
+        sc = SoundCharts(app_id="id", api_key="key", cache=self.cache)
+        forbidden = SoundChartsError(http_status=403, code="403", msg="Forbidden")
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=forbidden) as request:
+            for _ in range(2):
+                with self.assertRaises(SoundChartsError):
+                    sc.song_by_isrc(isrc="UNKNOWN0001")
+        assert request.call_count == 2
@@ -0,0 +1,84 @@
+import datetime
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from soundchartspy.charts import ChartHistory, fetch_chart_history
+
+
+def entry(chart: str, date: str, position: int) -> dict:
+    return {"chart": {"slug": chart, "name": chart}, "rankDate": f"{date}T00:00:00+00:00", "position": position}
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestChartHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.history = ChartHistory.from_entries(
+            [
+                entry("global-weekly", "2023-01-13", 40),
+                entry("global-weekly", "2023-01-06", 50),
+                entry("global-weekly", "2023-01-20", 12),
+                entry("global-weekly", "2023-01-27", 12),
+                entry("us-daily", "2023-01-02", 5),
+                entry("us-daily", "2023-01-03", 3),
+                entry("us-daily", "2023-01-09", 7),
+                {"chart": {"slug": "us-daily"}, "rankDate": None, "position": 1},
+            ]
+        )
+
+    def test_series(self):
+        assert sorted(self.history.charts) == ["global-weekly", "us-daily"]
+        weekly = self.history["global-weekly"]
+        assert list(weekly.positions) == [50, 40, 12, 12]
+        assert weekly.positions.dtype == np.int16
+        assert weekly.first_date == datetime.date(2023, 1, 6)
+        assert weekly.last_date == datetime.date(2023, 1, 27)
+
+    def test_queries(self):
+        weekly = self.history["global-weekly"]
+        assert weekly.peak == 12
+        assert weekly.peak_date == datetime.date(2023, 1, 20)
+        assert weekly.weeks_on_chart == 4
+        assert weekly.position_at("2023-01-13") == 40
+        assert weekly.position_at(datetime.date(2023, 1, 14)) is None
+        assert weekly.position_at("2022-01-01") is None
+
+        daily = self.history["us-daily"]
+        assert daily.days_on_chart == 3
+        # Monday 2023-01-02 and 2023-01-03 are one week, Monday 2023-01-09 starts the next
+        assert daily.weeks_on_chart == 2
+        dates, positions = daily.positions_between("2023-01-03", "2023-01-09")
+        assert list(dates.astype(str)) == ["2023-01-03", "2023-01-09"]
+        assert list(positions) == [3, 7]
+
+    def test_fetch_pages_full_history(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        first_day = datetime.date(2023, 1, 1)
+        pages = {
+            0: {"items": [entry("global-daily", str(first_day + datetime.timedelta(days=i)), 50) for i in range(100)]},
+            100: {"items": [entry("global-daily", "2023-06-01", 1)]},
+        }
+        requested = []
+
+        def fake_request(append_to_base_url: str) -> dict:
+            requested.append(append_to_base_url)
+            offset = int(append_to_base_url.split("offset=")[1].split("&")[0])
+            return pages[offset]
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            history = fetch_chart_history(sc, "song")
+
+        series = history["global-daily"]
+        assert len(series) == 101
+        assert series.peak == 1
+        assert series.peak_date == datetime.date(2023, 6, 1)
+        assert len(requested) == 2
+        assert all("current_only=0" in url and "sort_by=rankdate" in url for url in requested)
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from soundchartspy.checkpoint import CheckpointJournal, query_digest
+from soundchartspy.client import SoundCharts
+
+
+def _album_page(offset: int, count: int) -> dict:
+    return {
+        "items": [
+            {
+                "name": f"album-{offset + i}",
+                "creditName": "artist",
+                "releaseDate": "2020-01-01T00:00:00+00:00",
+                "type": "album",
+                "uuid": f"uuid-{offset + i}",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+class TestCheckpointJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "crawl.journal")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_units_survive_reopening(self):
+        journal = CheckpointJournal(self.path)
+        journal.mark_complete("artist_albums", "a", 0)
+        journal.mark_complete("artist_albums", "a", 100, last=True)
+
+        reopened = CheckpointJournal(self.path)
+        assert reopened.is_complete("artist_albums", "a", 0)
+        assert reopened.is_complete("artist_albums", "a", 100)
+        assert reopened.is_exhausted("artist_albums", "a")
+        assert not reopened.is_complete("artist_albums", "b", 0)
+
+    def test_truncated_line_is_ignored(self):
+        journal = CheckpointJournal(self.path)
+        journal.mark_complete("song", "a")
+        with open(self.path, "a") as journal_file:
+            journal_file.write('{"method": "song", "ke')
+
+        reopened = CheckpointJournal(self.path)
+        assert reopened.completed_offsets("song", "a") == {0}
+
+    def test_paginate_resumes_after_crash(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        journal = CheckpointJournal(self.path)
+        pages = {0: _album_page(0, 2), 2: _album_page(2, 2), 4: _album_page(4, 1)}
+        requested = []
+
+        def fake_request(append_to_base_url: str) -> dict:
+            offset = int(append_to_base_url.split("offset=")[1].split("&")[0])
+            requested.append(offset)
+            if offset == 4 and len(requested) == 3:
+                raise ConnectionError("crash")
+            return pages[offset]
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            with self.assertRaises(ConnectionError):
+                list(sc.paginate("artist_albums", "artist", limit=2, checkpoint=journal))
+            albums = list(
+                sc.paginate("artist_albums", "artist", limit=2, checkpoint=journal)
+            )
+
+        assert [album.name for album in albums] == ["album-4"]
+        assert requested == [0, 2, 4, 4]
+        assert journal.is_exhausted("artist_albums", "artist", query_digest(limit=2))
+
+    def test_other_queries_are_not_skipped(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        journal = CheckpointJournal(self.path)
+        requested = []
+
+        def fake_request(append_to_base_url: str) -> dict:
+            requested.append(append_to_base_url)
+            return _album_page(0, 1)
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            list(sc.paginate("artist_albums", "artist", limit=2, checkpoint=journal, type="single"))
+            list(sc.paginate("artist_albums", "artist", limit=2, checkpoint=journal, type="single"))
+            list(sc.paginate("artist_albums", "artist", limit=2, checkpoint=journal, type="album"))
+            list(sc.paginate("artist_albums", "artist", limit=5, checkpoint=journal, type="album"))
+
+        assert len(requested) == 3, "only the repeated query should be skipped"
+        reopened = CheckpointJournal(self.path)
+        assert reopened.is_exhausted("artist_albums", "artist", query_digest(limit=5, type="album"))
+        assert not reopened.is_exhausted("artist_albums", "artist")
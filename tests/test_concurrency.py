@@ -0,0 +1,144 @@
+import gc
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from soundchartspy.cache import ResponseCache
+from soundchartspy.client import SoundCharts
+from soundchartspy.concurrency import AdaptiveConcurrency
+from soundchartspy.exceptions import SoundChartsError
+from tests.stub_server import StubSoundChartsServer, default_handler
+
+CALLS = 2000
+WORKERS = 32
+# Each request waits on the server for this long, so threads have waits to overlap
+SERVER_LATENCY = 0.02
+
+
+class TestConcurrentClient(unittest.TestCase):
+
+    def test_shared_client_under_load(self):
+        with StubSoundChartsServer(delay=SERVER_LATENCY) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url
+        ) as sc:
+            # Serial baseline, on warm connections
+            sc.song(uuid="warmup")
+            start = time.perf_counter()
+            for i in range(50):
+                sc.song(uuid=f"serial-{i}")
+            serial_per_call = (time.perf_counter() - start) / 50
+
+            uuids = [f"song-{i}" for i in range(CALLS)]
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+                songs = list(executor.map(lambda uuid: sc.song(uuid=uuid), uuids))
+            elapsed = time.perf_counter() - start
+
+            assert [song.uuid for song in songs] == uuids
+            assert [song.isrc.value for song in songs] == [f"ISRC{uuid}" for uuid in uuids]
+            assert sc.metrics()["requests"] == CALLS + 51
+            assert sc.metrics()["errors"] == 0
+            # Calls mostly wait on the server, so threads must make them several times faster than one by one. The
+            # stub shares the GIL with the client, which caps the speedup at about 10x
+            speedup = serial_per_call * CALLS / elapsed
+            assert speedup > 3, f"{WORKERS} threads were only {speedup:.1f}x faster than one"
+
+    def test_sessions_of_finished_workers_are_released(self):
+        with StubSoundChartsServer(lambda path: (200, {"items": []})) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url
+        ) as sc:
+            for _ in range(20):
+                audience = sc.artist_audience_by_platforms("artist", ["spotify", "instagram", "tiktok"])
+                assert not audience.errors
+            gc.collect()
+            # Every fan-out starts new worker threads, their sessions go with them
+            assert len(sc._sessions) <= 3, len(sc._sessions)
+
+    def test_shared_cache_under_load(self):
+        cache = ResponseCache()
+        with StubSoundChartsServer() as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, cache=cache
+        ) as sc:
+            uuids = [f"song-{i % 100}" for i in range(CALLS)]
+            with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+                songs = list(executor.map(lambda uuid: sc.song(uuid=uuid), uuids))
+
+            assert [song.uuid for song in songs] == uuids
+            metrics = sc.metrics()
+            assert metrics["cache_hits"] + metrics["cache_misses"] == CALLS
+            assert metrics["requests"] == metrics["cache_misses"]
+            assert len(cache) == 100
+
+
+def throttled(path: str) -> tuple[int, dict]:
+    if "throttled" in path:
+        return 429, {"errors": [{"code": 429, "message": "Too many requests"}]}
+    return default_handler(path)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+
+    def run_batch(self, concurrency: AdaptiveConcurrency, latency: float, overloaded: bool = False):
+        # One full limit of requests sent together
+        slots = concurrency.limit
+        for _ in range(slots):
+            assert concurrency.acquire(timeout=0)
+        for _ in range(slots):
+            concurrency.release(latency, overloaded)
+
+    def test_limit_grows_while_healthy(self):
+        concurrency = AdaptiveConcurrency(initial_limit=2, max_limit=10)
+        for _ in range(20):
+            self.run_batch(concurrency, latency=0.1)
+        assert concurrency.limit == 10
+        assert concurrency.in_flight == 0
+
+    def test_limit_does_not_grow_when_unused(self):
+        concurrency = AdaptiveConcurrency(initial_limit=4)
+        for _ in range(100):
+            concurrency.acquire()
+            concurrency.release(0.1)
+        assert concurrency.limit == 4
+
+    def test_backs_off_once_per_round_trip(self):
+        concurrency = AdaptiveConcurrency(initial_limit=16)
+        self.run_batch(concurrency, latency=0.5)
+        self.run_batch(concurrency, latency=None, overloaded=True)
+        assert concurrency.limit == 8
+        assert concurrency.backoffs == 1
+
+        time.sleep(0.6)
+        self.run_batch(concurrency, latency=None, overloaded=True)
+        assert concurrency.limit == 4
+
+    def test_backs_off_on_rising_latency(self):
+        concurrency = AdaptiveConcurrency(initial_limit=8)
+        self.run_batch(concurrency, latency=0.01)
+        self.run_batch(concurrency, latency=0.2)
+        assert concurrency.limit == 4
+
+    def test_acquire_waits_for_a_slot(self):
+        concurrency = AdaptiveConcurrency(initial_limit=1)
+        assert concurrency.acquire()
+        assert not concurrency.acquire(timeout=0.05)
+        concurrency.release(0.01)
+        assert concurrency.acquire(timeout=0.05)
+
+    def test_client_backs_off_on_throttling(self):
+        concurrency = AdaptiveConcurrency(initial_limit=8)
+        with StubSoundChartsServer(throttled) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, concurrency=concurrency
+        ) as sc:
+            with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+                songs = list(executor.map(lambda i: sc.song(uuid=f"song-{i}"), range(200)))
+            assert len(songs) == 200
+            assert sc.metrics()["in_flight"] == 0
+            before = sc.metrics()
+            assert 1 <= before["concurrency_limit"] <= 64
+
+            time.sleep(0.1)
+            with self.assertRaises(SoundChartsError):
+                sc.song(uuid="throttled")
+            after = sc.metrics()
+            assert after["concurrency_backoffs"] == before["concurrency_backoffs"] + 1
+            assert after["concurrency_limit"] == max(1, before["concurrency_limit"] // 2)
@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.endpoints import ENDPOINTS, get_endpoint
+
+
+class TestEndpointRegistry(unittest.TestCase):
+
+    def test_every_client_method_is_registered(self):
+        for name in ENDPOINTS:
+            assert callable(getattr(SoundCharts, name)), f"{name} has no client method"
+
+    def test_none_parameters_are_dropped(self):
+        url = get_endpoint("song_radio_spins").url(
+            uuid="abc", radio_slugs=["bbc-2", "bbc-london"], country_code=None,
+            start_date=None, end_date=None, offset=0, limit=100,
+        )
+        assert url == "/api/v2/song/abc/broadcasts?limit=100&offset=0&radio_slugs=bbc-2,bbc-london"
+
+    def test_date_range_without_start_date(self):
+        url = get_endpoint("artist_audience").url(
+            uuid="abc", platform="spotify", start_date=None, end_date="2024-01-01"
+        )
+        assert url == "/api/v2/artist/abc/audience/spotify?endDate=2024-01-01"
+
+    def test_no_query_string_without_parameters(self):
+        url = get_endpoint("artist_audience").url(uuid="abc", platform="spotify")
+        assert url == "/api/v2/artist/abc/audience/spotify"
+
+    def test_parameter_order_does_not_change_url(self):
+        endpoint = get_endpoint("song_albums")
+        assert endpoint.url(uuid="a", limit=10, offset=0) == endpoint.url(offset=0, uuid="a", limit=10)
+
+    def test_values_are_encoded(self):
+        url = get_endpoint("song_by_platform_id").url(platform="apple music", identifier="a/b")
+        assert url == "/api/v2.25/song/by-platform/apple%20music/a%2Fb"
+        url = get_endpoint("song_chart_entries").url(uuid="a", platform="spotify", current_only=False)
+        assert url == "/api/v2/song/a/charts/ranks/spotify?current_only=0"
+
+    def test_unknown_parameter_raises(self):
+        with self.assertRaises(TypeError):
+            get_endpoint("song").url(uuid="a", limit=1)
+        with self.assertRaises(TypeError):
+            get_endpoint("song").url()
+
+    def test_client_requests_canonical_url(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        with mock.patch.object(sc, "_make_api_get_request", return_value={"items": []}) as request:
+            sc.song_audience(uuid="abc", platform="spotify")
+        request.assert_called_once_with(append_to_base_url="/api/v2/song/abc/audience/spotify")
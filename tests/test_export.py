@@ -0,0 +1,53 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from soundchartspy.data import Album, Genre, Label, Playlist, PlaylistPosition, ShortVideo
+
+try:
+    import pyarrow.parquet as pq
+
+    from soundchartspy.export import schema_for, to_table, write_parquet
+except ImportError:
+    pq = None
+
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TestExport(unittest.TestCase):
+
+    def test_nested_schema(self):
+        from soundchartspy.data import Song
+
+        schema = schema_for(Song)
+        assert str(schema.field("genres").type) == "list<item: struct<root: string, sub: list<item: string>>>"
+        assert str(schema.field("labels").type) == "list<item: struct<name: string, type: string>>"
+        assert schema.field("isrc").type.num_fields == 3
+
+    def test_pairs_and_json_fields(self):
+        playlist = Playlist("p", "Playlist", "id", "spotify", "FR", "2024-01-01T00:00:00+00:00", 50, 1000, "editorial")
+        position = PlaylistPosition(3, 1, "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", "2024-01-01T00:00:00Z")
+        table = to_table([(playlist, position)])
+        assert table.column_names == ["playlist", "playlistPosition"]
+        assert table.column("playlistPosition").to_pylist()[0]["peakPosition"] == 1
+
+        video = ShortVideo("v", "title", "", "2024-01-01T00:00:00+00:00", "", {"views": 10})
+        assert to_table([video]).column("latestAudience").to_pylist() == ['{"views": 10}']
+
+    def test_write_parquet_in_chunks(self):
+        albums = (
+            Album(f"album-{i}", "artist", datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc), "album", str(i))
+            for i in range(25)
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "albums.parquet")
+            assert write_parquet(albums, path, batch_size=10) == 25
+            parquet_file = pq.ParquetFile(path)
+            assert parquet_file.metadata.num_row_groups == 3
+            assert parquet_file.read().column("name").to_pylist()[-1] == "album-24"
+
+    def test_empty_export_needs_model(self):
+        assert to_table([], model=Genre).num_rows == 0
+        with self.assertRaises(ValueError):
+            to_table([])
+        assert schema_for(Label).names == ["name", "type"]
@@ -0,0 +1,37 @@
+import datetime
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.exceptions import SoundChartsError
+
+
+def _audience(*dates: str) -> dict:
+    return {
+        "items": [
+            {"date": f"{date}T00:00:00+00:00", "likeCount": None, "followerCount": i,
+             "followingCount": None, "postCount": None, "viewCount": None}
+            for i, date in enumerate(dates)
+        ]
+    }
+
+
+class TestAudienceFanOut(unittest.TestCase):
+
+    def test_platforms_are_aligned_and_errors_isolated(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+
+        def fake_request(append_to_base_url: str) -> dict:
+            if "/spotify" in append_to_base_url:
+                return _audience("2024-01-01", "2024-01-02")
+            if "/instagram" in append_to_base_url:
+                return _audience("2024-01-02", "2024-01-03")
+            raise SoundChartsError(http_status=400, code="400", msg="unsupported platform")
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            audience = sc.artist_audience_by_platforms("a", ["spotify", "instagram", "triller"])
+
+        assert audience.dates == [datetime.date(2024, 1, d) for d in (1, 2, 3)]
+        assert audience.metric("spotify", "followerCount") == [0, 1, None]
+        assert audience.metric("instagram", "followerCount") == [None, 0, 1]
+        assert list(audience.errors) == ["triller"]
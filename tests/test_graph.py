@@ -0,0 +1,76 @@
+import time
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.graph import SimilarArtistCrawler
+from soundchartspy.scheduler import BULK, current_priority
+from soundchartspy.timeouts import Deadline, DeadlineExceeded, current_timeout, request_timeout
+
+GRAPH = {"a": ["b", "c"], "b": ["a", "d"], "c": ["d"], "d": ["e"], "e": []}
+
+
+def _artist(uuid: str) -> dict:
+    return {"uuid": uuid, "slug": uuid, "name": uuid, "appUrl": "", "imageUrl": ""}
+
+
+def fake_request(append_to_base_url: str) -> dict:
+    uuid = append_to_base_url.split("/artist/")[1].split("/")[0]
+    return {"items": [_artist(target) for target in GRAPH[uuid]]}
+
+
+class TestSimilarArtistCrawler(unittest.TestCase):
+
+    def setUp(self):
+        self.sc = SoundCharts(app_id="id", api_key="key")
+
+    def test_breadth_first_crawl_visits_each_artist_once(self):
+        crawler = SimilarArtistCrawler(self.sc, max_depth=2, max_workers=2)
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=fake_request) as request:
+            edges = set(crawler.crawl(["a"]))
+
+        assert edges == {("a", "b"), ("a", "c"), ("b", "a"), ("b", "d"), ("c", "d")}
+        assert request.call_count == 3
+        assert set(crawler.nodes) == {"a", "b", "c", "d"}
+
+        indptr, indices = crawler.to_csr()
+        a = crawler.node_id("a")
+        targets = {crawler.nodes[i] for i in indices[indptr[a]:indptr[a + 1]]}
+        assert targets == {"b", "c"}
+        assert indptr[-1] == crawler.edge_count == 5
+
+    def test_max_nodes_bounds_the_graph(self):
+        crawler = SimilarArtistCrawler(self.sc, max_depth=5, max_nodes=3)
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=fake_request):
+            list(crawler.crawl(["a"]))
+        assert crawler.nodes == ["a", "b", "c"]
+
+    def test_requests_run_with_bulk_priority_and_caller_context(self):
+        seen = []
+
+        def recording_request(append_to_base_url: str) -> dict:
+            seen.append((current_priority()[0], current_timeout()))
+            return fake_request(append_to_base_url)
+
+        crawler = SimilarArtistCrawler(self.sc, max_depth=2, max_workers=2)
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=recording_request):
+            with request_timeout(7):
+                list(crawler.crawl(["a"]))
+        assert seen and all(seen_call == (BULK, 7) for seen_call in seen), seen
+
+    def test_deadline_stops_the_crawl(self):
+        def slow_request(append_to_base_url: str) -> dict:
+            if "/artist/a/" not in append_to_base_url:
+                time.sleep(0.5)
+            return fake_request(append_to_base_url)
+
+        crawler = SimilarArtistCrawler(self.sc, max_depth=3, max_workers=2)
+        deadline = Deadline(0.2)
+        start = time.monotonic()
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=slow_request):
+            edges = set(crawler.crawl(["a"], deadline=deadline))
+        assert time.monotonic() - start < 0.45, "the crawl should not wait for requests past the deadline"
+        assert edges == {("a", "b"), ("a", "c")}
+        assert deadline.exceeded
+        assert set(crawler.errors) == {"b", "c"}
+        assert all(isinstance(error, DeadlineExceeded) for error in crawler.errors.values())
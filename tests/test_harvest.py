@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.exceptions import SoundChartsError
+from soundchartspy.harvest import AudienceReportHarvester, AudienceReportStore
+from soundchartspy.timeouts import Deadline
+
+
+class TestAudienceReportHarvester(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = AudienceReportStore(self.directory.name)
+        self.sc = SoundCharts(app_id="id", api_key="key")
+        self.requested = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fake_request(self, append_to_base_url: str) -> dict:
+        self.requested.append(append_to_base_url)
+        if "/tiktok/" in append_to_base_url:
+            raise SoundChartsError(http_status=404, code="404", msg="no report")
+        if "available-dates" in append_to_base_url:
+            return {"items": [{"date": "2024-01-01T00:00:00+00:00"}, {"date": "2024-02-01T00:00:00+00:00"}]}
+        return {"object": {"url": append_to_base_url}}
+
+    def test_harvest_skips_stored_dates_and_isolates_errors(self):
+        self.store.put("artist", "instagram", "2024-01-01", {"object": {}})
+        harvester = AudienceReportHarvester(self.sc, self.store, max_workers=4)
+
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=self.fake_request):
+            summary = harvester.harvest(["artist"], platforms=["instagram", "tiktok"])
+
+        assert summary.fetched == [("artist", "instagram", "2024-02-01")]
+        assert summary.skipped == 1
+        assert list(summary.errors) == [("artist", "tiktok")]
+        assert not any(url.endswith("/report/2024-01-01") for url in self.requested)
+        assert self.store.get("artist", "instagram", "2024-02-01") == {
+            "object": {"url": "/api/v2/artist/artist/audience/instagram/report/2024-02-01"}
+        }
+        assert self.store.dates("artist", "instagram") == {"2024-01-01", "2024-02-01"}
+
+    def test_harvest_stops_at_deadline(self):
+        def slow_request(append_to_base_url: str) -> dict:
+            if "available-dates" not in append_to_base_url:
+                time.sleep(0.5)
+            return self.fake_request(append_to_base_url)
+
+        harvester = AudienceReportHarvester(self.sc, self.store, max_workers=1)
+        deadline = Deadline(0.2)
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=slow_request):
+            summary = harvester.harvest(["artist"], platforms=["instagram"], deadline=deadline)
+
+        assert summary.deadline_exceeded
+        assert summary.fetched == []
+
+    def test_malformed_report_only_fails_itself(self):
+        def malformed_request(append_to_base_url: str) -> dict:
+            if "2024-02-01" in append_to_base_url:
+                # Not serializable, so storing it fails
+                return {"object": {"url": object()}}
+            return self.fake_request(append_to_base_url)
+
+        harvester = AudienceReportHarvester(self.sc, self.store, max_workers=2)
+        with mock.patch.object(self.sc, "_make_api_get_request", side_effect=malformed_request):
+            summary = harvester.harvest(["artist"], platforms=["instagram"])
+
+        assert summary.fetched == [("artist", "instagram", "2024-01-01")]
+        assert isinstance(summary.errors[("artist", "instagram", "2024-02-01")], TypeError)
+        assert self.store.dates("artist", "instagram") == {"2024-01-01"}
+        stored = os.listdir(os.path.join(self.directory.name, "instagram", "artist"))
+        assert stored == ["2024-01-01.json"], "A failed write should not leave a temporary file behind"
@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.hedging import HedgePolicy
+from tests.stub_server import StubSoundChartsServer
+
+
+class FirstRequestSlow:
+    """Delays the first request for each 'outlier' song, as a stalled connection would."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.seen: set[str] = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, path: str) -> float:
+        if "outlier" not in path:
+            return 0
+        with self.lock:
+            first = path not in self.seen
+            self.seen.add(path)
+        return self.seconds if first else 0
+
+
+class TestHedgePolicy(unittest.TestCase):
+
+    def test_delay_is_observed_quantile(self):
+        policy = HedgePolicy(quantile=0.9, min_samples=10, min_delay=0)
+        for i in range(1, 10):
+            policy.observe("song", i / 100)
+        assert policy.delay("song") is None
+
+        policy.observe("song", 0.10)
+        assert policy.delay("song") == 0.09
+        assert policy.delay("artist") is None
+
+    def test_hedge_rate_is_capped(self):
+        policy = HedgePolicy(max_rate=0.1)
+        for _ in range(20):
+            policy.start_request()
+        assert policy.try_hedge()
+        assert policy.try_hedge()
+        assert not policy.try_hedge()
+
+
+class TestHedgedRequests(unittest.TestCase):
+
+    def warm_up(self, sc: SoundCharts):
+        for i in range(20):
+            sc.song(uuid=f"song-{i}")
+
+    def test_slow_request_is_hedged(self):
+        policy = HedgePolicy(min_samples=10, max_rate=0.1)
+        with StubSoundChartsServer(delay=FirstRequestSlow(2.0)) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, hedging=policy
+        ) as sc:
+            self.warm_up(sc)
+            start = time.perf_counter()
+            song = sc.song(uuid="outlier")
+
+            assert time.perf_counter() - start < 1
+            assert song.uuid == "outlier"
+            metrics = sc.metrics()
+            assert metrics["hedges"] == 1
+            assert metrics["hedge_wins"] == 1
+
+    def test_no_hedge_over_rate_cap(self):
+        policy = HedgePolicy(min_samples=10, max_rate=0)
+        with StubSoundChartsServer(delay=FirstRequestSlow(0.5)) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, hedging=policy
+        ) as sc:
+            self.warm_up(sc)
+            start = time.perf_counter()
+            assert sc.song(uuid="outlier").uuid == "outlier"
+
+            assert time.perf_counter() - start >= 0.5
+            assert "hedges" not in sc.metrics()
+            assert len(server.requests) == 21
+
+    def test_hedging_does_not_limit_concurrency(self):
+        policy = HedgePolicy(min_samples=10, max_rate=0, max_workers=1)
+        delay = lambda path: 0.3 if "parallel" in path else 0  # noqa: E731
+        with StubSoundChartsServer(delay=delay) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, hedging=policy
+        ) as sc:
+            self.warm_up(sc)
+            threads = [threading.Thread(target=sc.song, args=(f"parallel-{i}",)) for i in range(4)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            elapsed = time.perf_counter() - start
+            assert elapsed < 0.9, f"primary requests were queued behind the hedge pool ({elapsed:.2f}s)"
+            latencies = policy._latencies["/api/v2.25/song/{uuid}"]
+            assert max(latencies) < 0.6, "latency samples should not include time spent waiting for a worker"
+
+    def test_hedged_requests_reuse_threads_and_sessions(self):
+        policy = HedgePolicy(min_samples=5, max_rate=0)
+        with StubSoundChartsServer() as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, hedging=policy
+        ) as sc:
+            for i in range(30):
+                sc.song(uuid=f"song-{i}")
+            # The calling thread's session and the one of the reused primary worker
+            assert len(sc._sessions) == 2, len(sc._sessions)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.index import ISRC_PLATFORM, SONG, IdentifierIndex
+
+SONG_RESPONSE = {
+    "object": {
+        "uuid": "song-uuid",
+        "name": "Song",
+        "isrc": {"value": "USAT22003425", "countryCode": "US", "countryName": "United States"},
+        "creditName": "Artist",
+        "artists": [],
+        "releaseDate": "2020-01-01T00:00:00+00:00",
+        "copyright": "",
+        "appUrl": "",
+        "imageUrl": "",
+        "duration": 180,
+        "genres": [],
+        "composers": [],
+        "producers": [],
+        "labels": [],
+        "audio": {
+            "danceability": 0.5, "energy": 0.5, "instrumentalness": 0.0, "key": 1, "liveness": 0.1,
+            "loudness": -5.0, "mode": 1, "speechiness": 0.1, "tempo": 120.0, "timeSignature": 4, "valence": 0.5,
+        },
+        "explicit": False,
+        "languageCode": "en",
+    }
+}
+
+IDS_RESPONSE = {
+    "items": [
+        {"platformName": "Spotify", "platformCode": "spotify", "identifier": "spotify-id", "url": "", "default": True},
+        {"platformName": "Deezer", "platformCode": "deezer", "identifier": "123", "url": "", "default": True},
+    ]
+}
+
+
+class TestIdentifierIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "ids.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resolution_is_filled_by_lookups_and_persists(self):
+        sc = SoundCharts(app_id="id", api_key="key", index=IdentifierIndex(self.path))
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=[SONG_RESPONSE, IDS_RESPONSE]):
+            assert sc.resolve_song_uuid(isrc="USAT22003425") == "song-uuid"
+            sc.song_ids(uuid="song-uuid")
+
+        reopened = SoundCharts(app_id="id", api_key="key", index=IdentifierIndex(self.path))
+        with mock.patch.object(reopened, "_make_api_get_request") as request:
+            assert reopened.resolve_song_uuid(isrc="USAT22003425") == "song-uuid"
+            assert reopened.resolve_song_uuid(platform="deezer", identifier="123") == "song-uuid"
+        request.assert_not_called()
+
+    def test_identifiers_by_uuid(self):
+        index = IdentifierIndex()
+        index.add(SONG, "song-uuid", [(ISRC_PLATFORM, "USAT22003425"), ("spotify", "a"), ("spotify", "b")])
+        assert index.identifiers(SONG, "song-uuid") == {"isrc": ["USAT22003425"], "spotify": ["a", "b"]}
+        assert index.lookup(SONG, "spotify", "c") is None
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.ledger import QuotaLedger
+from tests.stub_server import StubSoundChartsServer, default_handler
+
+
+def take_tokens(path: str, count: int) -> float:
+    with QuotaLedger(path, rate=50, burst=1) as ledger:
+        for _ in range(count):
+            ledger.acquire()
+    return time.time()
+
+
+class TestQuotaLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "soundcharts.ledger")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_instances_share_one_bucket(self):
+        with QuotaLedger(self.path, rate=20, burst=2) as first, QuotaLedger(self.path, rate=20, burst=2) as second:
+            assert first.try_acquire() == 0
+            assert second.try_acquire() == 0
+            assert first.try_acquire() > 0
+            assert not second.acquire(timeout=0.01)
+            assert second.acquire(timeout=0.1)
+
+    def test_threads_share_one_bucket(self):
+        barrier = threading.Barrier(8)
+
+        def take(ledger: QuotaLedger) -> float:
+            barrier.wait()
+            return ledger.try_acquire()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for attempt in range(200):
+                with QuotaLedger(f"{self.path}.{attempt}", rate=0.01, burst=1) as ledger:
+                    waits = list(executor.map(take, [ledger] * 8))
+                assert waits.count(0) == 1, "Only one thread should get the single token"
+
+    def test_processes_share_one_rate_limit(self):
+        start = time.time()
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            finished = list(executor.map(take_tokens, [self.path] * 4, [6] * 4))
+        # 24 requests at 50 per second, one of them from the initial burst
+        assert max(finished) - start >= 23 / 50
+
+    def test_quota_is_lowest_recent_value(self):
+        with QuotaLedger(self.path, rate=10, quota_settle_seconds=0.1) as ledger, QuotaLedger(self.path, rate=10) as other:
+            assert ledger.quota_remaining is None
+            ledger.record_headers({"x-quota-remaining": "1000"})
+            other.record_headers({"x-quota-remaining": "998"})
+            ledger.record_headers({"x-quota-remaining": "999"})
+            assert other.quota_remaining == 998
+
+            time.sleep(0.15)
+            ledger.record_quota(5000)
+            assert other.quota_remaining == 5000
+            ledger.record_headers({"x-quota-remaining": "unknown"})
+            assert other.quota_remaining == 5000
+
+    def test_client_records_quota_headers(self):
+        def handler(path: str):
+            status, document = default_handler(path)
+            return status, document, {"X-Quota-Remaining": "4242"}
+
+        with QuotaLedger(self.path, rate=100) as ledger, StubSoundChartsServer(handler) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, ledger=ledger
+        ) as sc:
+            sc.song(uuid="song")
+            assert sc.metrics()["quota_remaining"] == 4242
@@ -0,0 +1,145 @@
+import dataclasses
+import unittest
+from typing import Optional
+
+from soundchartspy.data import Album, Artist, AudienceData, Playlist, PlaylistPosition, RadioStation, Song
+from soundchartspy.models import compile_constructor, constructor, required_fields, unknown_fields
+from soundchartspy.utils import (
+    convert_json_to_artist_object,
+    convert_playlist_entry_data_to_tuple_pair,
+    convert_radio_items,
+    convert_song_response_to_object,
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Frozen:
+    name: str
+    tags: list = dataclasses.field(default_factory=list)
+    count: Optional[int] = 0
+
+
+class TestConstructors(unittest.TestCase):
+
+    def test_matches_keyword_construction(self):
+        item = {"name": "Album", "creditName": "Artist", "releaseDate": "2020-01-01", "type": "album",
+                "uuid": "abc", "default": True}
+        assert constructor(Album)(item) == Album(**item)
+
+    def test_unknown_fields_are_ignored(self):
+        item = {"date": "2023-01-01", "likeCount": 1, "followerCount": 2, "followingCount": 3, "postCount": 4,
+                "viewCount": 5, "shareCount": 6}
+        with self.assertRaises(TypeError):
+            AudienceData(**item)
+        audience = constructor(AudienceData)(item)
+        assert audience.followerCount == 2
+        assert unknown_fields(audience) == {}
+
+    def test_unknown_fields_are_collected(self):
+        construct = constructor(Album, collect_unknown=True)
+        item = {"name": "Album", "creditName": "Artist", "releaseDate": None, "type": "album", "uuid": "abc"}
+        assert unknown_fields(construct({**item, "upc": "123"})) == {"upc": "123"}
+        assert unknown_fields(construct({**item, "default": True, "upc": "123"})) == {"upc": "123"}
+        assert unknown_fields(construct(item)) == {}
+        assert constructor(Album, collect_unknown=True) is construct
+
+    def test_missing_optional_fields(self):
+        album = constructor(Album)({"name": "Album", "creditName": "Artist", "releaseDate": None, "type": "album",
+                                    "uuid": "abc"})
+        assert album.default is None
+        audience = constructor(AudienceData)({"date": "2023-01-01", "followerCount": 2})
+        assert audience.likeCount is None
+
+    def test_missing_required_fields(self):
+        assert required_fields(Album) == {"name", "creditName", "releaseDate", "type", "uuid"}
+        assert required_fields(AudienceData) == {"date"}, "Optional fields are not required"
+        with self.assertRaises(TypeError):
+            constructor(Album)({"name": "Album"})
+        with self.assertRaises(TypeError):
+            constructor(Frozen)({"tags": []})
+        assert constructor(Frozen)({"name": "a"}).count == 0
+
+    def test_lenient_constructors(self):
+        album = constructor(Album, strict=False)({"name": "Album"})
+        assert album.uuid is None, "Without strict, missing required fields are None"
+        assert constructor(Album, strict=False) is not constructor(Album)
+
+    def test_defaults_and_frozen_classes(self):
+        construct = compile_constructor(Frozen, collect_unknown=True)
+        first, second = construct({"name": "a", "extra": 1}), construct({"name": "b"})
+        assert first.count == 0
+        assert first.tags == []
+        assert first.tags is not second.tags
+        assert unknown_fields(first) == {"extra": 1}
+
+    def test_not_a_data_class(self):
+        with self.assertRaises(TypeError):
+            compile_constructor(dict)
+
+    def test_playlist_entry_with_new_fields(self):
+        playlist, position = convert_playlist_entry_data_to_tuple_pair(
+            {
+                "playlist": {"uuid": "p", "name": "Playlist", "identifier": "i", "platform": "spotify",
+                             "countryCode": "US", "latestCrawlDate": None, "latestTrackCount": 50,
+                             "latestSubscriberCount": 10, "type": "editorial", "images": []},
+                "position": 3,
+                "peakPosition": 1,
+                "entryDate": "2023-01-01",
+                "positionDate": "2023-01-02",
+                "peakPositionDate": "2023-01-02",
+                "addedAt": "2023-01-01",
+            }
+        )
+        assert isinstance(playlist, Playlist)
+        assert position == PlaylistPosition(3, 1, "2023-01-01", "2023-01-02", "2023-01-02")
+
+
+class TestConverters(unittest.TestCase):
+
+    def test_song_with_missing_fields(self):
+        song = convert_song_response_to_object(
+            {"object": {"uuid": "abc", "name": "Song", "isrc": None, "genres": None, "artists": [
+                {"uuid": "a", "slug": "artist", "name": "Artist", "appUrl": None, "imageUrl": None}]}}
+        )
+        assert isinstance(song, Song)
+        assert song.releaseDate is None
+        assert song.isrc is None
+        assert song.audio is None
+        assert song.genres is None
+        assert song.labels is None
+        assert song.artists[0].name == "Artist"
+
+    def test_song_release_date(self):
+        song = convert_song_response_to_object(
+            {"object": {"uuid": "abc", "name": "Song", "releaseDate": "2020-01-01T00:00:00+00:00"}}
+        )
+        assert song.releaseDate.year == 2020
+
+    def test_artist_with_missing_fields(self):
+        artist = convert_json_to_artist_object(
+            {"uuid": "a", "slug": "artist", "name": "Artist", "appUrl": None, "imageUrl": None}
+        )
+        assert isinstance(artist, Artist)
+        assert artist.birthDate is None
+        assert artist.genres is None
+        artist = convert_json_to_artist_object(
+            {"uuid": "a", "slug": "artist", "name": "Artist", "appUrl": None, "imageUrl": None,
+             "birthDate": "1990-05-01T00:00:00+00:00", "genres": [{"root": "pop", "sub": []}]}
+        )
+        assert artist.birthDate.year == 1990
+        assert artist.genres[0].root == "pop"
+
+    def test_playlist_entry_without_playlist(self):
+        playlist, position = convert_playlist_entry_data_to_tuple_pair(
+            {"position": 3, "peakPosition": 1, "entryDate": None, "positionDate": None, "peakPositionDate": None}
+        )
+        assert playlist is None
+        assert position.position == 3
+
+    def test_radio_items_share_stations(self):
+        radio = {"slug": "bbc-2", "name": "BBC Radio 2", "cityName": "London", "countryCode": "GB",
+                 "countryName": "United Kingdom", "timeZone": "Europe/London"}
+        items = convert_radio_items([{"radio": dict(radio)}, {"radio": dict(radio)}, {"radio": None}])
+        assert isinstance(items[0]["radio"], RadioStation)
+        assert items[0]["radio"] is items[1]["radio"]
+        assert items[2]["radio"] is None
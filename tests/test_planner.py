@@ -0,0 +1,43 @@
+import unittest
+
+from soundchartspy.cache import ResponseCache
+from soundchartspy.client import SoundCharts
+from soundchartspy.planner import Job, plan_requests
+
+
+class TestRequestPlanner(unittest.TestCase):
+
+    def test_windows_and_pages(self):
+        plan = plan_requests([
+            Job("artist_audience", keys=10,
+                params={"platform": "instagram", "start_date": "2023-01-01", "end_date": "2023-12-31"}),
+            Job("artist_albums", keys=10, expected_items=150),
+            Job("artist_albums", keys=10, expected_items=200),
+            Job("song", keys=10),
+        ], cache_hit_rate=0.5)
+        assert [estimate.calls for estimate in plan.estimates] == [50, 20, 30, 10]
+        assert plan.calls == 110
+        assert plan.api_calls == 55
+
+    def test_dry_run_matches_plan_and_cache_is_checked(self):
+        sc = SoundCharts(app_id="id", api_key="key", dry_run=True)
+        params = {"platform": "instagram", "start_date": "2023-01-01", "end_date": "2023-12-31"}
+        for uuid in ("a", "b"):
+            assert list(sc.windowed("artist_audience", uuid, **params)) == []
+        assert sc.song(uuid="a") is None
+        assert len(sc.dry_run_requests) == 11
+        assert sc.dry_run_requests[0] == "/api/v2/artist/a/audience/instagram?endDate=2023-03-31&startDate=2023-01-01"
+
+        cache = ResponseCache()
+        cache.set(sc.dry_run_requests[0], {"items": []}, ttl=60)
+        plan = plan_requests([Job("artist_audience", keys=["a", "b"], params=params)], cache=cache)
+        assert plan.calls == 10
+        assert plan.cached == 1
+
+    def test_cache_check_uses_method_defaults(self):
+        sc = SoundCharts(app_id="id", api_key="key", dry_run=True)
+        sc.artist_albums(uuid="a")
+        cache = ResponseCache()
+        cache.set(sc.dry_run_requests[0], {"items": []}, ttl=60)
+        plan = plan_requests([Job("artist_albums", keys=["a", "b"])], cache=cache)
+        assert (plan.calls, plan.cached) == (2, 1)
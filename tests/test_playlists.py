@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.data import Playlist, PlaylistPosition
+from soundchartspy.exceptions import SoundChartsError
+from soundchartspy.playlists import PlaylistChange, PlaylistSnapshot, PlaylistTracker
+
+
+def entry(playlist_uuid: str, position: int) -> tuple[Playlist, PlaylistPosition]:
+    playlist = Playlist(
+        uuid=playlist_uuid, name=playlist_uuid, identifier=playlist_uuid, platform="spotify", countryCode="US",
+        latestCrawlDate=None, latestTrackCount=50, latestSubscriberCount=1000, type="editorial",
+    )
+    return playlist, PlaylistPosition(
+        position=position, peakPosition=position, entryDate=None, positionDate=None, peakPositionDate=None
+    )
+
+
+def snapshot(**songs: list) -> PlaylistSnapshot:
+    result = PlaylistSnapshot()
+    for song_uuid, entries in songs.items():
+        result.add(song_uuid, [entry(*e) for e in entries])
+    return result
+
+
+class TestPlaylistSnapshot(unittest.TestCase):
+
+    def test_diff(self):
+        yesterday = snapshot(a=[("p1", 10), ("p2", 5), ("p3", 1)], b=[("p1", 3)], c=[("p4", 7)])
+        today = snapshot(a=[("p1", 4), ("p2", 5), ("p5", 20)], b=[])
+
+        diff = yesterday.diff(today)
+
+        assert diff.added == [PlaylistChange("a", "p5", position=20)]
+        assert sorted(diff.removed, key=lambda c: (c.song_uuid, c.playlist_uuid)) == [
+            PlaylistChange("a", "p3", previous_position=1),
+            PlaylistChange("b", "p1", previous_position=3),
+        ]
+        assert diff.moved == [PlaylistChange("a", "p1", position=4, previous_position=10)]
+        assert diff.moved[0].delta == 6
+        # Song c was not crawled today, its entries are not removals
+        assert not any(change.song_uuid == "c" for change in diff.removed)
+
+    def test_save_and_load(self):
+        original = snapshot(a=[("p1", 10), ("p2", 5)], b=[])
+        original.positions[("a", "p3")] = None
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "playlists.tsv.gz")
+            original.save(path)
+            loaded = PlaylistSnapshot.load(path)
+
+        assert loaded.positions == original.positions
+        assert loaded.songs == {"a", "b"}
+
+    def test_merge_keeps_songs_not_crawled(self):
+        merged = snapshot(a=[("p1", 1)], b=[("p2", 2)]).merge(snapshot(a=[("p3", 3)]))
+        assert merged.positions == {("a", "p3"): 3, ("b", "p2"): 2}
+
+
+class TestPlaylistTracker(unittest.TestCase):
+
+    def fake_request(self, append_to_base_url: str) -> dict:
+        song_uuid = append_to_base_url.split("/song/")[1].split("/")[0]
+        if song_uuid == "broken":
+            raise SoundChartsError(http_status=500, code="500", msg="server error")
+        items = [
+            {
+                "playlist": {
+                    "uuid": playlist_uuid, "name": "", "identifier": "", "platform": "spotify", "countryCode": "US",
+                    "latestCrawlDate": None, "latestTrackCount": 0, "latestSubscriberCount": 0, "type": "editorial",
+                },
+                "position": position,
+                "peakPosition": position,
+                "entryDate": None,
+                "positionDate": None,
+                "peakPositionDate": None,
+            }
+            for playlist_uuid, position in self.entries[song_uuid]
+        ]
+        return {"items": items}
+
+    def test_update(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+            sc, "_make_api_get_request", side_effect=self.fake_request
+        ):
+            tracker = PlaylistTracker(sc, os.path.join(directory, "playlists.tsv.gz"))
+            self.entries = {"a": [("p1", 3)], "broken": []}
+            first = tracker.update(["a"])
+            assert first.added == [PlaylistChange("a", "p1", position=3)]
+
+            self.entries = {"a": [("p1", 1), ("p2", 9)]}
+            second = tracker.update(["a", "broken"])
+            assert second.added == [PlaylistChange("a", "p2", position=9)]
+            assert second.moved == [PlaylistChange("a", "p1", position=1, previous_position=3)]
+            assert list(second.errors) == ["broken"]
@@ -0,0 +1,65 @@
+import json
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.exceptions import SoundChartsError
+from tests.stub_server import StubSoundChartsServer, song_document
+
+
+def _playlist_entries(count: int, offset: int) -> dict:
+    return {
+        "items": [
+            {"playlist": {"uuid": f"playlist-{offset + i}", "name": "Playlist"}, "position": i + 1}
+            for i in range(count)
+        ]
+    }
+
+
+class TestRawMode(unittest.TestCase):
+
+    def test_raw_returns_the_document(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        document = song_document("abc")
+        with mock.patch.object(sc, "_make_api_get_request", return_value=document) as request:
+            assert sc.raw("song", "abc") is document
+            sc.raw("song_playlist_entries", uuid="abc", platform="deezer")
+        assert request.call_args_list[0].kwargs["append_to_base_url"] == "/api/v2.25/song/abc"
+        # The method's defaults are sent as for the method
+        assert "limit=100&offset=0" in request.call_args_list[1].kwargs["append_to_base_url"]
+
+    def test_raw_matches_method_url(self):
+        sc = SoundCharts(app_id="id", api_key="key", dry_run=True)
+        sc.song_albums("abc", type="single", limit=10)
+        sc.raw("song_albums", "abc", type="single", limit=10)
+        sc.raw_bytes("song_albums", "abc", type="single", limit=10)
+        assert len(set(sc.dry_run_requests)) == 1
+
+    def test_raw_rejects_unknown_arguments(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+        with self.assertRaises(TypeError):
+            sc.raw("song", "abc", platform="spotify")
+
+    def test_paginate_raw(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+
+        def fake_request(append_to_base_url: str) -> dict:
+            offset = int(append_to_base_url.split("offset=")[1].split("&")[0])
+            return _playlist_entries(2 if offset else 100, offset)
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            items = list(sc.paginate("song_playlist_entries", "abc", raw=True))
+            pairs = list(sc.crawl("song_playlist_entries", ["abc"], raw=True))
+        assert len(items) == 102
+        assert items[0]["playlist"]["uuid"] == "playlist-0"
+        assert pairs[-1] == ("abc", items[-1])
+
+    def test_raw_bytes(self):
+        with StubSoundChartsServer() as server:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url)
+            body = sc.raw_bytes("song", "abc")
+            with self.assertRaises(SoundChartsError) as error:
+                sc.raw_bytes("artist", "missing")
+        assert isinstance(body, bytes)
+        assert json.loads(body) == song_document("abc")
+        assert error.exception.http_status == 404
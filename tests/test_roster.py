@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.exceptions import SoundChartsError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from soundchartspy.roster import RosterMatrix, fetch_roster_matrix
+
+NAN = float("nan")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestRosterMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = RosterMatrix(
+            ["a", "b", "c"],
+            np.arange(np.datetime64("2023-01-01"), np.datetime64("2023-01-06")),
+            np.array(
+                [
+                    [100, 110, 121, NAN, 150],
+                    [0, 10, 20, 30, 40],
+                    [NAN, NAN, NAN, NAN, NAN],
+                ]
+            ),
+        )
+
+    def test_mask(self):
+        assert self.matrix.mask[0].tolist() == [False, False, False, True, False]
+        assert self.matrix.mask[2].all()
+        assert self.matrix.masked().count() == 9
+
+    def test_delta(self):
+        np.testing.assert_allclose(self.matrix.delta()[0], [NAN, 10, 11, NAN, NAN])
+        np.testing.assert_allclose(self.matrix.delta(2)[1], [NAN, NAN, 20, 20, 20])
+        assert np.isnan(self.matrix.delta(10)).all()
+
+    def test_growth(self):
+        np.testing.assert_allclose(self.matrix.growth()[0], [NAN, 10, 10, NAN, NAN])
+        # Growth from zero is undefined
+        np.testing.assert_allclose(self.matrix.growth()[1], [NAN, NAN, 100, 50, 100 / 3])
+
+    def test_rolling(self):
+        np.testing.assert_allclose(self.matrix.rolling(2)[0], [NAN, 105, 115.5, 121, 150])
+        np.testing.assert_allclose(self.matrix.rolling(3, "sum")[1], [NAN, NAN, 30, 60, 90])
+        np.testing.assert_allclose(self.matrix.rolling(3, "max")[0], [NAN, NAN, 121, 121, 150])
+        np.testing.assert_allclose(self.matrix.rolling(2, "min")[0], [NAN, 100, 110, 121, 150])
+        assert np.isnan(self.matrix.rolling(2)[2]).all()
+        with self.assertRaises(ValueError):
+            self.matrix.rolling(2, "median")
+
+    def test_top_k(self):
+        assert self.matrix.top_k(1) == [("a", 150.0)]
+        assert self.matrix.top_k(5) == [("a", 150.0), ("b", 40.0)]
+        assert self.matrix.top_k(1, largest=False, day="2023-01-02") == [("b", 10.0)]
+        assert self.matrix.top_k(2, by=self.matrix.growth(), day=2) == [("b", 100.0), ("a", 10.0)]
+
+    def test_top_k_day_outside_dates(self):
+        assert self.matrix.top_k(1, day=-5) == [("a", 100.0)], "Negative indexes count back from the last day"
+        for day in ("2022-12-31", "2023-01-06", 5, -6):
+            with self.assertRaises(ValueError):
+                self.matrix.top_k(1, day=day)
+
+    def test_top_k_matches_sort(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(size=(5000, 3))
+        values[rng.random(values.shape) < 0.1] = NAN
+        matrix = RosterMatrix([str(i) for i in range(5000)], np.arange(3), values)
+        column = values[:, -1]
+        expected = [str(i) for i in np.argsort(-np.nan_to_num(column, nan=-np.inf))[:25]]
+        assert [key for key, _ in matrix.top_k(25)] == expected
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestFetchRosterMatrix(unittest.TestCase):
+
+    def test_fetch(self):
+        sc = SoundCharts(app_id="id", api_key="key")
+
+        def fake_request(append_to_base_url: str) -> dict:
+            if "/artist/broken/" in append_to_base_url:
+                raise SoundChartsError(http_status=500, code="500", msg="server error")
+            followers = 1000 if "/artist/a/" in append_to_base_url else 10
+            return {
+                "items": [
+                    {"date": f"2023-01-0{day}T00:00:00+00:00", "likeCount": day, "followerCount": followers * day,
+                     "followingCount": None, "postCount": None, "viewCount": None}
+                    for day in (1, 2, 4)
+                ]
+            }
+
+        with mock.patch.object(sc, "_make_api_get_request", side_effect=fake_request):
+            matrices = fetch_roster_matrix(
+                sc, ["a", "b", "broken"], "instagram", ["followerCount", "likeCount"], "2023-01-01", "2023-01-05"
+            )
+
+        followers = matrices["followerCount"]
+        assert followers.keys == ["a", "b", "broken"]
+        assert followers.shape == (3, 5)
+        np.testing.assert_allclose(followers.row("a"), [1000, 2000, NAN, 4000, NAN])
+        assert followers.mask[2].all()
+        assert list(followers.errors) == ["broken"]
+        np.testing.assert_allclose(matrices["likeCount"].row("b"), [1, 2, NAN, 4, NAN])
@@ -0,0 +1,111 @@
+import threading
+import time
+import unittest
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.scheduler import BULK, INTERACTIVE, RequestScheduler, current_priority, priority
+from tests.stub_server import StubSoundChartsServer, default_handler
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.granted = []
+        self.lock = threading.Lock()
+        self.threads = []
+
+    def tearDown(self):
+        for thread in self.threads:
+            thread.join(timeout=5)
+
+    def enqueue(self, scheduler: RequestScheduler, label: str, name: str, flow: str = "default"):
+        def run():
+            scheduler.acquire(name, flow)
+            with self.lock:
+                self.granted.append(label)
+            scheduler.release(name)
+
+        queued = scheduler.queued()
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.threads.append(thread)
+        while scheduler.queued() == queued:
+            time.sleep(0.001)
+
+    def wait_for(self, count: int):
+        for thread in self.threads:
+            thread.join(timeout=5)
+        assert len(self.granted) == count
+
+    def test_rate_limit(self):
+        scheduler = RequestScheduler(rate=50, burst=1)
+        start = time.perf_counter()
+        for _ in range(11):
+            scheduler.acquire()
+            scheduler.release()
+        assert 0.18 <= time.perf_counter() - start < 0.5
+
+    def test_interactive_jumps_ahead_of_bulk(self):
+        scheduler = RequestScheduler(rate=20, burst=1)
+        scheduler.acquire(BULK)
+        for i in range(3):
+            self.enqueue(scheduler, f"bulk-{i}", BULK)
+        self.enqueue(scheduler, "interactive", INTERACTIVE)
+        scheduler.release(BULK)
+
+        self.wait_for(4)
+        assert self.granted == ["interactive", "bulk-0", "bulk-1", "bulk-2"]
+
+    def test_flows_take_turns(self):
+        scheduler = RequestScheduler(rate=20, burst=1)
+        scheduler.acquire(BULK)
+        for i in range(3):
+            self.enqueue(scheduler, f"backfill-{i}", BULK, flow="backfill")
+        for i in range(2):
+            self.enqueue(scheduler, f"report-{i}", BULK, flow="report")
+        scheduler.release(BULK)
+
+        self.wait_for(5)
+        assert self.granted == ["backfill-0", "report-0", "backfill-1", "report-1", "backfill-2"]
+
+    def test_class_cap(self):
+        scheduler = RequestScheduler(rate=1000, classes={INTERACTIVE: None, BULK: 1})
+        assert scheduler.acquire(BULK)
+        assert not scheduler.acquire(BULK, timeout=0.05)
+        assert scheduler.acquire(INTERACTIVE, timeout=0.05)
+        scheduler.release(BULK)
+        assert scheduler.acquire(BULK, timeout=0.05)
+        assert scheduler.queued() == 0
+
+    def test_priority_context(self):
+        assert current_priority() == (INTERACTIVE, "default")
+        with priority(BULK, flow="backfill"):
+            assert current_priority() == (BULK, "backfill")
+        assert current_priority() == (INTERACTIVE, "default")
+
+    def test_client_paginates_with_bulk_priority(self):
+        classes = []
+
+        class RecordingScheduler(RequestScheduler):
+            def acquire(self, name=INTERACTIVE, flow="default", timeout=None):
+                classes.append((name, flow))
+                return super().acquire(name, flow, timeout)
+
+        def handler(path: str):
+            if "available-dates" in path:
+                return 200, {"items": [{"date": "2024-01-01"}]}
+            return default_handler(path)
+
+        with StubSoundChartsServer(handler) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, scheduler=RecordingScheduler(rate=100)
+        ) as sc:
+            sc.song(uuid="song")
+            list(sc.paginate("artist_audience_report_dates", "artist", limit=2))
+            with priority(INTERACTIVE, flow="dashboard"):
+                list(sc.paginate("artist_audience_report_dates", "artist", limit=2))
+
+        assert classes == [
+            (INTERACTIVE, "default"),
+            (BULK, "artist_audience_report_dates"),
+            (INTERACTIVE, "dashboard"),
+        ]
@@ -0,0 +1,107 @@
+import unittest
+
+from soundchartspy.data import AudienceData
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    from soundchartspy.series import resample_daily
+
+
+def audience(date: str, followers=None, likes=None) -> AudienceData:
+    return AudienceData(
+        date=f"{date}T00:00:00+00:00",
+        followerCount=followers,
+        likeCount=likes,
+        followingCount=None,
+        postCount=None,
+        viewCount=None,
+    )
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestResampleDaily(unittest.TestCase):
+
+    def setUp(self):
+        self.series = {
+            "artist-1": [
+                audience("2023-01-01", followers=100, likes=10),
+                audience("2023-01-05", followers=140, likes=None),
+                audience("2023-01-03", followers=None, likes=30),
+            ],
+            "artist-2": [
+                audience("2023-01-02", followers=7, likes=1),
+                audience("2023-01-04", followers=9, likes=3),
+            ],
+        }
+
+    def test_grid_covers_every_day(self):
+        grid = resample_daily(self.series, ["followerCount"])
+        assert len(grid.dates) == 5
+        assert str(grid.dates[0]) == "2023-01-01"
+        assert grid["followerCount"].shape == (2, 5)
+
+    def test_interpolate(self):
+        grid = resample_daily(self.series, ["followerCount"])
+        np.testing.assert_allclose(grid.series("artist-1", "followerCount"), [100, 110, 120, 130, 140])
+        # No extrapolation outside the first and last data points
+        np.testing.assert_allclose(grid.series("artist-2", "followerCount"), [np.nan, 7, 8, 9, np.nan])
+
+    def test_forward_fill(self):
+        grid = resample_daily(self.series, ["followerCount"], fill="ffill")
+        np.testing.assert_allclose(grid.series("artist-1", "followerCount"), [100, 100, 100, 100, 140])
+        np.testing.assert_allclose(grid.series("artist-2", "followerCount"), [np.nan, 7, 7, 9, 9])
+
+    def test_fill_per_metric(self):
+        grid = resample_daily(self.series, ["followerCount", "likeCount"], fill={"likeCount": "mask"})
+        np.testing.assert_allclose(grid.series("artist-1", "likeCount"), [10, np.nan, 30, np.nan, np.nan])
+        np.testing.assert_allclose(grid.series("artist-1", "followerCount"), [100, 110, 120, 130, 140])
+        assert grid.observed["likeCount"][grid.row("artist-1")].tolist() == [True, False, True, False, False]
+
+    def test_dictionary_points_and_date_range(self):
+        popularity = {"artist-1": [{"date": "2023-01-02T00:00:00+00:00", "value": 50}]}
+        grid = resample_daily(popularity, ["value"], fill="ffill", start_date="2023-01-01", end_date="2023-01-04")
+        np.testing.assert_allclose(grid.series("artist-1", "value"), [np.nan, 50, 50, 50])
+
+    def test_points_outside_the_date_range_fill_it(self):
+        grid = resample_daily(self.series, ["followerCount"], start_date="2023-01-02", end_date="2023-01-04")
+        np.testing.assert_allclose(grid.series("artist-1", "followerCount"), [110, 120, 130])
+        grid = resample_daily(
+            self.series, ["followerCount"], fill="ffill", start_date="2023-01-02", end_date="2023-01-03"
+        )
+        np.testing.assert_allclose(grid.series("artist-1", "followerCount"), [100, 100])
+        assert not grid.observed["followerCount"][grid.row("artist-1")].any(), "Filled days are not observed"
+
+    def test_empty_series(self):
+        grid = resample_daily({"artist-1": []}, ["followerCount"])
+        assert grid["followerCount"].shape == (1, 0)
+
+    def test_unknown_fill(self):
+        with self.assertRaises(ValueError):
+            resample_daily(self.series, ["followerCount"], fill="spline")
+
+    def test_batch_matches_single_series(self):
+        rng = np.random.default_rng(0)
+        series = {}
+        for artist in range(300):
+            days = np.sort(rng.choice(60, size=20, replace=False))
+            series[f"artist-{artist}"] = [
+                {"date": str(np.datetime64("2023-01-01") + int(day)), "followerCount": int(day) * artist}
+                for day in days
+            ]
+        batch = resample_daily(series, ["followerCount"], start_date="2023-01-01", end_date="2023-03-01")
+        for key in ("artist-0", "artist-17", "artist-299"):
+            single = resample_daily(
+                {key: series[key]}, ["followerCount"], start_date="2023-01-01", end_date="2023-03-01"
+            )
+            np.testing.assert_allclose(batch.series(key, "followerCount"), single.series(key, "followerCount"))
+            observed = [
+                int((np.datetime64(point["date"][:10]) - np.datetime64("2023-01-01")).astype(int))
+                for point in series[key]
+            ]
+            expected = np.interp(np.arange(60), observed, [point["followerCount"] for point in series[key]])
+            inside = (np.arange(60) >= observed[0]) & (np.arange(60) <= observed[-1])
+            np.testing.assert_allclose(batch.series(key, "followerCount")[inside], expected[inside])
@@ -0,0 +1,51 @@
+import datetime
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from soundchartspy.data import Genre, Playlist, PlaylistPosition
+from soundchartspy.sinks import NDJSONSink
+
+
+class TestNDJSONSink(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_models_and_pairs_are_serialized(self):
+        path = os.path.join(self.directory.name, "entries.ndjson")
+        playlist = Playlist("p", "Playlist", "id", "spotify", "FR", datetime.datetime(2024, 1, 1), 50, 1000, "editorial")
+        position = PlaylistPosition(3, 1, None, None, None)
+        with NDJSONSink(path) as sink:
+            sink.write_all([Genre("pop", ["dance pop"]), (playlist, position)])
+
+        with open(path) as ndjson_file:
+            lines = [json.loads(line) for line in ndjson_file]
+        assert lines[0] == {"root": "pop", "sub": ["dance pop"]}
+        assert lines[1][0]["latestCrawlDate"] == "2024-01-01T00:00:00"
+        assert lines[1][1]["position"] == 3
+
+    def test_gzip_rotation_with_backpressure(self):
+        path = os.path.join(self.directory.name, "genres.ndjson")
+        with NDJSONSink(path, compress=True, max_bytes=1000, max_pending=4) as sink:
+            sink.write_all(Genre(f"genre-{i}", []) for i in range(200))
+
+        assert sink.items_written == 200
+        assert len(sink.files) > 1
+        assert sink.files[0].endswith("genres-00000.ndjson.gz")
+        roots = []
+        for file_path in sink.files:
+            with gzip.open(file_path, "rt") as ndjson_file:
+                roots += [json.loads(line)["root"] for line in ndjson_file]
+        assert roots == [f"genre-{i}" for i in range(200)]
+
+    def test_writer_errors_are_raised(self):
+        sink = NDJSONSink(os.path.join(self.directory.name, "bad.ndjson"))
+        sink.write(object())
+        with self.assertRaises(RuntimeError):
+            sink.close()
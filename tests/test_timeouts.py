@@ -0,0 +1,121 @@
+import time
+import unittest
+
+import requests
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.fanout import fan_out
+from soundchartspy.scheduler import RequestScheduler
+from soundchartspy.timeouts import Deadline, DeadlineExceeded, request_timeout, within
+from tests.stub_server import StubSoundChartsServer, default_handler
+
+
+def endless_dates(path: str) -> tuple[int, dict]:
+    if "available-dates" in path:
+        return 200, {"items": [{"date": "2024-01-01"}] * 2}
+    return default_handler(path)
+
+
+class TestTimeouts(unittest.TestCase):
+
+    def test_read_timeout(self):
+        with StubSoundChartsServer(delay=1.0) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, timeout=(1, 0.1)
+        ) as sc:
+            with self.assertRaises(requests.Timeout):
+                sc.song(uuid="slow")
+
+    def test_request_timeout_overrides_client_timeout(self):
+        with StubSoundChartsServer(delay=0.3) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, timeout=(1, 0.1)
+        ) as sc:
+            with request_timeout((1, 2)):
+                assert sc.song(uuid="slow").uuid == "slow"
+            with self.assertRaises(requests.Timeout):
+                sc.song(uuid="slow")
+
+
+class TestDeadlines(unittest.TestCase):
+
+    def test_paginate_returns_partial_results(self):
+        with StubSoundChartsServer(endless_dates, delay=0.1) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url
+        ) as sc:
+            deadline = Deadline(0.45)
+            start = time.perf_counter()
+            items = list(sc.paginate("artist_audience_report_dates", "artist", limit=2, deadline=deadline))
+
+            assert time.perf_counter() - start < 1
+            assert deadline.exceeded
+            assert 2 <= len(items) <= 10 and len(items) % 2 == 0
+
+    def test_crawl_stops_at_deadline(self):
+        with StubSoundChartsServer(delay=0.1) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url
+        ) as sc:
+            deadline = Deadline(0.35)
+            results = list(sc.crawl("song", [f"song-{i}" for i in range(100)], deadline=deadline))
+
+            assert deadline.exceeded
+            assert 1 <= len(results) < 10
+            assert [uuid for uuid, _ in results] == [song.uuid for _, song in results]
+
+    def test_in_flight_request_is_cut_at_deadline(self):
+        with StubSoundChartsServer(delay=2.0) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url
+        ) as sc:
+            deadline = Deadline(0.2)
+            start = time.perf_counter()
+            assert list(sc.crawl("song", ["slow"], deadline=deadline)) == []
+            assert time.perf_counter() - start < 1
+            assert deadline.exceeded
+
+    def test_fan_out_cancels_outstanding_calls(self):
+        def call(key: int) -> int:
+            time.sleep(key)
+            return key
+
+        deadline = Deadline(0.3)
+        start = time.perf_counter()
+        results, errors = fan_out(call, [0, 0.1, 1, 1.5], max_workers=2, deadline=deadline)
+
+        assert time.perf_counter() - start < 1
+        assert results == {0: 0, 0.1: 0.1}
+        assert set(errors) == {1, 1.5}
+        assert all(isinstance(e, DeadlineExceeded) for e in errors.values())
+        assert deadline.exceeded
+
+    def test_no_deadline_marker_when_finished_in_time(self):
+        deadline = Deadline(5)
+        results, errors = fan_out(lambda key: key * 2, [1, 2, 3], deadline=deadline)
+
+        assert results == {1: 2, 2: 4, 3: 6}
+        assert errors == {}
+        assert not deadline.exceeded
+
+    def test_cap(self):
+        deadline = Deadline(10)
+        assert deadline.cap((5, 30))[1] <= 10
+        assert deadline.cap(None) <= 10
+
+        expired = Deadline(0)
+        with self.assertRaises(DeadlineExceeded):
+            expired.cap((5, 30))
+        assert expired.exceeded, "capping to no time left should mark the deadline as exceeded"
+
+    def test_queueing_counts_against_the_deadline(self):
+        delay = lambda path: 0.5 if "slow" in path else 0  # noqa: E731
+        with StubSoundChartsServer(delay=delay) as server, SoundCharts(
+            app_id="id", api_key="key", base_url=server.base_url, timeout=5,
+            scheduler=RequestScheduler(rate=2.5, burst=1),
+        ) as sc:
+            sc.song("fast")
+            deadline = Deadline(0.6)
+            start = time.perf_counter()
+            with self.assertRaises(DeadlineExceeded):
+                # Waits about 0.4s for the rate limit, leaving too little time for the slow response
+                within(deadline, sc.song, "slow")
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.8, f"the request outlived its deadline by its queueing time ({elapsed:.2f}s)"
+        assert deadline.exceeded
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from soundchartspy.client import SoundCharts
+from soundchartspy.exceptions import SoundChartsError
+from soundchartspy.fanout import fan_out
+from soundchartspy.tracing import ERROR, Tracer, current_span, profile
+from tests.stub_server import StubSoundChartsServer
+
+
+class ListExporter:
+
+    def __init__(self):
+        self.exported = []
+
+    def export(self, spans):
+        self.exported.extend(spans)
+
+
+class TestTracer(unittest.TestCase):
+
+    def test_nested_spans(self):
+        exporter = ListExporter()
+        tracer = Tracer(exporter=exporter)
+        with tracer.start_as_current_span("outer", attributes={"key": "value"}) as outer:
+            assert current_span() is outer
+            with tracer.start_as_current_span("inner") as inner:
+                pass
+        assert current_span() is None
+        assert [span.name for span in exporter.exported] == ["inner", "outer"]
+        assert inner.parent_id == outer.span_id
+        assert inner.trace_id == outer.trace_id
+        assert outer.parent_id is None
+        assert outer.attributes == {"key": "value"}
+        assert outer.duration >= inner.duration
+
+    def test_exception_is_recorded(self):
+        tracer = Tracer(record=True)
+        with self.assertRaises(ValueError):
+            with tracer.start_as_current_span("failing"):
+                raise ValueError("boom")
+        assert tracer.spans[0].status == ERROR
+        assert tracer.spans[0].attributes["exception.type"] == "ValueError"
+
+
+class TestClientTracing(unittest.TestCase):
+
+    def test_song_stages(self):
+        tracer = Tracer(record=True)
+        with StubSoundChartsServer() as server:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url, tracer=tracer)
+            song = sc.song("abc")
+        assert song.uuid == "abc"
+
+        spans = {span.name: span for span in tracer.spans}
+        assert set(spans) == {"song", "http.request", "http.send", "http.download", "decode", "convert"}
+        assert spans["http.request"].parent_id == spans["song"].span_id
+        assert spans["convert"].parent_id == spans["song"].span_id
+        for stage in ("http.send", "http.download", "decode"):
+            assert spans[stage].parent_id == spans["http.request"].span_id
+        assert spans["http.send"].attributes["http.status_code"] == 200
+        assert spans["http.request"].attributes["http.url"].endswith("/song/abc")
+        assert spans["http.download"].attributes["http.response_content_length"] > 0
+
+    def test_errors_and_fan_out_spans(self):
+        tracer = Tracer(record=True)
+        with StubSoundChartsServer() as server:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url, tracer=tracer)
+            with tracer.start_as_current_span("job") as job:
+                songs, errors = fan_out(sc.song, ["a", "b"])
+                with self.assertRaises(SoundChartsError):
+                    sc.artist("missing")
+        assert sorted(songs) == ["a", "b"]
+        assert not errors
+        failed = [span for span in tracer.spans if span.name == "artist"]
+        assert failed[0].status == ERROR
+        assert {span.trace_id for span in tracer.spans} == {job.trace_id}
+
+    def test_untraced_client_is_unchanged(self):
+        with StubSoundChartsServer() as server:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url)
+            assert sc.song("abc").uuid == "abc"
+            assert current_span() is None
+
+    def test_profile(self):
+        with StubSoundChartsServer() as server, tempfile.TemporaryDirectory() as directory:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url)
+            path = os.path.join(directory, "profile.folded")
+            with profile(sc, path) as recorded:
+                sc.song("a")
+                sc.song("b")
+            assert sc.tracer is None
+            with open(path) as folded_file:
+                lines = folded_file.read().splitlines()
+
+        summary = recorded.summary()
+        assert summary["song"]["count"] == 2
+        assert summary["song"]["self"] <= summary["song"]["total"]
+        assert "song;http.request;http.send" in recorded.folded()
+        stack, microseconds = lines[0].rsplit(" ", 1)
+        assert stack.startswith("song")
+        assert int(microseconds) >= 0
+
+    def test_profile_ending_during_a_request(self):
+        with StubSoundChartsServer(delay=0.3) as server:
+            sc = SoundCharts(app_id="id", api_key="key", base_url=server.base_url)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                with profile(sc):
+                    future = executor.submit(sc.song, "abc")
+                    time.sleep(0.1)
+                song = future.result()
+        assert song.uuid == "abc", "A call running when the profile ends should still succeed"
+        assert sc.tracer is None